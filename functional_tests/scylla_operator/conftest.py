@@ -105,8 +105,7 @@ def fixture_db_cluster(tester: ScyllaOperatorFunctionalClusterTester):
     if not tester.healthy_flag:
         pytest.skip('cluster is not healthy, skipping rest of the tests')
 
-    with tester.db_cluster.scylla_config_map() as scylla_config_map:
-        original_scylla_config_map = scylla_config_map
+    original_scylla_config_map = tester.db_cluster.get_scylla_config_map()
     original_scylla_cluster_spec = tester.db_cluster.get_scylla_cluster_plain_value('/spec')
 
     if dataset_name := tester.db_cluster.params.get("k8s_functional_test_dataset"):
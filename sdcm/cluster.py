@@ -3594,7 +3594,7 @@ class BaseCluster:
                 termination_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f"),
                 terminated_by_nemesis=node.running_nemesis,
             ))
-        if node in self.nodes:
+        with contextlib.suppress(ValueError):
             self.nodes.remove(node)
         try:
             ScyllaLogCollector.cluster_log_type = node.name
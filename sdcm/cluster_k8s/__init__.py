@@ -19,7 +19,9 @@ import re
 import abc
 import json
 import math
+import hashlib
 import shutil
+import tarfile
 import tempfile
 import time
 import base64
@@ -29,19 +31,19 @@ import traceback
 import contextlib
 from pathlib import Path
 from copy import deepcopy
+from collections import Counter
 from datetime import datetime
 from difflib import unified_diff
 from functools import cached_property, partialmethod, partial
-from tempfile import NamedTemporaryFile, TemporaryDirectory
+from tempfile import NamedTemporaryFile
 from textwrap import dedent
-from threading import Lock, RLock
-from typing import Optional, Union, List, Dict, Any, ContextManager, Type, Tuple, Callable
+from threading import Lock
+from typing import TYPE_CHECKING, Optional, Union, List, Dict, Any, ContextManager, Type, Tuple, Callable
 
 import yaml
 import kubernetes as k8s
 from kubernetes.client import exceptions as k8s_exceptions
 from kubernetes.client import V1ConfigMap
-from kubernetes.dynamic.resource import Resource, ResourceField, ResourceInstance, ResourceList, Subresource
 import invoke
 from invoke.exceptions import CommandTimedOut
 
@@ -65,7 +67,14 @@ from sdcm.sct_events.system import TestFrameworkEvent
 import sdcm.utils.sstable.load_inventory as datasets
 from sdcm.utils.adaptive_timeouts import adaptive_timeout, Operations
 from sdcm.utils.ci_tools import get_test_name
-from sdcm.utils.common import download_from_github, shorten_cluster_name, walk_thru_data
+from sdcm.utils.common import (
+    download_from_github,
+    get_cached_download_dir,
+    shorten_cluster_name,
+    walk_thru_data,
+    KeyBasedLock,
+    ReadWriteLock,
+)
 from sdcm.utils.k8s import (
     add_pool_node_affinity,
     convert_cpu_units_to_k8s_value,
@@ -75,17 +84,30 @@ from sdcm.utils.k8s import (
     get_helm_pool_affinity_values,
     get_pool_affinity_modifiers,
     get_preferred_pod_anti_affinity_values,
+    is_k8s_object_condition_true,
+    K8S_WATCH_CACHE_LIST_KWARGS,
+    KUBECTL_WAIT_API_RESOURCES,
+    load_yaml_file,
+    load_yaml_file_docs,
+    parse_kubectl_wait_args,
     ApiCallRateLimiter,
+    K8sNodesReflectorThread,
+    K8sObjectsReflectorThread,
     JSON_PATCH_TYPE,
+    MERGE_PATCH_TYPE,
     KubernetesOps,
     KUBECTL_TIMEOUT,
     HelmValues,
     ScyllaPodsIPChangeTrackerThread,
     TokenUpdateThread,
+    YAML_SAFE_DUMPER,
+    YAML_SAFE_LOADER,
 )
 from sdcm.utils.decorators import log_run_info, retrying
 from sdcm.utils.decorators import timeout as timeout_wrapper
 from sdcm.utils.k8s.chaos_mesh import ChaosMesh
+from sdcm.utils.parallel_object import ParallelObject
+from sdcm.utils.net import to_inet_ntop_format
 from sdcm.utils.remote_logger import get_system_logging_thread, CertManagerLogger, ScyllaOperatorLogger, \
     KubectlClusterEventsLogger, ScyllaManagerLogger, KubernetesWrongSchedulingLogger, HaproxyIngressLogger
 from sdcm.utils.sstable.load_utils import SstableLoadUtils
@@ -94,10 +116,21 @@ from sdcm.wait import wait_for
 from sdcm.cluster_k8s.operator_monitoring import ScyllaOperatorLogMonitoring
 
 
-ANY_KUBERNETES_RESOURCE = Union[
-    Resource, ResourceField, ResourceInstance, ResourceList, Subresource,
-]
-NAMESPACE_CREATION_LOCK = Lock()
+if TYPE_CHECKING:
+    from kubernetes.dynamic.resource import Resource, ResourceField, ResourceInstance, ResourceList, Subresource
+
+    ANY_KUBERNETES_RESOURCE = Union[
+        Resource, ResourceField, ResourceInstance, ResourceList, Subresource,
+    ]
+
+NAMESPACE_CREATION_LOCK = KeyBasedLock()
+API_CLIENT_TTL = 300  # seconds
+# NOTE: 'kubectl create secret' subcommands and types of the secrets they create
+KUBECTL_SECRET_TYPES = {
+    "generic": "Opaque",
+    "tls": "kubernetes.io/tls",
+    "docker-registry": "kubernetes.io/dockerconfigjson",
+}
 NODE_INIT_LOCK = Lock()
 
 CERT_MANAGER_TEST_CONFIG = sct_abs_path("sdcm/k8s_configs/cert-manager-test.yaml")
@@ -108,6 +141,7 @@ LOCAL_MINIO_DIR = sct_abs_path("sdcm/k8s_configs/minio")
 INGRESS_CONTROLLER_CONFIG_PATH = sct_abs_path("sdcm/k8s_configs/ingress-controller")
 PROMETHEUS_OPERATOR_CONFIG_PATH = sct_abs_path("sdcm/k8s_configs/monitoring/prometheus-operator")
 SCYLLA_MONITORING_CONFIG_PATH = sct_abs_path("sdcm/k8s_configs/monitoring/scylladbmonitoring-template.yaml")
+HELM_CHART_APP_VERSION_RE = re.compile(r'^appVersion:\s*["\']?([^"\'\r\n]+)', re.MULTILINE)
 
 SCYLLA_API_VERSION = "scylla.scylladb.com/v1"
 SCYLLA_CLUSTER_RESOURCE_KIND = "ScyllaCluster"
@@ -154,6 +188,43 @@ SCYLLA_MANAGER_AGENT_RESOURCES = {
     'memory': 0.489,  # 0.489 will give 500Mb as a result
 }
 
+# NOTE: constant part of the scylla helm chart values, must be deep-copied before being changed
+_SCYLLA_AGENT_RESOURCES_LIMITS = {
+    'cpu': convert_cpu_units_to_k8s_value(SCYLLA_MANAGER_AGENT_RESOURCES['cpu']),
+    'memory': convert_memory_units_to_k8s_value(SCYLLA_MANAGER_AGENT_RESOURCES['memory']),
+}
+SCYLLA_CLUSTER_HELM_VALUES_TEMPLATE = {
+    'nameOverride': '',
+    'agentImage': {
+        'repository': 'scylladb/scylla-manager-agent',
+    },
+    'serviceAccount': {
+        'create': True,
+        'annotations': SCYLLA_CLUSTER_SA_ANNOTATIONS,
+    },
+    'alternator': {
+        'insecureEnableHTTP': True,
+    },
+    'developerMode': False,
+    'cpuset': True,
+    'hostNetworking': False,
+    'automaticOrphanedNodeCleanup': True,
+    'serviceMonitor': {
+        'create': False
+    },
+    'racks': [
+        {
+            'scyllaConfig': SCYLLA_CONFIG_NAME,
+            'scyllaAgentConfig': SCYLLA_AGENT_CONFIG_NAME,
+            'members': 0,
+            'agentResources': {
+                'limits': _SCYLLA_AGENT_RESOURCES_LIMITS,
+                'requests': dict(_SCYLLA_AGENT_RESOURCES_LIMITS),
+            },
+        }
+    ],
+}
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -219,13 +290,19 @@ class CloudK8sNodePool(metaclass=abc.ABCMeta):
     def pool_label_name(self) -> str:
         return self.k8s_cluster.POOL_LABEL_NAME
 
-    @cached_property
+    @property
     def cpu_and_memory_capacity(self) -> Tuple[float, float]:
-        for item in self.k8s_cluster.k8s_core_v1_api.list_node().items:
-            if item.metadata.labels.get(self.pool_label_name, '') == self.name:
-                capacity = item.status.allocatable
-                return convert_cpu_value_from_k8s_to_units(capacity['cpu']), convert_memory_value_from_k8s_to_units(
-                    capacity['memory'])
+        reflector = self.k8s_cluster.nodes_reflector_thread
+        generation = reflector.generation if reflector else None
+        if (cached := getattr(self, "_cpu_and_memory_capacity", None)) and cached[0] == generation:
+            return cached[1]
+        # NOTE: use the raising variant, an API failure must not look like an empty pool
+        for item in self._list_nodes().items:
+            capacity = item.status.allocatable
+            self._cpu_and_memory_capacity = (generation, (
+                convert_cpu_value_from_k8s_to_units(capacity['cpu']),
+                convert_memory_value_from_k8s_to_units(capacity['memory'])))
+            return self._cpu_and_memory_capacity[1]
         raise RuntimeError(f"{self.k8s_cluster.region_name}: Can't find any node for pool '{self.name}'")
 
     @property
@@ -240,33 +317,32 @@ class CloudK8sNodePool(metaclass=abc.ABCMeta):
     def readiness_timeout(self) -> int:
         return 10 + (10 * self.num_nodes)
 
+    def _list_nodes(self) -> k8s.client.V1NodeList:
+        if (reflector := self.k8s_cluster.nodes_reflector_thread) and reflector.is_synced:
+            return k8s.client.V1NodeList(items=reflector.get_nodes({self.pool_label_name: self.name}))
+        return self.k8s_cluster.k8s_core_v1_api.list_node(
+            label_selector=f'{self.pool_label_name}={self.name}', **K8S_WATCH_CACHE_LIST_KWARGS)
+
     @property
     def nodes(self):
         try:
-            return self.k8s_cluster.k8s_core_v1_api.list_node(label_selector=f'{self.pool_label_name}={self.name}')
+            return self._list_nodes()
         except Exception as details:  # noqa: BLE001
             self.k8s_cluster.log.debug("Failed to get nodes list: %s", str(details))
             return {}
 
     def wait_for_nodes_readiness(self):
-        readiness_timeout = self.readiness_timeout
-
-        @timeout_wrapper(
-            message=(
-                f"{self.k8s_cluster.region_name}: Wait for {self.num_nodes} node(s)"
-                f" in the '{self.name}' pool to be ready..."),
-            sleep_time=30,
-            timeout=readiness_timeout * 60)
-        def wait_nodes_are_ready():
-            # To make it more informative in worst case scenario made it repeat 5 times, by readiness_timeout // 5
-            result = self.k8s_cluster.kubectl_no_wait(
-                f"wait --timeout={self.readiness_timeout // 5}m -l {self.pool_label_name}={self.name} "
-                f"--for=condition=Ready node",
-                timeout=readiness_timeout // 5 * 60 + 10, verbose=False)
-            if result.stdout.count('condition met') != self.num_nodes:
-                raise RuntimeError('Not all nodes reported')
-
-        wait_nodes_are_ready()
+        self.k8s_cluster.log.info(
+            "Wait for %s node(s) in the '%s' pool to be ready...", self.num_nodes, self.name)
+        # NOTE: node pools readiness may be awaited having the API call rate limiter paused,
+        #       so use the API client which is not bound to it, like 'kubectl_no_wait' does.
+        core_v1_api = KubernetesOps.core_v1_api(self.k8s_cluster.no_wait_api_client)
+        KubernetesOps.watch_till_objects_ready(
+            core_v1_api.list_node,
+            is_ready=lambda node: is_k8s_object_condition_true(node, "Ready"),
+            timeout=self.readiness_timeout * 60,
+            total=self.num_nodes,
+            label_selector=f"{self.pool_label_name}={self.name}")
 
 
 class KubernetesCluster(metaclass=abc.ABCMeta):
@@ -279,6 +355,12 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
     NODE_PREPARE_FILE = None
     NODE_CONFIG_CRD_FILE = None
     TOKEN_UPDATE_NEEDED = True
+    PERF_PODS_LABELS = (
+        ('app.kubernetes.io/name', 'scylla-node-config'),
+        ('app.kubernetes.io/name', 'node-config'),
+        ('scylla-operator.scylladb.com/node-config-job-type', 'Node'),
+        ('scylla-operator.scylladb.com/node-config-job-type', 'Containers'),
+    )
 
     api_call_rate_limiter: Optional[ApiCallRateLimiter] = None
 
@@ -291,6 +373,7 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
     _scylla_operator_log_monitor_thread: Optional[ScyllaOperatorLogMonitoring] = None
     _token_update_thread: Optional[TokenUpdateThread] = None
     scylla_pods_ip_change_tracker_thread: Optional[ScyllaPodsIPChangeTrackerThread] = None
+    nodes_reflector_thread: Optional[K8sNodesReflectorThread] = None
 
     pools: Dict[str, CloudK8sNodePool]
     scylla_pods_ip_mapping = {}
@@ -306,23 +389,26 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         self.rack_name = "rack-1"
         self.shortid = str(self.uuid)[:8]
         self.name = f"{user_prefix}-{self.shortid}"
+        self.short_cluster_name = shorten_cluster_name(self.name, 40).replace('_', '-')
         self.params = params
         self.api_call_rate_limiter = None
         self.k8s_scylla_cluster_name = self.params.get('k8s_scylla_cluster_name')
-        self.scylla_config_lock = RLock()
+        self.scylla_config_lock = ReadWriteLock()
         self.scylla_restart_required = False
         self.scylla_cpu_limit = None
         self.scylla_memory_limit = None
         self.calculated_loader_cpu_limit = None
         self.calculated_loader_memory_limit = None
         self.calculated_loader_affinity_modifiers = []
-        self.perf_pods_labels = [
-            ('app.kubernetes.io/name', 'scylla-node-config'),
-            ('app.kubernetes.io/name', 'node-config'),
-            ('scylla-operator.scylladb.com/node-config-job-type', 'Node'),
-            ('scylla-operator.scylladb.com/node-config-job-type', 'Containers'),
-        ]
         self._scylla_cluster_events_threads = {}
+        self._operator_images = {}
+        self._api_client_lock = Lock()
+        self._api_client_cache = (None, None, 0)
+        self._no_wait_api_client_cache = (None, 0)
+        self._dynamic_client_cache = (None, None)
+        self._token_validity_cache = (None, False)
+        self._objects_reflector_threads_lock = Lock()
+        self._objects_reflector_threads = {}
         self.chaos_mesh = ChaosMesh(self)
 
     # NOTE: Following class attr(s) are defined for consumers of this class
@@ -352,10 +438,6 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
     def k8s_server_url(self) -> Optional[str]:
         return None
 
-    @cached_property
-    def short_cluster_name(self):
-        return shorten_cluster_name(self.name, 40).replace('_', '-')
-
     kubectl_cmd = partialmethod(KubernetesOps.kubectl_cmd)
     apply_file = partialmethod(KubernetesOps.apply_file)
 
@@ -365,11 +447,11 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
                                      ignore_status=ignore_status, verbose=verbose)
 
     def kubectl(self, *command, namespace=None, timeout=KUBECTL_TIMEOUT, remoter=None, ignore_status=False,
-                verbose=True):
+                verbose=True, stdout_file=None):
         if self.api_call_rate_limiter:
-            self.api_call_rate_limiter.wait()
+            self.api_call_rate_limiter.wait(verb="kubectl")
         return KubernetesOps.kubectl(self, *command, namespace=namespace, timeout=timeout, remoter=remoter,
-                                     ignore_status=ignore_status, verbose=verbose)
+                                     ignore_status=ignore_status, verbose=verbose, stdout_file=stdout_file)
 
     def kubectl_wait(self, *command, namespace=None, timeout=KUBECTL_TIMEOUT, remoter=None, verbose=True):
         """
@@ -382,18 +464,52 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         This function is to address these problem by wrapping 'kubectl wait' and make it restarted when no resource
         are there to tackle problem #1 and track number of resources it reported and wait+rerun if resource number
         had changed to tackle problem #2
+
+        Conditions of pods and of the well-known resources get awaited using the watch API
+        instead of repeating 'kubectl wait' calls and counting 'condition met' lines in its output.
+        Commands which can't be mapped to the API go to 'kubectl wait'.
         """
-        last_resource_count = -1
+        wait_args = parse_kubectl_wait_args(*command)
+        if remoter is None and wait_args:
+            kind = wait_args["kind"].lower()
+            list_kwargs = {"label_selector": wait_args["label_selector"]} if wait_args["label_selector"] else {}
+            if wait_args["name"]:
+                list_kwargs["field_selector"] = f"metadata.name={wait_args['name']}"
+            if kind in ("po", "pod", "pods"):
+                list_func = self.k8s_core_v1_api.list_namespaced_pod
+                list_kwargs["namespace"] = namespace or "default"
+            elif api_resource := KUBECTL_WAIT_API_RESOURCES.get(kind):
+                resource = KubernetesOps.dynamic_api(self.dynamic_client, *api_resource)
+                list_func = resource.get
+                list_kwargs["serialize"] = False
+                if resource.namespaced:
+                    list_kwargs["namespace"] = namespace or "default"
+            else:
+                list_func = None
+            if list_func is not None:
+                if self.api_call_rate_limiter:
+                    self.api_call_rate_limiter.wait(verb="kubectl_wait")
+                return KubernetesOps.watch_till_objects_ready(
+                    list_func,
+                    is_ready=lambda obj: is_k8s_object_condition_true(
+                        obj, wait_args["condition_type"], wait_args["condition_status"]),
+                    timeout=timeout,
+                    total=1 if wait_args["name"] else None,
+                    **list_kwargs)
+
+        last_resource_count, backoff = -1, 1.0
 
         @timeout_wrapper(timeout=timeout, sleep_time=5)
         def wait_body():
-            nonlocal last_resource_count
+            nonlocal last_resource_count, backoff
             result = self.kubectl('wait --timeout=1m', *command, namespace=namespace, timeout=timeout, remoter=remoter,
                                   verbose=verbose)
             current_resource_count = result.stdout.count('condition met')
             if current_resource_count != last_resource_count:
                 last_resource_count = current_resource_count
-                time.sleep(10)
+                # NOTE: don't waste time when resources converge quickly, but back off when they keep changing
+                time.sleep(backoff)
+                backoff = min(backoff * 1.5, 10.0)
                 raise RuntimeError("Retry since matched resource count has changed")
             return result
         return wait_body()
@@ -401,27 +517,28 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
     def kubectl_multi_cmd(self, *command, namespace=None, timeout=KUBECTL_TIMEOUT, remoter=None, ignore_status=False,
                           verbose=True):
         if self.api_call_rate_limiter:
-            self.api_call_rate_limiter.wait()
+            self.api_call_rate_limiter.wait(verb="kubectl_multi_cmd")
         return KubernetesOps.kubectl_multi_cmd(self, *command, namespace=namespace, timeout=timeout, remoter=remoter,
                                                ignore_status=ignore_status, verbose=verbose)
 
-    @property
-    def helm(self):
+    @cached_property
+    def _localhost(self):
+        return self.test_config.tester_obj().localhost
+
+    def helm(self, *command, **kwargs) -> str:
         if self.api_call_rate_limiter:
-            self.api_call_rate_limiter.wait()
-        return partial(self.test_config.tester_obj().localhost.helm, self)
+            self.api_call_rate_limiter.wait(verb="helm")
+        return self._localhost.helm(self, *command, **kwargs)
 
-    @property
-    def helm_install(self):
+    def helm_install(self, *args, **kwargs) -> str:
         if self.api_call_rate_limiter:
-            self.api_call_rate_limiter.wait()
-        return partial(self.test_config.tester_obj().localhost.helm_install, self)
+            self.api_call_rate_limiter.wait(verb="helm")
+        return self._localhost.helm_install(self, *args, **kwargs)
 
-    @property
-    def helm_upgrade(self):
+    def helm_upgrade(self, *args, **kwargs) -> str:
         if self.api_call_rate_limiter:
-            self.api_call_rate_limiter.wait()
-        return partial(self.test_config.tester_obj().localhost.helm_upgrade, self)
+            self.api_call_rate_limiter.wait(verb="helm")
+        return self._localhost.helm_upgrade(self, *args, **kwargs)
 
     @cached_property
     def kube_config_dir_path(self):
@@ -445,11 +562,22 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
 
     def create_namespace(self, namespace: str) -> None:
         self.log.info("Create '%s' namespace", namespace)
-        namespaces = yaml.safe_load(self.kubectl("get namespaces -o yaml").stdout)
-        if not [ns["metadata"]["name"] for ns in namespaces["items"] if ns["metadata"]["name"] == namespace]:
+        if namespace not in self.get_namespace_names():
             self.kubectl(f"create namespace {namespace}")
+            self.wait_for_namespace(namespace)
         else:
-            self.log.warning("The '%s' namespace already exists.")
+            self.log.warning("The '%s' namespace already exists.", namespace)
+
+    @property
+    def namespaces_reflector_thread(self) -> K8sObjectsReflectorThread:
+        return self.get_objects_reflector_thread("list_namespace", namespace=None)
+
+    def get_namespace_names(self) -> List[str]:
+        return [namespace.metadata.name for namespace in self.namespaces_reflector_thread.get_objects()]
+
+    def wait_for_namespace(self, namespace: str, timeout: float = 120) -> None:
+        """Wait till the namespace gets to the local cache of namespaces."""
+        self.namespaces_reflector_thread.wait_for_object(namespace, is_ready=lambda _: True, timeout=timeout)
 
     @cached_property
     def cert_manager_log(self) -> str:
@@ -492,13 +620,18 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         data = {"spec": {"template": {"spec": {"nodeSelector": {
             self.POOL_LABEL_NAME: pool_name,
         }}}}}
-        deployment_names = self.kubectl(
-            f"get deployments -l '{selector}' --no-headers -o custom-columns=:.metadata.name",
-            namespace=namespace).stdout.split()
-        for deployment_name in deployment_names:
-            self.kubectl(
-                f"patch deployments {deployment_name} -p '{json.dumps(data)}'",
-                namespace=namespace)
+        apps_v1_api = self.k8s_apps_v1_api
+        deployment_names = [
+            deployment.metadata.name for deployment in apps_v1_api.list_namespaced_deployment(
+                namespace=namespace, label_selector=selector, **K8S_WATCH_CACHE_LIST_KWARGS).items]
+        if not deployment_names:
+            return
+        # NOTE: patch all the deployments in parallel using single API client
+        ParallelObject(
+            objects=[{"name": name, "namespace": namespace, "body": data} for name in deployment_names],
+            timeout=KUBECTL_TIMEOUT,
+            num_workers=min(len(deployment_names), 8),
+        ).run(apps_v1_api.patch_namespaced_deployment, unpack_objects=True)
 
     @log_run_info
     def deploy_cert_manager(self, pool_name: str = None) -> None:
@@ -537,22 +670,26 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
 
         self.start_cert_manager_journal_thread()
 
+    def deploy_cert_manager_and_ingress_controller(self, pool_name: str = None) -> None:
+        """Deploy cert-manager and, if SNI is enabled, ingress controller in parallel.
+
+        Unlike scylla-operator, which requires cert-manager, and scylla-manager, which requires
+        scylla-operator, these two do not depend on each other.
+        """
+        deployments = [partial(self.deploy_cert_manager, pool_name=pool_name)]
+        if self.params.get("k8s_enable_sni"):
+            deployments.append(partial(self.deploy_ingress_controller, pool_name=pool_name))
+        ParallelObject(objects=deployments, timeout=1800, num_workers=len(deployments)).call_objects()
+
     def get_latest_chart_version(self, local_chart_path: str) -> str:
-        all_versions = yaml.safe_load(self.helm(
-            f"search repo {local_chart_path} --devel --versions -o yaml"))
+        all_versions = yaml.load(self.helm(
+            f"search repo {local_chart_path} --devel --versions -o yaml"), Loader=YAML_SAFE_LOADER)
         assert isinstance(all_versions, list), f"Expected list of data, got: {type(all_versions)}"
         # NOTE: ignore versions like 'v1.8.0-alpha.0' because they refer to the oldest full version
         #       in each 'minor' family.
-        current_newest_version, current_newest_version_str = None, ''
-        for version_object in all_versions:
-            if version_object["version"].count('-') == 1:
-                continue
-            if ComparableScyllaOperatorVersion(version_object["version"]) > (
-                    current_newest_version or '0.0.0'):
-                current_newest_version = ComparableScyllaOperatorVersion(version_object["version"])
-                current_newest_version_str = version_object["version"]
-                continue
-        return current_newest_version_str
+        versions = [version_object["version"] for version_object in all_versions
+                    if version_object["version"].count('-') != 1]
+        return max(versions, key=lambda v: ComparableScyllaOperatorVersion(v).as_comparable(), default='')
 
     @cached_property
     def scylla_operator_chart_version(self):
@@ -572,6 +709,18 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
                 "Using following predefined scylla-operator chart version: %s", chart_version)
         return chart_version
 
+    @cached_property
+    def _scylla_operator_image_helm_values(self) -> dict:
+        # image.repository -> self.params.get('k8s_scylla_operator_docker_image').rsplit('/', 1)[0]
+        # image.tag        -> self.params.get('k8s_scylla_operator_docker_image').split(':', 1)[-1]
+        operator_image = self.params.get('k8s_scylla_operator_docker_image')
+        image_values = {"repository": operator_image.rsplit('/', 1)[0], "tag": operator_image.split(':', 1)[-1]}
+        return {key: value for key, value in image_values.items() if value}
+
+    @cached_property
+    def scylla_operator_comparable_version(self) -> ComparableScyllaOperatorVersion:
+        return ComparableScyllaOperatorVersion(self.scylla_operator_chart_version.split("-")[0])
+
     def get_operator_image(self, repo: str = '', chart_version: str = '') -> str:
         if image := self.params.get("k8s_scylla_operator_docker_image"):
             return image
@@ -580,25 +729,28 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         repo = repo or self.params.get('k8s_scylla_operator_helm_repo')
         chart_name = "scylla-operator"
         chart_version = chart_version or self.scylla_operator_chart_version
+        if operator_image := self._operator_images.get((repo, chart_version)):
+            return operator_image
         chart_info = self.helm(
             f"show chart {chart_name} --devel --repo {repo} --version {chart_version}")
-        for line in chart_info.split("\n"):
-            if line.startswith("appVersion:"):
-                # NOTE: 'appVersion' key may have different formats for it's value.
-                #       Value may or may not be wrapped in quotes.
-                # $ helm show chart scylla-operator --devel --repo %repo% --version v1.6.0-rc.0
-                #     apiVersion: v2
-                #     appVersion: "1.6"
-                #     ...
-                #
-                # $ helm show chart scylla-operator --devel --repo %repo% --version v1.5.0-rc.0
-                #     apiVersion: v2
-                #     appVersion: 1.5.0-rc.0
-                #     ...
-                #
-                # Details: https://helm.sh/docs/topics/charts/#the-appversion-field
-                found_app_version = line.split(':')[-1].strip().replace('"', '').replace("'", "")
-                return f"scylladb/scylla-operator:{found_app_version}"
+        # NOTE: 'appVersion' key may have different formats for it's value.
+        #       Value may or may not be wrapped in quotes.
+        # $ helm show chart scylla-operator --devel --repo %repo% --version v1.6.0-rc.0
+        #     apiVersion: v2
+        #     appVersion: "1.6"
+        #     ...
+        #
+        # $ helm show chart scylla-operator --devel --repo %repo% --version v1.5.0-rc.0
+        #     apiVersion: v2
+        #     appVersion: 1.5.0-rc.0
+        #     ...
+        #
+        # Details: https://helm.sh/docs/topics/charts/#the-appversion-field
+        if app_version_match := HELM_CHART_APP_VERSION_RE.search(chart_info):
+            operator_image = f"scylladb/scylla-operator:{app_version_match.group(1).strip()}"
+            # NOTE: content of a released chart version doesn't change, so cache it
+            self._operator_images[(repo, chart_version)] = operator_image
+            return operator_image
         raise ValueError(
             f"Cannot get operator image version from the '{chart_name}' chart located at "
             f"'{repo}' having '{chart_version}' version")
@@ -615,42 +767,34 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         if not self.params.get('reuse_cluster'):
             self.log.info("Deploy scylla-manager")
 
-            helm_affinity = get_helm_pool_affinity_values(
-                self.POOL_LABEL_NAME, pool_name) if pool_name else {}
-            values = HelmValues(**helm_affinity)
-            values.set("controllerAffinity", helm_affinity.get("affinity", {}))
+            # NOTE: the same affinity subtree is referenced by several keys, HelmValues doesn't change it in place
+            pool_affinity = add_pool_node_affinity({}, self.POOL_LABEL_NAME, pool_name) if pool_name else {}
             storage_config = {"capacity": "10Gi"}
             if self.cluster_backend == "k8s-eks":
                 storage_config["storageClassName"] = "gp3-3k-iops"
-            values.set("scylla", {
-                "developerMode": True,
-                "datacenter": "manager-dc",
-                "agentImage": {"tag": SCYLLA_MANAGER_AGENT_VERSION_IN_SCYLLA_MANAGER},
-                "racks": [{
-                    "name": "manager-rack",
-                    "members": 1,
-                    "placement": helm_affinity["affinity"],
-                    "storage": storage_config,
-                    "resources": {
-                        "limits": {"cpu": 1, "memory": "200Mi"},
-                        "requests": {"cpu": 1, "memory": "200Mi"},
-                    },
-                }],
-            })
-
-            mgmt_docker_image_tag = self.params.get('mgmt_docker_image').split(':')[-1]
-            if mgmt_docker_image_tag:
-                values.set('image.tag', mgmt_docker_image_tag)
-
-            scylla_operator_repo_base = self.params.get(
-                'k8s_scylla_operator_docker_image').rsplit('/', 1)[0]
-            if scylla_operator_repo_base:
-                values.set('controllerImage.repository', scylla_operator_repo_base)
-
-            scylla_operator_image_tag = self.params.get(
-                'k8s_scylla_operator_docker_image').split(':', 1)[-1]
-            if scylla_operator_image_tag:
-                values.set('controllerImage.tag', scylla_operator_image_tag)
+            values = HelmValues(
+                affinity=pool_affinity,
+                controllerAffinity=pool_affinity,
+                scylla={
+                    "developerMode": True,
+                    "datacenter": "manager-dc",
+                    "agentImage": {"tag": SCYLLA_MANAGER_AGENT_VERSION_IN_SCYLLA_MANAGER},
+                    "racks": [{
+                        "name": "manager-rack",
+                        "members": 1,
+                        "placement": pool_affinity,
+                        "storage": storage_config,
+                        "resources": {
+                            "limits": {"cpu": 1, "memory": "200Mi"},
+                            "requests": {"cpu": 1, "memory": "200Mi"},
+                        },
+                    }],
+                },
+            )
+            if mgmt_docker_image_tag := self.params.get('mgmt_docker_image').split(':')[-1]:
+                values.merge({"image": {"tag": mgmt_docker_image_tag}})
+            if self._scylla_operator_image_helm_values:
+                values.merge({"controllerImage": self._scylla_operator_image_helm_values})
 
             self.create_namespace(SCYLLA_MANAGER_NAMESPACE)
 
@@ -675,12 +819,12 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         # Cert-manager readiness status does not guarantee that it is fully operational
         # This function checks it if is operational via deploying ca and issuing certificate
         try:
-            self.apply_file(CERT_MANAGER_TEST_CONFIG)
+            KubernetesOps.server_side_apply_file(self, CERT_MANAGER_TEST_CONFIG)
             return True
         finally:
             self.kubectl(f'delete -f {CERT_MANAGER_TEST_CONFIG}', ignore_status=True)
 
-    @property
+    @cached_property
     def scylla_operator_log(self) -> str:
         return os.path.join(self.logdir, "scylla_operator.log")
 
@@ -715,25 +859,12 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
                 affinity_rules["webhookServerAffinity"]["nodeAffinity"] = (
                     affinity_rules["affinity"]["nodeAffinity"])
             values = HelmValues(**affinity_rules)
-            if ComparableScyllaOperatorVersion(
-                    self.scylla_operator_chart_version.split("-")[0]) > "1.3.0":
+            if self.scylla_operator_comparable_version > "1.3.0":
                 # NOTE: following is supported starting with operator-1.4
                 values.set("logLevel", 4)
 
-            # Calculate options values which must be set
-            #
-            # image.repository -> self.params.get('k8s_scylla_operator_docker_image').split('/')[0]
-            # image.tag        -> self.params.get('k8s_scylla_operator_docker_image').split(':')[-1]
-
-            scylla_operator_repo_base = self.params.get(
-                'k8s_scylla_operator_docker_image').rsplit('/', 1)[0]
-            if scylla_operator_repo_base:
-                values.set('image.repository', scylla_operator_repo_base)
-
-            scylla_operator_image_tag = self.params.get(
-                'k8s_scylla_operator_docker_image').split(':', 1)[-1]
-            if scylla_operator_image_tag:
-                values.set('image.tag', scylla_operator_image_tag)
+            if self._scylla_operator_image_helm_values:
+                values.merge({"image": self._scylla_operator_image_helm_values})
 
             # Install and wait for initialization of the Scylla Operator chart
             self.log.info("Deploy Scylla Operator")
@@ -746,26 +877,27 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
                 namespace=SCYLLA_OPERATOR_NAMESPACE,
                 values=values
             ))
-            scylla_operator_version = self.scylla_operator_chart_version.split("-")[0]
+            scylla_operator_version = self.scylla_operator_comparable_version
             enable_tls = 'true' if self.params.get('k8s_enable_tls') else 'false'
-            if ComparableScyllaOperatorVersion(scylla_operator_version) >= "1.8.0":
+            if scylla_operator_version >= "1.8.0":
                 patch_cmd = (
                     'patch deployment scylla-operator --type=json -p=\'[{"op": "add",'
                     ' "path": "/spec/template/spec/containers/0/args/-", '
                     f'"value": "--feature-gates=AutomaticTLSCertificates={enable_tls}" }}]\' ')
                 self.kubectl(patch_cmd, namespace=SCYLLA_OPERATOR_NAMESPACE)
-            if enable_tls == 'true' and ComparableScyllaOperatorVersion(scylla_operator_version) >= "1.9.0":
+            if enable_tls == 'true' and scylla_operator_version >= "1.9.0":
                 # around 10 keys that need to be cached per cluster
                 crypto_key_buffer_size = self.params.get('k8s_tenants_num') * 10
-                for flag in (f"--crypto-key-buffer-size-min={crypto_key_buffer_size}",
-                             f"--crypto-key-buffer-size-max={crypto_key_buffer_size}"):
-                    patch_obj = [{
-                        "op": "add",
-                        "path": "/spec/template/spec/containers/0/args/-",
-                        "value": flag
-                    }]
-                    patch_cmd = f"patch deployment scylla-operator --type=json -p='{json.dumps(patch_obj)}'"
-                    self.kubectl(patch_cmd, namespace=SCYLLA_OPERATOR_NAMESPACE)
+                # NOTE: add all the flags using single JSON patch serialized once
+                patch_obj = [{
+                    "op": "add",
+                    "path": "/spec/template/spec/containers/0/args/-",
+                    "value": flag,
+                } for flag in (f"--crypto-key-buffer-size-min={crypto_key_buffer_size}",
+                               f"--crypto-key-buffer-size-max={crypto_key_buffer_size}")]
+                patch_body = json.dumps(patch_obj, separators=(',', ':'))
+                self.kubectl(f"patch deployment scylla-operator --type=json -p='{patch_body}'",
+                             namespace=SCYLLA_OPERATOR_NAMESPACE)
 
             KubernetesOps.wait_for_pods_readiness(
                 kluster=self,
@@ -804,19 +936,27 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         # Helm doesn't do CRD 'upgrades', only 'creations'.
         # Details:
         #   https://helm.sh/docs/chart_best_practices/custom_resource_definitions/#some-caveats-and-explanations
-        if ComparableScyllaOperatorVersion(new_chart_version.split("-")[0]) > "1.5.0":
+        new_operator_version = ComparableScyllaOperatorVersion(new_chart_version.split("-")[0])
+        if new_operator_version > "1.5.0":
             self.log.info("Upgrade Scylla Operator CRDs: START")
             try:
-                with TemporaryDirectory() as tmpdir:
-                    self.helm(
-                        f"pull {local_repo_name}/scylla-operator --devel --untar "
-                        f"--version {new_chart_version} --destination {tmpdir}")
-                    crd_basedir = os.path.join(tmpdir, 'scylla-operator/crds')
-                    for current_file in os.listdir(crd_basedir):
-                        if not current_file.endswith((".yaml", ".yml")):
-                            continue
-                        self.apply_file(
-                            os.path.join(crd_basedir, current_file), modifiers=[], envsubst=False)
+                repo_hash = hashlib.sha1(new_helm_repo.encode()).hexdigest()[:12]
+                chart_dir = get_cached_download_dir(
+                    f"scylla-operator-{new_chart_version}-{repo_hash}",
+                    lambda dst_dir: self.helm(
+                        f"pull {local_repo_name}/scylla-operator --devel "
+                        f"--version {new_chart_version} --destination {dst_dir}"))
+                # NOTE: read CRDs right from the chart archive and apply them using the API,
+                #       server-side apply also doesn't hit the size limit of the 'last-applied' annotation.
+                for chart_archive in Path(chart_dir).glob("*.tgz"):
+                    with tarfile.open(chart_archive, mode="r:gz") as chart_tar:
+                        for member in chart_tar.getmembers():
+                            if not member.isfile() or "/crds/" not in member.name or not member.name.endswith(
+                                    (".yaml", ".yml")):
+                                continue
+                            KubernetesOps.server_side_apply_docs(
+                                self, yaml.load_all(chart_tar.extractfile(member), Loader=YAML_SAFE_LOADER),
+                                source=f"{chart_archive.name}:{member.name}")
             except Exception as exc:  # noqa: BLE001
                 self.log.debug("Upgrade Scylla Operator CRDs: Exception: %s", exc)
             self.log.info("Upgrade Scylla Operator CRDs: END")
@@ -824,7 +964,7 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         # Get existing scylla-operator helm chart values
         values = HelmValues(json.loads(self.helm(
             "get values scylla-operator -o json", namespace=SCYLLA_OPERATOR_NAMESPACE)))
-        if ComparableScyllaOperatorVersion(new_chart_version.split("-")[0]) > "1.3.0":
+        if new_operator_version > "1.3.0":
             # NOTE: following is supported starting with operator-1.4
             values.set("logLevel", 4)
 
@@ -844,29 +984,25 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
             namespace=SCYLLA_OPERATOR_NAMESPACE,
             values=values,
         ))
-        if self.params.get('k8s_enable_tls') and ComparableScyllaOperatorVersion(
-                self.scylla_operator_chart_version.split("-")[0]) >= "1.8.0":
+        if self.params.get('k8s_enable_tls') and self.scylla_operator_comparable_version >= "1.8.0":
             patch_cmd = ('patch deployment scylla-operator --type=json -p=\'[{"op": "add",'
                          '"path": "/spec/template/spec/containers/0/args/-", '
                          '"value": "--feature-gates=AutomaticTLSCertificates=true" }]\' ')
             self.kubectl(patch_cmd, namespace=SCYLLA_OPERATOR_NAMESPACE)
-        time.sleep(5)
-        self.kubectl("rollout status deployment scylla-operator",
-                     namespace=SCYLLA_OPERATOR_NAMESPACE)
+        KubernetesOps.wait_for_deployment_rollout(self, "scylla-operator", namespace=SCYLLA_OPERATOR_NAMESPACE)
 
     def check_scylla_cluster_sa_annotations(self, namespace: str = SCYLLA_NAMESPACE):
         # Make sure that ScyllaCluster ServiceAccount annotations stay unchanged
-        raw_sa_data = self.kubectl(
-            f"get sa {self.params.get('k8s_scylla_cluster_name')}-member -o yaml",
-            namespace=namespace).stdout
-        sa_data = yaml.safe_load(raw_sa_data)
+        annotations = self.k8s_core_v1_api.read_namespaced_service_account(
+            name=f"{self.params.get('k8s_scylla_cluster_name')}-member",
+            namespace=namespace).metadata.annotations or {}
         error_msg = (
             "ServiceAccount annotations don't have expected values.\n"
             f"Expected: {SCYLLA_CLUSTER_SA_ANNOTATIONS}\n"
-            f"Actual: {sa_data['metadata']['annotations']}"
+            f"Actual: {annotations}"
         )
         for annotation_key, annotation_value in SCYLLA_CLUSTER_SA_ANNOTATIONS.items():
-            assert sa_data["metadata"]["annotations"].get(annotation_key) == annotation_value, error_msg
+            assert annotations.get(annotation_key) == annotation_value, error_msg
 
     @log_run_info
     def deploy_minio_s3_backend(self):
@@ -882,18 +1018,21 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
                 values=values,
             ))
 
-        wait_for(lambda: self.minio_ip_address, text='Waiting for minio pod to popup',
-                 timeout=120, throw_exc=True)
-        self.kubectl_wait("-l app=minio --for=condition=Ready pod",
-                          timeout=600, namespace=MINIO_NAMESPACE)
+        # NOTE: the minio endpoint is built from the pod IP, so wait for it along with the pod readiness
+        KubernetesOps.watch_pods_till_ready(
+            kluster=self,
+            is_ready=lambda pod: is_k8s_object_condition_true(pod, "Ready") and bool(pod.status.pod_ip),
+            total_pods=lambda pods: pods > 0,
+            timeout=10,
+            namespace=MINIO_NAMESPACE,
+            selector="app=minio",
+        )
 
     def get_scylla_cluster_helm_values(self, cpu_limit, memory_limit, pool_name: str = None,
                                        cluster_name=None) -> HelmValues:
-        mgmt_agent_cpu_limit = convert_cpu_units_to_k8s_value(SCYLLA_MANAGER_AGENT_RESOURCES['cpu'])
-        mgmt_agent_memory_limit = convert_memory_units_to_k8s_value(
-            SCYLLA_MANAGER_AGENT_RESOURCES['memory'])
+        params = self.params
         if not cluster_name:
-            cluster_name = self.params.get('k8s_scylla_cluster_name')
+            cluster_name = params.get('k8s_scylla_cluster_name')
         placement = add_pool_node_affinity({}, self.POOL_LABEL_NAME, pool_name) if pool_name else {}
         pod_affinity_term = {
             "topologyKey": "kubernetes.io/hostname",
@@ -920,16 +1059,16 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
 
         dns_domains = []
         expose_options = {}
-        if ComparableScyllaOperatorVersion(self.scylla_operator_chart_version.split("-")[0]) >= "1.11.0":
-            if k8s_db_node_service_type := self.params.get("k8s_db_node_service_type"):
+        operator_version = self.scylla_operator_comparable_version
+        if operator_version >= "1.11.0":
+            if k8s_db_node_service_type := params.get("k8s_db_node_service_type"):
                 expose_options["nodeService"] = {"type": k8s_db_node_service_type}
             for broadcast_direction_type in ("node", "client"):
-                if ip_type := self.params.get(f"k8s_db_node_to_{broadcast_direction_type}_broadcast_ip_type"):
+                if ip_type := params.get(f"k8s_db_node_to_{broadcast_direction_type}_broadcast_ip_type"):
                     if "broadcastOptions" not in expose_options:
                         expose_options["broadcastOptions"] = {}
                     expose_options["broadcastOptions"][f"{broadcast_direction_type}s"] = {"type": ip_type}
-        if self.params.get('k8s_enable_sni') and ComparableScyllaOperatorVersion(
-                self.scylla_operator_chart_version.split("-")[0]) >= "1.8.0":
+        if params.get('k8s_enable_sni') and operator_version >= "1.8.0":
             dns_domains = [f"{cluster_name}.sct.scylladb.com"]
             expose_options = {"cql": {"ingress": {
                 "annotations": {
@@ -943,81 +1082,45 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         #       dist/common/sysctl.d/99-scylla-aio.conf
         #       Scylla 5.0+ has it as '30000000'
         sysctls = ["fs.aio-max-nr=300000000", ]
-        if self.params.get('print_kernel_callstack'):
+        if params.get('print_kernel_callstack'):
             sysctls += ["kernel.perf_event_paranoid=0", ]
 
-        scylla_args = self.params.get('append_scylla_args')
-
-        return HelmValues({
-            'nameOverride': '',
-            'fullnameOverride': cluster_name,
-            'scyllaImage': {
-                'repository': self.params.get('docker_image'),
-                'tag': self.params.get('scylla_version')
-            },
-            'agentImage': {
-                'repository': 'scylladb/scylla-manager-agent',
-                'tag': self.params.get('scylla_mgmt_agent_version')
-            },
-            'serviceAccount': {
-                'create': True,
-                'annotations': SCYLLA_CLUSTER_SA_ANNOTATIONS,
-                'name': f"{cluster_name}-member"
-            },
-            'alternator': {
-                'enabled': self.params.get("k8s_enable_alternator") or False,
-                'insecureEnableHTTP': True,
-                'insecureDisableAuthorization': not (
-                    self.params.get("alternator_enforce_authorization") or False),
-                **({"writeIsolation": self.params.get("alternator_write_isolation")}
-                   if self.params.get("alternator_write_isolation") else {}),
+        values = deepcopy(SCYLLA_CLUSTER_HELM_VALUES_TEMPLATE)
+        values['fullnameOverride'] = cluster_name
+        values['scyllaImage'] = {
+            'repository': params.get('docker_image'),
+            'tag': params.get('scylla_version')
+        }
+        values['agentImage']['tag'] = params.get('scylla_mgmt_agent_version')
+        values['serviceAccount']['name'] = f"{cluster_name}-member"
+        values['alternator']['enabled'] = params.get("k8s_enable_alternator") or False
+        values['alternator']['insecureDisableAuthorization'] = not (
+            params.get("alternator_enforce_authorization") or False)
+        if write_isolation := params.get("alternator_write_isolation"):
+            values['alternator']['writeIsolation'] = write_isolation
+        values['sysctls'] = sysctls
+        values['datacenter'] = self.region_name
+        values['scyllaArgs'] = params.get('append_scylla_args')
+        values['dnsDomains'] = dns_domains
+        values['exposeOptions'] = expose_options
+        rack = values['racks'][0]
+        rack['name'] = self.rack_name
+        rack['storage'] = {
+            'storageClassName': params.get('k8s_scylla_disk_class'),
+            'capacity': f"{params.get('k8s_scylla_disk_gi')}Gi"
+        }
+        rack['resources'] = {
+            'limits': {
+                'cpu': cpu_limit,
+                'memory': memory_limit
             },
-            'developerMode': False,
-            'cpuset': True,
-            'hostNetworking': False,
-            'automaticOrphanedNodeCleanup': True,
-            'sysctls': sysctls,
-            'serviceMonitor': {
-                'create': False
+            'requests': {
+                'cpu': cpu_limit,
+                'memory': memory_limit
             },
-            'datacenter': self.region_name,
-            'scyllaArgs': scylla_args,
-            'dnsDomains': dns_domains,
-            'exposeOptions': expose_options,
-            'racks': [
-                {
-                    'name': self.rack_name,
-                    'scyllaConfig': SCYLLA_CONFIG_NAME,
-                    'scyllaAgentConfig': SCYLLA_AGENT_CONFIG_NAME,
-                    'members': 0,
-                    'storage': {
-                        'storageClassName': self.params.get('k8s_scylla_disk_class'),
-                        'capacity': f"{self.params.get('k8s_scylla_disk_gi')}Gi"
-                    },
-                    'resources': {
-                        'limits': {
-                            'cpu': cpu_limit,
-                            'memory': memory_limit
-                        },
-                        'requests': {
-                            'cpu': cpu_limit,
-                            'memory': memory_limit
-                        },
-                    },
-                    'agentResources': {
-                        'limits': {
-                            'cpu': mgmt_agent_cpu_limit,
-                            'memory': mgmt_agent_memory_limit,
-                        },
-                        'requests': {
-                            'cpu': mgmt_agent_cpu_limit,
-                            'memory': mgmt_agent_memory_limit,
-                        },
-                    },
-                    'placement': placement,
-                }
-            ]
-        })
+        }
+        rack['placement'] = placement
+        return HelmValues(values)
 
     def wait_till_cluster_is_operational(self):
         if self.api_call_rate_limiter:
@@ -1045,6 +1148,17 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
     def is_performance_tuning_enabled(self):
         return self.params.get('k8s_enable_performance_tuning') and self.IS_NODE_TUNING_SUPPORTED
 
+    def wait_for_node_configs_reconciliation(self, timeout: int = 60) -> None:
+        if self.scylla_operator_comparable_version < "1.8.0":
+            # NOTE: older operators don't publish the 'Reconciled' condition of NodeConfigs
+            time.sleep(30)
+            return
+        # NOTE: wait for the node setup done by the operator instead of sleeping for a fixed time
+        for doc in load_yaml_file_docs(self.NODE_CONFIG_CRD_FILE):
+            if not doc or doc["kind"] != "NodeConfig":
+                continue
+            self.kubectl_wait(f"--for=condition=Reconciled nodeconfig/{doc['metadata']['name']}", timeout=timeout)
+
     def install_static_local_volume_provisioner(
             self, node_pools: list[CloudK8sNodePool] | CloudK8sNodePool) -> None:
         if self.params.get('reuse_cluster'):
@@ -1097,33 +1211,32 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
                     container_data["command"][i] = re.sub(
                         r"seek=\d+", f"seek={disk_size_kb}", container_data["command"][i])
 
-        with TemporaryDirectory() as tmp_dir_name:
-            repo_dst_dir = os.path.join(tmp_dir_name, 'dynamic-local-volume-provisioner')
-
-            download_from_github(
+        repo_dst_dir = get_cached_download_dir(
+            f"k8s-local-volume-provisioner-v{K8S_LOCAL_VOLUME_PROVISIONER_VERSION}",
+            lambda dst_dir: download_from_github(
                 repo='scylladb/k8s-local-volume-provisioner',
                 tag=f'tags/v{K8S_LOCAL_VOLUME_PROVISIONER_VERSION}',
-                dst_dir=repo_dst_dir)
-
-            self.apply_file(sct_abs_path(f"{repo_dst_dir}/example/storageclass_xfs.yaml"))
+                dst_dir=dst_dir))
 
-            # NOTE: apply example disk setup formatted to the XFS only on local K8S setups
-            if "k8s-local" in self.params.get("cluster_backend"):
-                path_to_disk_setup_config = sct_abs_path(f"{repo_dst_dir}/example/disk-setup")
-                self.apply_file(
-                    path_to_disk_setup_config,
-                    modifiers=config_modifiers + [example_disk_modifier] + [image_modifier],
-                    envsubst=False)
-                self.kubectl("rollout status daemonset.apps/xfs-disk-setup",
-                             namespace="xfs-disk-setup")
+        self.apply_file(sct_abs_path(f"{repo_dst_dir}/example/storageclass_xfs.yaml"))
 
-            path_to_csi_driver_config = sct_abs_path(f"{repo_dst_dir}/deploy/kubernetes")
+        # NOTE: apply example disk setup formatted to the XFS only on local K8S setups
+        if "k8s-local" in self.params.get("cluster_backend"):
+            path_to_disk_setup_config = sct_abs_path(f"{repo_dst_dir}/example/disk-setup")
             self.apply_file(
-                path_to_csi_driver_config,
-                modifiers=config_modifiers + [image_modifier],
+                path_to_disk_setup_config,
+                modifiers=config_modifiers + [example_disk_modifier] + [image_modifier],
                 envsubst=False)
-            self.kubectl("rollout status daemonset.apps/local-csi-driver",
-                         namespace="local-csi-driver")
+            self.kubectl("rollout status daemonset.apps/xfs-disk-setup",
+                         namespace="xfs-disk-setup")
+
+        path_to_csi_driver_config = sct_abs_path(f"{repo_dst_dir}/deploy/kubernetes")
+        self.apply_file(
+            path_to_csi_driver_config,
+            modifiers=config_modifiers + [image_modifier],
+            envsubst=False)
+        self.kubectl("rollout status daemonset.apps/local-csi-driver",
+                     namespace="local-csi-driver")
 
     @log_run_info
     def prepare_k8s_scylla_nodes(
@@ -1133,21 +1246,6 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         if not isinstance(node_pools, list):
             node_pools = [node_pools]
 
-        def node_config_change_mount_point(obj):
-            if obj["kind"] != "NodeConfig":
-                return
-            # NOTE: this modifier must run only for 'static' local volume provisioner
-            obj["spec"]['localDiskSetup']['mounts'][0]['mountPoint'] = '/mnt/raid-disks/disk0'
-
-        def node_setup_for_dynamic_local_volume_provisioner_modifier(obj):
-            if obj["kind"] != "DaemonSet":
-                return
-            for container_data in obj["spec"]["template"]["spec"]["containers"]:
-                if container_data["name"] in ("pv-setup", "node-setup"):
-                    # NOTE: disable custom node- and pv- setups using dynamic volume provisioner
-                    container_data["command"] = ["/bin/bash", "-c", "--"]
-                    container_data["args"] = ["while true; do sleep 3600; done"]
-
         modifiers = [affinity_modifier
                      for current_pool in node_pools
                      for affinity_modifier in current_pool.affinity_modifiers]
@@ -1164,10 +1262,13 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
             self.kubectl_wait("--for condition=established crd/nodeconfigs.scylla.scylladb.com")
 
             if scylla_utils_docker_image := self.params.get('k8s_scylla_utils_docker_image'):
-                self.kubectl(
-                    "patch scyllaoperatorconfigs.scylla.scylladb.com cluster --type merge "
-                    "-p '{\"spec\":{\"scyllaUtilsImage\":\"%s\"}}'" % scylla_utils_docker_image,
-                    ignore_status=False)
+                # NOTE: server-side apply owns only the specified field and is no-op when it is already set
+                KubernetesOps.server_side_apply_docs(self, [{
+                    "apiVersion": "scylla.scylladb.com/v1alpha1",
+                    "kind": "ScyllaOperatorConfig",
+                    "metadata": {"name": "cluster"},
+                    "spec": {"scyllaUtilsImage": scylla_utils_docker_image},
+                }], source="k8s_scylla_utils_docker_image option")
 
             modifiers = [affinity_modifier
                          for current_pool in node_pools
@@ -1175,7 +1276,7 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         if self.params.get("k8s_local_volume_provisioner_type") == 'static':
             modifiers.append(node_config_change_mount_point)
         self.apply_file(self.NODE_CONFIG_CRD_FILE, modifiers=modifiers, envsubst=False)
-        time.sleep(30)
+        self.wait_for_node_configs_reconciliation()
 
         if self.params.get("k8s_local_volume_provisioner_type") == 'static':
             self.install_static_local_volume_provisioner(node_pools=node_pools)
@@ -1232,39 +1333,20 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         node_pool = self.pools[node_pool_name]
         cpu_limit, memory_limit = node_pool.cpu_and_memory_capacity
         if not self.params.get('k8s_scylla_cpu_limit'):
-            # TODO: Remove reduction logic after
-            #       https://github.com/scylladb/scylla-operator/issues/384 is fixed
-            cpu_limit = int(
-                cpu_limit
-                - OPERATOR_CONTAINERS_RESOURCES['cpu'] * self.tenants_number
-                - COMMON_CONTAINERS_RESOURCES['cpu']
-                - SCYLLA_MANAGER_AGENT_RESOURCES['cpu'] * self.tenants_number
-            )
-            # NOTE: we should use at max 7 from each 8 cores.
-            #       i.e 28/32 , 21/24 , 14/16 and 7/8
-            new_cpu_limit = math.ceil(cpu_limit / 8) * 7
-            cpu_limit = min(cpu_limit, new_cpu_limit)
-            cpu_limit = cpu_limit // self.tenants_number or 1
-            self.scylla_cpu_limit = convert_cpu_units_to_k8s_value(cpu_limit)
+            self.scylla_cpu_limit = convert_cpu_units_to_k8s_value(
+                calculate_scylla_cpu_limit(cpu_limit, self.tenants_number))
         else:
             self.scylla_cpu_limit = self.params.get('k8s_scylla_cpu_limit')
         if not self.params.get('k8s_scylla_memory_limit'):
-            memory_limit = (
-                memory_limit
-                - OPERATOR_CONTAINERS_RESOURCES['memory'] * self.tenants_number
-                - COMMON_CONTAINERS_RESOURCES['memory']
-                - SCYLLA_MANAGER_AGENT_RESOURCES['memory'] * self.tenants_number
-            )
-            memory_limit = memory_limit / self.tenants_number
-            self.scylla_memory_limit = convert_memory_units_to_k8s_value(memory_limit)
+            self.scylla_memory_limit = convert_memory_units_to_k8s_value(
+                calculate_scylla_memory_limit(memory_limit, self.tenants_number))
         else:
             self.scylla_memory_limit = self.params.get('k8s_scylla_memory_limit')
 
         if self.params.get('reuse_cluster'):
             try:
                 self.wait_till_cluster_is_operational()
-                self.log.debug("Check Scylla cluster")
-                self.kubectl("get scyllaclusters.scylla.scylladb.com", namespace=namespace)
+                self.check_scylla_clusters(namespace=namespace)
                 self.start_scylla_cluster_events_thread()
                 return
             except Exception as exc:  # noqa: BLE001
@@ -1292,14 +1374,21 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
             namespace=namespace,
         ))
         self.wait_till_cluster_is_operational()
-
-        self.log.debug("Check Scylla cluster")
-        self.kubectl("get scyllaclusters.scylla.scylladb.com", namespace=namespace)
+        self.check_scylla_clusters(namespace=namespace)
         self.log.debug(
             "Wait for %d secs before we start to apply changes to the cluster",
             DEPLOY_SCYLLA_CLUSTER_DELAY)
         self.start_scylla_cluster_events_thread(namespace=namespace)
 
+    def check_scylla_clusters(self, namespace: str = SCYLLA_NAMESPACE) -> list[str]:
+        self.log.debug("Check Scylla cluster")
+        scylla_clusters = KubernetesOps.dynamic_api(
+            self.dynamic_client, api_version=SCYLLA_API_VERSION, kind=SCYLLA_CLUSTER_RESOURCE_KIND,
+        ).get(namespace=namespace)
+        names = [item.metadata.name for item in scylla_clusters.items]
+        self.log.debug("Scylla clusters in the '%s' namespace: %s", namespace, names)
+        return names
+
     @cached_property
     def _affinity_modifiers_for_monitoring_resources(self):
         node_pool = self.pools.get(self.MONITORING_POOL_NAME)
@@ -1326,8 +1415,8 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
                             namespace=PROMETHEUS_OPERATOR_NAMESPACE,
                             modifiers=self._affinity_modifiers_for_monitoring_resources,
                             envsubst=False, server_side=True)
-            time.sleep(3)
-        self.kubectl("rollout status deployment prometheus-operator", namespace=PROMETHEUS_OPERATOR_NAMESPACE)
+        # NOTE: the roll-out watch also waits for the deployment to appear
+        KubernetesOps.wait_for_deployment_rollout(self, "prometheus-operator", namespace=PROMETHEUS_OPERATOR_NAMESPACE)
 
     def deploy_scylla_cluster_monitoring(self, cluster_name: str, namespace: str,
                                          monitoring_type: str = "Platform") -> None:
@@ -1378,12 +1467,13 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
     def register_sct_grafana_dashboard(self, cluster_name: str, namespace: str) -> str:
         # TODO: make it work for EKS by using ingress LB IP when it is enabled
         sct_dashboard_file = sct_abs_path("data_dir/scylla-dash-per-server-nemesis.master.json")
-        sct_dashboard_file_data_str = ""
-        with open(sct_dashboard_file, encoding="utf-8") as sct_dashboard_file_obj:
-            dashboard_config = yaml.safe_load(sct_dashboard_file_obj)
-            dashboard_config["dashboard"]["title"] = dashboard_config["dashboard"]["title"].replace(
-                "$test_name", f"{get_test_name()}--{cluster_name}")
-            sct_dashboard_file_data_str = json.dumps(dashboard_config)
+        # NOTE: the parsed dashboard is cached and shared, so copy only the changed path instead of whole config
+        dashboard_config = load_yaml_file(sct_dashboard_file)
+        dashboard_config = {**dashboard_config, "dashboard": {
+            **dashboard_config["dashboard"],
+            "title": dashboard_config["dashboard"]["title"].replace("$test_name", f"{get_test_name()}--{cluster_name}"),
+        }}
+        sct_dashboard_file_data_str = json.dumps(dashboard_config)
         grafana_dn = f"{cluster_name}-grafana.{namespace}.svc.cluster.local"
         grafana_ip = self.get_grafana_ip(cluster_name=cluster_name, namespace=namespace)
         grafana_user = base64.b64decode(self.kubectl(
@@ -1449,11 +1539,13 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
 
     @property
     def minio_pod(self) -> Resource:
-        for pod in KubernetesOps.list_pods(self, namespace=MINIO_NAMESPACE):
-            for container in pod.spec.containers:
-                for port in container.ports:
-                    if hasattr(port, 'container_port') and str(port.container_port) == '9000':
-                        return pod
+        # NOTE: take the minio pods from the watch cache, so it doesn't cost API calls and stays up to date
+        minio_pods = self.get_objects_reflector_thread(
+            "list_namespaced_pod", namespace=MINIO_NAMESPACE).get_objects({"app": "minio"})
+        if pod := next((pod for pod in minio_pods
+                        if any(port.container_port == 9000
+                               for container in pod.spec.containers for port in container.ports or ())), None):
+            return pod
         raise RuntimeError("Can't find minio pod")
 
     @property
@@ -1486,12 +1578,42 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
     @property
     def k8s_configuration(self) -> k8s.client.Configuration:
         if self.api_call_rate_limiter:
-            return self.api_call_rate_limiter.get_k8s_configuration(self)
-        return KubernetesOps.create_k8s_configuration(self)
+            k8s_configuration = self.api_call_rate_limiter.get_k8s_configuration(self)
+        else:
+            k8s_configuration = KubernetesOps.create_k8s_configuration(self)
+        # NOTE: allow as many parallel connections as many calls may be done at once
+        if k8s_client_burst := self.params.get("k8s_client_burst"):
+            k8s_configuration.connection_pool_maxsize = max(
+                k8s_configuration.connection_pool_maxsize, k8s_client_burst)
+        return k8s_configuration
 
     @property
     def api_client(self) -> k8s.client.ApiClient:
-        return self.get_api_client()
+        # NOTE: reuse the client with its connection pool instead of parsing kubeconfig and doing TLS handshake
+        #       on each API call.  Recreate it from time to time to pick up rotated auth tokens.
+        with self._api_client_lock:
+            api_client, rate_limiter, created_at = self._api_client_cache
+            if (api_client is None or rate_limiter is not self.api_call_rate_limiter
+                    or time.monotonic() - created_at > API_CLIENT_TTL):
+                api_client = self.get_api_client()
+                self._api_client_cache = (api_client, self.api_call_rate_limiter, time.monotonic())
+            return api_client
+
+    def invalidate_api_client(self) -> None:
+        """Make next API call to create new client, i.e. to use rotated auth token."""
+        with self._api_client_lock:
+            self._api_client_cache = (None, None, 0)
+            self._no_wait_api_client_cache = (None, 0)
+
+    @property
+    def no_wait_api_client(self) -> k8s.client.ApiClient:
+        """API client which is not bound to the API call rate limiter, i.e. usable while the limiter is paused."""
+        with self._api_client_lock:
+            api_client, created_at = self._no_wait_api_client_cache
+            if api_client is None or time.monotonic() - created_at > API_CLIENT_TTL:
+                api_client = KubernetesOps.api_client(KubernetesOps.create_k8s_configuration(self))
+                self._no_wait_api_client_cache = (api_client, time.monotonic())
+            return api_client
 
     def get_api_client(self) -> k8s.client.ApiClient:
         if self.api_call_rate_limiter:
@@ -1500,7 +1622,13 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
 
     @property
     def dynamic_client(self) -> k8s.dynamic.DynamicClient:
-        return KubernetesOps.dynamic_client(self.api_client)
+        # NOTE: dynamic client runs API discovery when gets created, so keep it while the API client is the same
+        api_client = self.api_client
+        cached_api_client, dynamic_client = self._dynamic_client_cache
+        if cached_api_client is not api_client:
+            dynamic_client = KubernetesOps.dynamic_client(api_client)
+            self._dynamic_client_cache = (api_client, dynamic_client)
+        return dynamic_client
 
     @property
     def scylla_manager_cluster(self) -> 'ManagerPodCluser':
@@ -1515,8 +1643,7 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         )
 
     def create_secret_from_data(self, secret_name: str, namespace: str, data: dict, secret_type: str = 'Opaque'):
-        prepared_data = {key: base64.b64encode(json.dumps(value).encode('utf-8')).decode('utf-8')
-                         for key, value in data.items()}
+        prepared_data = encode_k8s_secret_data(data)
         secret = k8s.client.V1Secret(
             api_version="v1",
             data=prepared_data,
@@ -1530,27 +1657,32 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         self.k8s_core_v1_api.create_namespaced_secret(namespace=namespace, body=secret)
 
     def update_secret_from_data(self, secret_name: str, namespace: str, data: dict, secret_type: str = 'Opaque'):
-        existing = None
-        for secret in self.k8s_core_v1_api.list_namespaced_secret(namespace).items:
-            if secret.metadata.name == secret_name:
-                existing = secret
-                break
-        if not existing:
+        prepared_data = encode_k8s_secret_data(data)
+        try:
+            # NOTE: merge patch changes only the provided keys and fails when the secret is absent,
+            #       so no need to get the secret before patching it
+            self.k8s_core_v1_api.patch_namespaced_secret(secret_name, namespace, {"data": prepared_data})
+        except k8s.client.exceptions.ApiException as exc:
+            if exc.status != 404:
+                raise
             self.create_secret_from_data(
                 secret_name=secret_name, namespace=namespace, data=data, secret_type=secret_type)
-            return
-
-        for key, value in data.items():
-            existing.data[key] = base64.b64encode(json.dumps(value).encode('utf-8')).decode('utf-8')
-        self.k8s_core_v1_api.patch_namespaced_secret(secret_name, namespace, existing)
 
     def create_secret_from_directory(self, secret_name: str, path: str, namespace: str, secret_type: str = 'generic',
                                      only_files: List[str] = None):
         files = [fname for fname in os.listdir(path) if os.path.isfile(os.path.join(path, fname)) and
                  (not only_files or fname in only_files)]
-        cmd = f'create secret {secret_type} {secret_name} ' + \
-            ' '.join([f'--from-file={fname}={os.path.join(path, fname)}' for fname in files])
-        self.kubectl(cmd, namespace=namespace)
+        secret = k8s.client.V1Secret(
+            api_version="v1",
+            data={fname: base64.b64encode(Path(path, fname).read_bytes()).decode('utf-8') for fname in files},
+            kind="Secret",
+            metadata={
+                "name": secret_name,
+                "namespace": namespace,
+            },
+            type=KUBECTL_SECRET_TYPES.get(secret_type, secret_type),
+        )
+        self.k8s_core_v1_api.create_namespaced_secret(namespace=namespace, body=secret)
 
     def patch_kubectl_config(self):
         """
@@ -1563,15 +1695,23 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
             KubernetesOps.patch_kube_config(self, self.kubectl_token_path)
             wait_for(self.check_if_token_is_valid, timeout=120, throw_exc=True)
         self.start_scylla_pods_ip_change_tracker_thread()
+        self.start_nodes_reflector_thread()
 
     def check_if_token_is_valid(self) -> bool:
-        with open(self.kubectl_token_path, mode='rb') as token_file:
-            return bool(json.load(token_file))
+        # NOTE: parse the token file only when it gets replaced or changed
+        token_file_stat = os.stat(self.kubectl_token_path)
+        token_file_version = (token_file_stat.st_ino, token_file_stat.st_mtime_ns, token_file_stat.st_size)
+        cached_token_file_version, is_valid = self._token_validity_cache
+        if token_file_version != cached_token_file_version:
+            is_valid = bool(json.loads(Path(self.kubectl_token_path).read_bytes()))
+            self._token_validity_cache = (token_file_version, is_valid)
+        return is_valid
 
     def start_token_update_thread(self):
         if os.path.exists(self.kubectl_token_path):
             os.unlink(self.kubectl_token_path)
         self._token_update_thread = self.create_token_update_thread()
+        self._token_update_thread.register_token_update_callback(self.invalidate_api_client)
         self._token_update_thread.start()
         # Wait till GcloudTokenUpdateThread get tokens and dump them to gcloud_token_path
         wait_for(os.path.exists, timeout=30, step=5, text="Wait for gcloud token", throw_exc=True,
@@ -1582,13 +1722,45 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
             self, self.scylla_pods_ip_mapping)
         self.scylla_pods_ip_change_tracker_thread.start()
 
+    def start_nodes_reflector_thread(self):
+        self.nodes_reflector_thread = K8sNodesReflectorThread(self)
+        self.nodes_reflector_thread.start()
+
+    def get_objects_reflector_thread(self, list_method: str, namespace: Optional[str]) -> K8sObjectsReflectorThread:
+        """Get reflector of the objects (of a namespace if it is set) starting it on the first call."""
+        with self._objects_reflector_threads_lock:
+            if not (reflector := self._objects_reflector_threads.get((list_method, namespace))):
+                reflector = K8sObjectsReflectorThread(self, list_method=list_method, namespace=namespace)
+                reflector.start()
+                self._objects_reflector_threads[(list_method, namespace)] = reflector
+            return reflector
+
+    def stop_reflector_threads(self, timeout: float = 10) -> None:
+        with self._objects_reflector_threads_lock:
+            reflectors = list(self._objects_reflector_threads.values())
+            self._objects_reflector_threads.clear()
+        if self.nodes_reflector_thread:
+            reflectors.append(self.nodes_reflector_thread)
+            self.nodes_reflector_thread = None
+        # NOTE: signal all the reflectors first, so they stop concurrently
+        for reflector in reflectors:
+            reflector.stop(timeout=0)
+        for reflector in reflectors:
+            reflector.join(timeout)
+
     def _add_pool(self, pool: CloudK8sNodePool) -> None:
         if pool.name not in self.pools:
             self.pools[pool.name] = pool
 
     def wait_all_node_pools_to_be_ready(self):
-        for node_pool in self.pools.values():
-            node_pool.wait_for_nodes_readiness()
+        if not self.pools:
+            return
+        # NOTE: each node pool watches its own nodes, so wait for all of them at once
+        ParallelObject(
+            objects=list(self.pools.values()),
+            timeout=max(pool.readiness_timeout for pool in self.pools.values()) * 60 + 60,
+            num_workers=len(self.pools),
+        ).run(lambda pool: pool.wait_for_nodes_readiness(), ignore_exceptions=False)
 
     @abc.abstractmethod
     def deploy(self):
@@ -1617,8 +1789,8 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         cluster_name = cluster_name or self.params.get('k8s_scylla_cluster_name')
 
         # Update the node affinity rules to match the new nodes
-        scylla_cluster_info = yaml.safe_load(self.kubectl(
-            f"get scyllaclusters.scylla.scylladb.com {cluster_name} -o yaml",
+        scylla_cluster_info = json.loads(self.kubectl(
+            f"get scyllaclusters.scylla.scylladb.com {cluster_name} -o json",
             namespace=cluster_namespace).stdout)
         racks_info = scylla_cluster_info["spec"]["datacenter"]["racks"]
         total_pods = 0
@@ -1645,26 +1817,36 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
             pod_object.wait_for_pod_readiness(
                 pod_readiness_timeout_minutes=pod_readiness_timeout_minutes)
 
+    def _read_scylla_config_map(self, namespace: str) -> Tuple[dict, bool]:
+        try:
+            return self.k8s_core_v1_api.read_namespaced_config_map(
+                name=SCYLLA_CONFIG_NAME, namespace=namespace).data or {}, True
+        except Exception:  # noqa: BLE001
+            return {}, False
+
+    def get_scylla_config_map(self, namespace: str = SCYLLA_NAMESPACE) -> dict:
+        with self.scylla_config_lock.reader():
+            return self._read_scylla_config_map(namespace)[0]
+
     @contextlib.contextmanager
     def scylla_config_map(self, namespace: str = SCYLLA_NAMESPACE) -> dict:
-        with self.scylla_config_lock:
-            try:
-                config_map = self.k8s_core_v1_api.read_namespaced_config_map(
-                    name=SCYLLA_CONFIG_NAME, namespace=namespace).data or {}
-                exists = True
-            except Exception:  # noqa: BLE001
-                config_map = {}
-                exists = False
-            original_config_map = deepcopy(config_map)
+        with self.scylla_config_lock.writer():
+            config_map, exists = self._read_scylla_config_map(namespace)
+            # NOTE: values are strings, so a shallow copy is enough to detect changes
+            original_config_map = dict(config_map)
             yield config_map
             if original_config_map == config_map:
                 self.log.debug("%s: scylla config map hasn't been changed", self)
                 return
             if exists:
+                # NOTE: send only changed keys, 'null' value makes API server to remove a key
+                changed_data = {key: value for key, value in config_map.items()
+                                if original_config_map.get(key) != value}
+                changed_data.update({key: None for key in original_config_map.keys() - config_map.keys()})
                 self.k8s_core_v1_api.patch_namespaced_config_map(
                     name=SCYLLA_CONFIG_NAME,
                     namespace=namespace,
-                    body=[{"op": "replace", "path": '/data', "value": config_map}]
+                    body={"data": changed_data},
                 )
             else:
                 self.k8s_core_v1_api.create_namespaced_config_map(
@@ -1686,17 +1868,17 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         Details: https://operator.docs.scylladb.com/master/generic#configure-scylla
         """
         with self.scylla_config_map(namespace=namespace) as scylla_config_map:
-            old_data = yaml.safe_load(scylla_config_map.get(filename, "")) or {}
+            old_data = yaml.load(scylla_config_map.get(filename, ""), Loader=YAML_SAFE_LOADER) or {}
             new_data = deepcopy(old_data)
             yield new_data
             if old_data == new_data:
                 self.log.debug("%s: '%s' hasn't been changed", self, filename)
                 return
-            old_data_as_list = yaml.safe_dump(old_data).splitlines(keepends=True)
-            new_data_as_str = yaml.safe_dump(new_data)
-            new_data_as_list = new_data_as_str.splitlines(keepends=True)
-            diff = "".join(unified_diff(old_data_as_list, new_data_as_list))
-            self.log.debug("%s: '%s' has been updated:\n%s", self, filename, diff)
+            new_data_as_str = yaml.dump(new_data, Dumper=YAML_SAFE_DUMPER)
+            if self.log.isEnabledFor(logging.DEBUG):
+                diff = "".join(unified_diff(yaml.dump(old_data, Dumper=YAML_SAFE_DUMPER).splitlines(keepends=True),
+                                            new_data_as_str.splitlines(keepends=True)))
+                self.log.debug("%s: '%s' has been updated:\n%s", self, filename, diff)
             if not new_data:
                 scylla_config_map.pop(filename, None)
             else:
@@ -1715,24 +1897,29 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
         # NOTE: operator sets all the scylla options itself based on the configuration of the ScyllaCluster CRD.
         #       It allows to redefine options using 'scylla-config' configMap opject.
         #       So, define some options here by default. It may be extended later if needed.
-        with self.remote_scylla_yaml(namespace=namespace) as scylla_yml:
-            # Process cluster params
-            if self.params.get("experimental_features"):
-                scylla_yml["experimental_features"] = self.params.get("experimental_features")
-            if self.params.get("hinted_handoff"):
-                scylla_yml["hinted_handoff_enabled"] = self.params.get(
-                    "hinted_handoff").lower() in ("enabled", "true")
-            if self.params.get("endpoint_snitch"):
-                scylla_yml["endpoint_snitch"] = self.params.get("endpoint_snitch")
+        # NOTE: prepare the options before taking the config map lock
+        scylla_yml_options = {}
+        # Process cluster params
+        if experimental_features := self.params.get("experimental_features"):
+            scylla_yml_options["experimental_features"] = experimental_features
+        if hinted_handoff := self.params.get("hinted_handoff"):
+            scylla_yml_options["hinted_handoff_enabled"] = hinted_handoff.lower() in ("enabled", "true")
+        if endpoint_snitch := self.params.get("endpoint_snitch"):
+            scylla_yml_options["endpoint_snitch"] = endpoint_snitch
+
+        # Process method kwargs
+        if kwargs.get("murmur3_partitioner_ignore_msb_bits"):
+            scylla_yml_options["murmur3_partitioner_ignore_msb_bits"] = int(
+                kwargs.pop("murmur3_partitioner_ignore_msb_bits"))
 
-            # Process method kwargs
-            if kwargs.get("murmur3_partitioner_ignore_msb_bits"):
-                scylla_yml["murmur3_partitioner_ignore_msb_bits"] = int(
-                    kwargs.pop("murmur3_partitioner_ignore_msb_bits"))
+        with self.remote_scylla_yaml(namespace=namespace) as scylla_yml:
+            for key, value in scylla_yml_options.items():
+                if scylla_yml.get(key) != value:
+                    scylla_yml[key] = value
 
-            self.log.info("K8S SCYLLA_YAML: %s", scylla_yml)
-            if kwargs:
-                self.log.warning("K8S SCYLLA_YAML, not applied options: %s", kwargs)
+        self.log.info("K8S SCYLLA_YAML: %s", scylla_yml)
+        if kwargs:
+            self.log.warning("K8S SCYLLA_YAML, not applied options: %s", kwargs)
 
 
 class BasePodContainer(cluster.BaseNode):
@@ -1826,12 +2013,15 @@ class BasePodContainer(cluster.BaseNode):
     def check_spot_termination(self):
         pass
 
+    def _get_reflected_object(self, list_method: str):
+        # NOTE: read the pod and it's service from the namespace-wide watch caches
+        #       instead of listing them using API on each access
+        return self.k8s_cluster.get_objects_reflector_thread(
+            list_method, namespace=self.parent_cluster.namespace).get_object(self.name)
+
     @property
     def _pod(self):
-        pods = KubernetesOps.list_pods(
-            self.k8s_cluster, namespace=self.parent_cluster.namespace,
-            field_selector=f"metadata.name={self.name}")
-        return pods[0] if pods else None
+        return self._get_reflected_object("list_namespaced_pod")
 
     @property
     def pod_spec(self):
@@ -1851,17 +2041,11 @@ class BasePodContainer(cluster.BaseNode):
 
     @property
     def _cluster_ip_service(self):
-        services = KubernetesOps.list_services(
-            self.k8s_cluster, namespace=self.parent_cluster.namespace,
-            field_selector=f"metadata.name={self.name}")
-        return services[0] if services else None
+        return self._get_reflected_object("list_namespaced_service")
 
     @property
     def _svc(self):
-        services = KubernetesOps.list_services(
-            self.k8s_cluster, namespace=self.parent_cluster.namespace,
-            field_selector=f"metadata.name={self.name}")
-        return services[0] if services else None
+        return self._get_reflected_object("list_namespaced_service")
 
     @property
     def _container_status(self):
@@ -1923,6 +2107,12 @@ class BasePodContainer(cluster.BaseNode):
     def _wait_for_k8s_node_readiness(self):
         if self.node_name is None:
             raise RuntimeError(f"Can't find node for pod {self.name}")
+        if reflector := self.k8s_cluster.nodes_reflector_thread:
+            # NOTE: nodes get awaited using the shared watch stream instead of a 'kubectl wait' process per node
+            reflector.wait_for_object(
+                self.node_name, is_ready=lambda node: is_k8s_object_condition_true(node, "Ready"),
+                timeout=self.pod_readiness_timeout // 3 * 60)
+            return True
         result = self.k8s_cluster.kubectl(
             f"wait node --timeout={self.pod_readiness_timeout // 3}m --for=condition=Ready {self.node_name}",
             namespace=self.parent_cluster.namespace,
@@ -1962,22 +2152,23 @@ class BasePodContainer(cluster.BaseNode):
     def restart(self):
         raise NotImplementedError("Not implemented yet")  # TODO: implement this method.
 
-    def hard_reboot(self):
-        self.k8s_cluster.kubectl(
-            f'delete pod {self.name} --now',
-            namespace=self.parent_cluster.namespace,
-            timeout=self.pod_terminate_timeout * 60 + 10)
-
+    def _delete_pod_and_wait_for_readiness(self, grace_period_seconds: int) -> None:
+        # NOTE: Kubernetes brings pods back to live right after it is deleted, so wait for the new pod
+        #       using the shared watch stream, checking UID to not be confused by the old pod still being ready
+        old_uid = self.k8s_pod_uid
+        self.k8s_cluster.k8s_core_v1_api.delete_namespaced_pod(
+            name=self.name, namespace=self.parent_cluster.namespace, grace_period_seconds=grace_period_seconds)
+        self.k8s_cluster.get_objects_reflector_thread(
+            "list_namespaced_pod", namespace=self.parent_cluster.namespace).wait_for_object(
+                self.name, is_ready=lambda pod: pod.metadata.uid != old_uid,
+                timeout=self.pod_terminate_timeout * 60 + 10)
         self.wait_for_pod_readiness()
 
-    def soft_reboot(self):
-        # Kubernetes brings pods back to live right after it is deleted
-        self.k8s_cluster.kubectl(
-            f'delete pod {self.name} --grace-period={self.pod_terminate_timeout * 60}',
-            namespace=self.parent_cluster.namespace,
-            timeout=self.pod_terminate_timeout * 60 + 10)
+    def hard_reboot(self):
+        self._delete_pod_and_wait_for_readiness(grace_period_seconds=1)
 
-        self.wait_for_pod_readiness()
+    def soft_reboot(self):
+        self._delete_pod_and_wait_for_readiness(grace_period_seconds=self.pod_terminate_timeout * 60)
 
     # On kubernetes there is no stop/start, closest analog of node restart would be soft_restart
     restart = soft_reboot
@@ -2202,7 +2393,12 @@ class BaseScyllaPodContainer(BasePodContainer):
     def refresh_ip_address(self):
         # Invalidate ip address cache
         old_ip_info = (self.public_ip_address, self.private_ip_address)
-        self._private_ip_address_cached = self._public_ip_address_cached = self._ipv6_ip_address_cached = None
+        # NOTE: fill in both addresses using single snapshot of the pod and it's service
+        #       instead of making each of the address properties read them again
+        public_ips, private_ips = self._refresh_instance_state()
+        self._ipv6_ip_address_cached = None
+        self._public_ip_address_cached = to_inet_ntop_format(public_ips[0])
+        self._private_ip_address_cached = to_inet_ntop_format(private_ips[0])
 
         if old_ip_info == (self.public_ip_address, self.private_ip_address):
             return
@@ -2228,10 +2424,10 @@ class BaseScyllaPodContainer(BasePodContainer):
             pods_selector = "app.kubernetes.io/name=local-csi-driver"
             scylla_disk_path = "/mnt/persistent-volumes"
             namespace = "local-csi-driver"
-        podnames = self.k8s_cluster.kubectl(
-            f"get pod -l {pods_selector} --field-selector spec.nodeName={self.node_name} "
-            "-o jsonpath='{range .items[*]}{.metadata.name}'",
-            namespace=namespace).stdout.strip().split("\n")
+        # NOTE: list the pods using the API client which lets API server respond from it's watch cache
+        podnames = [pod.metadata.name for pod in KubernetesOps.list_pods(
+            self.k8s_cluster, namespace=namespace, label_selector=pods_selector,
+            field_selector=f"spec.nodeName={self.node_name}")]
         assert podnames, (
             f"Failed to find pods using '{pods_selector}' selector on '{self.node_name}' node "
             f"in '{namespace}' namespace. Didn't run the 'fstrim' command")
@@ -2383,7 +2579,10 @@ class PodCluster(cluster.BaseCluster):
         # TODO: make it work when we have decommissioned (by nodetool) nodes.
         #       Now it will fail because pod which hosts decommissioned Scylla member is reported
         #       as 'NotReady' and will fail the pod waiter function below.
+        if count <= 0:
+            return []
 
+        # NOTE: pod waiters below return right after the initial list of pods when they are ready already
         # Wait while whole cluster (on all racks) including new nodes are up and running
         current_dc_nodes = [node for node in self.nodes if node.dc_idx == dc_idx]
         expected_dc_nodes_count = len(current_dc_nodes) + count
@@ -2393,17 +2592,19 @@ class PodCluster(cluster.BaseCluster):
             pods_to_wait=count, total_pods=expected_dc_nodes_count, dc_idx=dc_idx)
 
         # Register new nodes and return whatever was registered
-        k8s_pods = KubernetesOps.list_pods(self.k8s_clusters[dc_idx], namespace=self.namespace)
+        # NOTE: take pods from the namespace's watch cache, waiting for it to catch up with the awaited pods
+        k8s_pods = self.k8s_clusters[dc_idx].get_objects_reflector_thread(
+            "list_namespaced_pod", namespace=self.namespace).wait_for_objects(
+                is_ready=lambda pods: sum(
+                    any(status.name == self.container for status in (pod.status.container_statuses or ()))
+                    for pod in pods) >= expected_dc_nodes_count,
+                timeout=120)
         nodes = []
+        registered_node_names = {node.name for node in current_dc_nodes}
         for pod in k8s_pods:
-            if not any((x for x in pod.status.container_statuses if x.name == self.container)):
+            if not any(x.name == self.container for x in (pod.status.container_statuses or ())):
                 continue
-            is_already_registered = False
-            for node in current_dc_nodes:
-                if node.name == pod.metadata.name:
-                    is_already_registered = True
-                    break
-            if is_already_registered:
+            if pod.metadata.name in registered_node_names:
                 continue
             # TBD: A rack validation might be needed
             # Register a new node
@@ -2431,12 +2632,28 @@ class PodCluster(cluster.BaseCluster):
     def wait_sts_rollout_restart(self, pods_to_wait: int, dc_idx: int = 0):
         timeout = self.get_nodes_reboot_timeout(pods_to_wait)
         k8s_cluster = self.k8s_clusters[dc_idx]
-        for statefulset in KubernetesOps.list_statefulsets(k8s_cluster, namespace=self.namespace):
-            k8s_cluster.kubectl(
-                f"rollout status statefulset/{statefulset.metadata.name} "
-                f"--watch=true --timeout={timeout}m",
-                namespace=self.namespace,
-                timeout=timeout * 60 + 10)
+        self.wait_for_statefulsets_rollout(
+            k8s_cluster, KubernetesOps.list_statefulsets(k8s_cluster, namespace=self.namespace), timeout=timeout)
+
+    def wait_for_statefulsets_rollout(self, k8s_cluster: KubernetesCluster, statefulsets: list, timeout: int,
+                                      wait_for_spec_change: bool = False) -> None:
+        """Wait for rollout of the statefulsets (racks), timeout is in minutes.
+
+        With 'wait_for_spec_change' the statefulsets must be listed before their spec got changed,
+        then the rollout is awaited only after the change gets applied to them.
+        """
+        if not statefulsets:
+            return
+        if k8s_cluster.api_call_rate_limiter:
+            k8s_cluster.api_call_rate_limiter.wait(verb="rollout_status")
+        previous_generations = None
+        if wait_for_spec_change:
+            previous_generations = {
+                statefulset.metadata.name: statefulset.metadata.generation for statefulset in statefulsets}
+        # NOTE: watch all the racks using single stream instead of a 'kubectl rollout status' process per rack
+        KubernetesOps.wait_for_statefulsets_rollout(
+            k8s_cluster, names=[statefulset.metadata.name for statefulset in statefulsets],
+            namespace=self.namespace, timeout=timeout * 60, previous_generations=previous_generations)
 
     def get_nodes_reboot_timeout(self, count) -> Union[float, int]:
         """
@@ -2474,15 +2691,25 @@ class PodCluster(cluster.BaseCluster):
 
     def generate_namespace(self, namespace_template: str) -> str:
         # Pick up not used namespace knowing that we may have more than 1 Scylla cluster
-        with NAMESPACE_CREATION_LOCK:
-            namespaces = self.k8s_clusters[0].kubectl(
-                "get namespaces --no-headers -o=custom-columns=:.metadata.name").stdout.split()
-            for i in range(1, len(namespaces)):
+        with NAMESPACE_CREATION_LOCK.get_lock(namespace_template):
+            namespaces = set(self.k8s_clusters[0].get_namespace_names())
+            # NOTE: there is always a free candidate among 'len(namespaces) + 1' ones
+            for i in range(1, len(namespaces) + 2):
                 candidate_namespace = f"{namespace_template}{'-' + str(i) if i > 1 else ''}"
                 if candidate_namespace not in namespaces:
+                    try:
+                        self.k8s_clusters[0].k8s_core_v1_api.create_namespace(
+                            body={"metadata": {"name": candidate_namespace}})
+                    except k8s_exceptions.ApiException as exc:
+                        # NOTE: namespace names are served from a watch cache which may lag behind,
+                        #       so the create call is the actual check of the name availability.
+                        if exc.status != 409:
+                            raise
+                        namespaces.add(candidate_namespace)
+                        continue
                     # NOTE: the namespaces must match for all the K8S clusters
-                    for k8s_cluster in self.k8s_clusters:
-                        k8s_cluster.kubectl(f"create namespace {candidate_namespace}")
+                    for k8s_cluster in self.k8s_clusters[1:]:
+                        k8s_cluster.k8s_core_v1_api.create_namespace(body={"metadata": {"name": candidate_namespace}})
                     return candidate_namespace
                 # TODO: make it work correctly for case with reusage of multi-tenant cluster
                 k8s_cluster = self.k8s_clusters[0]
@@ -2502,6 +2729,8 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
                  add_nodes: bool = True,
                  ) -> None:
         self.k8s_clusters = k8s_clusters
+        self._scylla_cluster_api_cache = {}
+        self._k8s_prometheus_db_stats = {}
         self.namespace = self.generate_namespace(namespace_template=SCYLLA_NAMESPACE)
         self.scylla_cluster_name = scylla_cluster_name
         # NOTE: the 'self.k8s_scylla_manager_auth_token' attr is used only in MultiDC setups
@@ -2591,22 +2820,39 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
                 self.wait_for_nodes_up_and_normal(nodes=node_list_subset, timeout=timeout)
 
     def _k8s_scylla_cluster_api(self, dc_idx: int = 0) -> Resource:
-        return KubernetesOps.dynamic_api(self.k8s_clusters[dc_idx].dynamic_client,
-                                         api_version=SCYLLA_API_VERSION,
-                                         kind=SCYLLA_CLUSTER_RESOURCE_KIND)
+        # NOTE: the resource is bound to the dynamic client, so keep it while the dynamic client is the same
+        dynamic_client = self.k8s_clusters[dc_idx].dynamic_client
+        cached_dynamic_client, resource = self._scylla_cluster_api_cache.get(dc_idx, (None, None))
+        if cached_dynamic_client is not dynamic_client:
+            resource = KubernetesOps.dynamic_api(dynamic_client,
+                                                 api_version=SCYLLA_API_VERSION,
+                                                 kind=SCYLLA_CLUSTER_RESOURCE_KIND)
+            self._scylla_cluster_api_cache[dc_idx] = (dynamic_client, resource)
+        return resource
 
     @retrying(n=20, sleep_time=3, allowed_exceptions=(k8s_exceptions.ApiException, ),
               message="Failed to update ScyllaCluster's spec...")
-    def replace_scylla_cluster_value(self, path: str, value: Any,
-                                     dc_idx: int = 0) -> Optional[ANY_KUBERNETES_RESOURCE]:
+    def patch_scylla_cluster(self, operations: List[dict], dc_idx: int = 0) -> Optional[ANY_KUBERNETES_RESOURCE]:
+        """
+        Apply JSON-Patch operations to the ScyllaCluster object in a single API call retrying on failures.
+
+        Operations must be idempotent, e.g. appending to a list must not be applied using this method.
+        """
+        return self._apply_scylla_cluster_patch(operations, dc_idx=dc_idx)
+
+    def _apply_scylla_cluster_patch(self, operations: List[dict], dc_idx: int = 0) -> Optional[ANY_KUBERNETES_RESOURCE]:
         self.k8s_clusters[dc_idx].log.debug(
-            "Replace `%s' with `%s' in %s's spec", path, value, self.scylla_cluster_name)
+            "Apply %s operations to %s's spec", operations, self.scylla_cluster_name)
         return self._k8s_scylla_cluster_api(dc_idx=dc_idx).patch(
-            body=[{"op": "replace", "path": path, "value": value}],
+            body=operations,
             name=self.scylla_cluster_name,
             namespace=self.namespace,
             content_type=JSON_PATCH_TYPE)
 
+    def replace_scylla_cluster_value(self, path: str, value: Any,
+                                     dc_idx: int = 0) -> Optional[ANY_KUBERNETES_RESOURCE]:
+        return self.patch_scylla_cluster([{"op": "replace", "path": path, "value": value}], dc_idx=dc_idx)
+
     def get_scylla_cluster_value(self, path: str, dc_idx: int = 0) -> Optional[ANY_KUBERNETES_RESOURCE]:
         """
         Get scylla cluster value from kubernetes API.
@@ -2621,27 +2867,29 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
         Use it if you are going to modify the data.
         """
         cluster_data = self._k8s_scylla_cluster_api(dc_idx=dc_idx).get(
-            namespace=self.namespace, name=self.scylla_cluster_name).to_dict()
-        return walk_thru_data(cluster_data, path)
+            namespace=self.namespace, name=self.scylla_cluster_name)
+        # NOTE: convert only the requested part of the object, not the whole one
+        return convert_k8s_resource_field_to_plain_data(walk_thru_data(cluster_data, path))
 
     def add_scylla_cluster_value(self, path: str, element: Any, dc_idx: int = 0):
-        init = self.get_scylla_cluster_value(path, dc_idx=dc_idx) is None
         if path.endswith('/'):
             path = path[0:-1]
-        if init:
+        api = self._k8s_scylla_cluster_api(dc_idx=dc_idx)
+        try:
+            api.patch(
+                body=[{"op": "add", "path": path + "/-", "value": element}],
+                name=self.scylla_cluster_name,
+                namespace=self.namespace,
+                content_type=JSON_PATCH_TYPE)
+        except k8s_exceptions.ApiException as exc:
+            if exc.status != 422:
+                raise
             # You can't add to empty array, so you need to replace it
-            operation = "replace"
-            value = [element]
-        else:
-            operation = "add"
-            path = path + "/-"
-            value = element
-        self._k8s_scylla_cluster_api(dc_idx=dc_idx).patch(
-            body=[{"op": operation, "path": path, "value": value}],
-            name=self.scylla_cluster_name,
-            namespace=self.namespace,
-            content_type=JSON_PATCH_TYPE
-        )
+            api.patch(
+                body=[{"op": "replace", "path": path, "value": [element]}],
+                name=self.scylla_cluster_name,
+                namespace=self.namespace,
+                content_type=JSON_PATCH_TYPE)
 
     def remove_scylla_cluster_value(self, path: str, element_name: str, dc_idx: int = 0):
         element_list = self.get_scylla_cluster_value(path, dc_idx=dc_idx) or []
@@ -2662,6 +2910,9 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
     def scylla_config_map(self, dc_idx: int = 0) -> ContextManager:
         return self.k8s_clusters[dc_idx].scylla_config_map()
 
+    def get_scylla_config_map(self, dc_idx: int = 0) -> dict:
+        return self.k8s_clusters[dc_idx].get_scylla_config_map()
+
     def remote_scylla_yaml(self, dc_idx: int = 0) -> ContextManager:
         return self.k8s_clusters[dc_idx].remote_scylla_yaml()
 
@@ -2720,10 +2971,12 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
         if sni_address:
             # TODO: handle the case of multiple datacenters
             # need to get the cluster ip from each k8s cluster
-            bundle_yaml = yaml.safe_load(bundle_file.open('r', encoding='utf-8'))
+            with bundle_file.open('r', encoding='utf-8') as bundle_file_stream:
+                bundle_yaml = yaml.load(bundle_file_stream, Loader=YAML_SAFE_LOADER)
             for _, connection_data in bundle_yaml.get('datacenters', {}).items():
                 connection_data['server'] = f'{sni_address.strip()}:9142'
-            yaml.dump(bundle_yaml, bundle_file.open('w', encoding='utf-8'))
+            with bundle_file.open('w', encoding='utf-8') as bundle_file_stream:
+                yaml.dump(bundle_yaml, bundle_file_stream, Dumper=YAML_SAFE_DUMPER)
 
         return bundle_file
 
@@ -2811,6 +3064,8 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
         assert instance_type is None, "k8s can't provision different instance types"
 
         new_nodes = []
+        # NOTE: count members of the racks at once, nodes added to one DC don't change the other DCs' racks
+        rack_members = Counter((node.dc_idx, node.rack) for node in self.nodes)
         self.log.debug(
             "'%s' configuration was taken for the 'dc_idx': %s",
             "Single-DC" if len(dc_idx) < 2 else "Multi-DC", dc_idx)
@@ -2819,12 +3074,17 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
             self.log.debug(
                 "Going to provision '%s' nodes (node_count_in_dc) in DC with '%s' (dc_idx)",
                 node_count_in_dc, current_dc_idx)
-            self._create_k8s_rack_if_not_exists(rack, dc_idx=current_dc_idx)
-            # TODO: 'self._get_rack_nodes(rack)' returns correct number only
+            # NOTE: appending a rack is not idempotent, so apply it once, without retries,
+            #       a retry after a lost response would create a duplicate rack
+            if rack_operations := self._get_k8s_rack_creation_operations(rack, dc_idx=current_dc_idx):
+                self._apply_scylla_cluster_patch(rack_operations, dc_idx=current_dc_idx)
+            # NOTE: collect the rest of the ScyllaCluster spec changes to apply them using single API call
+            spec_operations = []
+            # TODO: number of the registered rack nodes is correct only
             #       when there are no decommissioned, by nodetool, nodes.
             #       Having 1 decommissioned node we do not change node count.
             #       Having 2 decommissioned nodes we will reduce node count.
-            current_members = len(self._get_rack_nodes(rack, dc_idx=current_dc_idx))
+            current_members = rack_members[(current_dc_idx, rack)]
             # NOTE: update the 'spec.externalSeeds' field only for the very first pod in a second+ region.
             dc_podip_mapping, is_external_seeds_set = {}, False
             if current_dc_idx > 0:
@@ -2836,12 +3096,13 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
                     assert dc_podip_mapping[0], (
                         "Couldn't not find IP addresses of the nodes from the first DC (dc_idx=0)"
                         f" to be used as 'external seeds' for the pods of another DC (dc_idx={current_dc_idx})")
-                    self.replace_scylla_cluster_value(
-                        "/spec/externalSeeds", dc_podip_mapping[0], dc_idx=current_dc_idx)
+                    spec_operations.append(
+                        {"op": "replace", "path": "/spec/externalSeeds", "value": dc_podip_mapping[0]})
                     is_external_seeds_set = True
             total_dc_members = current_members + node_count_in_dc
-            self.replace_scylla_cluster_value(
-                f"/spec/datacenter/racks/{rack}/members", total_dc_members, dc_idx=current_dc_idx)
+            spec_operations.append(
+                {"op": "replace", "path": f"/spec/datacenter/racks/{rack}/members", "value": total_dc_members})
+            self.patch_scylla_cluster(spec_operations, dc_idx=current_dc_idx)
             new_nodes.extend(super().add_nodes(
                 count=node_count_in_dc, ec2_user_data=ec2_user_data, dc_idx=current_dc_idx, rack=rack,
                 enable_auto_bootstrap=enable_auto_bootstrap))
@@ -2883,14 +3144,15 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
                     pods_to_wait=node_count_in_dc, total_pods=total_dc_members, dc_idx=current_dc_idx)
         return new_nodes
 
-    def _create_k8s_rack_if_not_exists(self, rack: int, dc_idx: int):
-        if self.get_scylla_cluster_value(f'/spec/datacenter/racks/{rack}', dc_idx=dc_idx) is not None:
-            return
+    def _get_k8s_rack_creation_operations(self, rack: int, dc_idx: int) -> List[dict]:
+        racks = self.get_scylla_cluster_plain_value('/spec/datacenter/racks', dc_idx=dc_idx)
+        if rack < len(racks):
+            return []
         # Create new rack of very first rack of the cluster
-        new_rack = self.get_scylla_cluster_plain_value('/spec/datacenter/racks/0', dc_idx=dc_idx)
+        new_rack = racks[0]
         new_rack['members'] = 0
         new_rack['name'] = f'{new_rack["name"]}-{rack}'
-        self.add_scylla_cluster_value('/spec/datacenter/racks', new_rack, dc_idx=dc_idx)
+        return [{"op": "add", "path": "/spec/datacenter/racks/-", "value": new_rack}]
 
     def _delete_k8s_rack(self, rack: int, dc_idx: int):
         racks = self.get_scylla_cluster_plain_value('/spec/datacenter/racks/', dc_idx=dc_idx)
@@ -2914,10 +3176,8 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
         with adaptive_timeout(operation=Operations.DECOMMISSION, node=node):
             self.replace_scylla_cluster_value(
                 f"/spec/datacenter/racks/{rack}/members", current_members - 1, dc_idx=dc_idx)
-            self.k8s_clusters[node.dc_idx].kubectl(
-                f"wait --timeout={timeout}s --for=delete pod {node.name}",
-                namespace=self.namespace,
-                timeout=timeout + 10)
+            self.k8s_clusters[node.dc_idx].get_objects_reflector_thread(
+                "list_namespaced_pod", namespace=self.namespace).wait_for_object_deletion(node.name, timeout=timeout)
         self.terminate_node(node, scylla_shards=scylla_shards)
         shutil.move(node.system_log, os.path.join(
             node.logdir, f"system_{datetime.now().strftime('%y_%m_%d_%H_%M_%S')}.log"))
@@ -2934,21 +3194,21 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
         if not self.nodes:
             return True
 
-        @timeout_wrapper(
-            timeout=self.nodes[0].pod_replace_timeout * 2 * 60,
-            sleep_time=self.PodContainerClass.pod_readiness_delay)
-        def wait_till_any_node_get_new_image(nodes_with_old_image: list):
-            for node in nodes_with_old_image.copy():
-                # NOTE: 'node.image' may be 'docker.io/scylladb/scylla:4.5.3'
-                #       as well as 'scylladb/scylla:4.5.3'
-                if node.image.endswith(new_image):
-                    nodes_with_old_image.remove(node)
-                    return True
-            raise RuntimeError('No node was upgraded')
-
-        nodes = self.nodes.copy()
-        while nodes:
-            wait_till_any_node_get_new_image(nodes)
+        def get_upgraded_pod_names(pods: list) -> set:
+            # NOTE: image may be 'docker.io/scylladb/scylla:4.5.3' as well as 'scylladb/scylla:4.5.3'
+            return {pod.metadata.name for pod in pods if any(
+                status.name == self.container and status.image.endswith(new_image)
+                for status in (pod.status.container_statuses or ()))}
+
+        # NOTE: wait for the pods' images to be changed using the namespace's watch cache
+        #       instead of polling each pod one by one
+        for dc_idx, k8s_cluster in enumerate(self.k8s_clusters):
+            node_names = {node.name for node in self.nodes if node.dc_idx == dc_idx}
+            if not node_names:
+                continue
+            k8s_cluster.get_objects_reflector_thread("list_namespaced_pod", namespace=self.namespace).wait_for_objects(
+                is_ready=lambda pods, node_names=node_names: node_names <= get_upgraded_pod_names(pods),
+                timeout=self.nodes[0].pod_replace_timeout * 2 * 60 * len(node_names))
 
         self.wait_for_pods_readiness(len(self.nodes), len(self.nodes))
 
@@ -2962,13 +3222,21 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
         # TODO: make prometheus check be secure
         self.log.debug('Check kubernetes monitoring health')
         with ClusterHealthValidatorEvent() as kmh_event:
-            for k8s_cluster in self.k8s_clusters:
+            for dc_idx, k8s_cluster in enumerate(self.k8s_clusters):
                 try:
                     prometheus_ip = k8s_cluster.get_prometheus_ip(
                         cluster_name=self.scylla_cluster_name, namespace=self.namespace)
-                    PrometheusDBStats(host=prometheus_ip, port=k8s_cluster.prometheus_port, protocol='https')
+                    # NOTE: Prometheus client fetches the server configuration when gets created,
+                    #       so reuse it while the server IP address stays the same
+                    prometheus_db_stats = self._k8s_prometheus_db_stats.get(dc_idx)
+                    if prometheus_db_stats is None or prometheus_db_stats.host != prometheus_ip:
+                        self._k8s_prometheus_db_stats[dc_idx] = PrometheusDBStats(
+                            host=prometheus_ip, port=k8s_cluster.prometheus_port, protocol='https')
+                    else:
+                        prometheus_db_stats.ping()
                     kmh_event.message = "Kubernetes monitoring health checks have successfully been finished"
                 except Exception as exc:  # noqa: BLE001
+                    self._k8s_prometheus_db_stats.pop(dc_idx, None)
                     ClusterHealthValidatorEvent.MonitoringStatus(
                         error=f'Failed to connect to K8S prometheus server (namespace={self.namespace}) at '
                         f'{prometheus_ip}:{k8s_cluster.prometheus_port}, due to the: \n'
@@ -2986,25 +3254,27 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):
                 self.log.warning(
                     "No DB nodes specified for the restart in the '%s' K8S cluster", k8s_cluster.name)
                 continue
-            patch_data = {"spec": {"forceRedeploymentReason": f"Triggered at {time.time()}"}}
-            k8s_cluster.kubectl(
-                f"patch scyllacluster {self.scylla_cluster_name} --type merge -p '{json.dumps(patch_data)}'",
-                namespace=self.namespace)
-
-            # NOTE: sleep for some time to avoid races.
-            #       We do not waste time here, because waiting for Scylla pods restart takes minutes.
-            time.sleep(10)
+            # NOTE: remember generations of the racks before the change to avoid races with the operator,
+            #       which updates the statefulsets asynchronously. The list must be consistent, not cached one.
+            statefulsets = KubernetesOps.list_statefulsets(
+                k8s_cluster, namespace=self.namespace, resource_version=None,
+                label_selector=f"scylla/cluster={self.scylla_cluster_name}")
+            self._k8s_scylla_cluster_api(dc_idx=i).patch(
+                body={"spec": {"forceRedeploymentReason": f"Triggered at {time.time()}"}},
+                name=self.scylla_cluster_name,
+                namespace=self.namespace,
+                content_type=MERGE_PATCH_TYPE)
 
             readiness_timeout = self.get_nodes_reboot_timeout(len(current_k8s_cluster_nodes))
-            statefulsets = KubernetesOps.list_statefulsets(k8s_cluster, namespace=self.namespace)
             if random_order:
+                # NOTE: await the racks one by one in random order
                 random.shuffle(statefulsets)
-            for statefulset in statefulsets:
-                k8s_cluster.kubectl(
-                    f"rollout status statefulset/{statefulset.metadata.name} "
-                    f"--watch=true --timeout={readiness_timeout}m",
-                    namespace=self.namespace,
-                    timeout=readiness_timeout * 60 + 10)
+                for statefulset in statefulsets:
+                    self.wait_for_statefulsets_rollout(
+                        k8s_cluster, [statefulset], timeout=readiness_timeout, wait_for_spec_change=True)
+            else:
+                self.wait_for_statefulsets_rollout(
+                    k8s_cluster, statefulsets, timeout=readiness_timeout, wait_for_spec_change=True)
             k8s_cluster.scylla_restart_required = False
 
     def prefill_cluster(self, dataset_name: str):
@@ -3203,3 +3473,62 @@ def get_tags_from_params(params: dict) -> Dict[str, str]:
                 "Please, double-check that GKE cluster gets deleted either by SCT or manually.")
             tags["keep"] = "alive"
     return tags
+
+
+def calculate_scylla_cpu_limit(cpu_capacity: float, tenants_number: int) -> int:
+    """Calculate per-tenant Scylla CPU limit occupying all the CPUs left by other containers of a K8S node."""
+    # TODO: Remove reduction logic after
+    #       https://github.com/scylladb/scylla-operator/issues/384 is fixed
+    cpu_limit = int(
+        cpu_capacity
+        - OPERATOR_CONTAINERS_RESOURCES['cpu'] * tenants_number
+        - COMMON_CONTAINERS_RESOURCES['cpu']
+        - SCYLLA_MANAGER_AGENT_RESOURCES['cpu'] * tenants_number
+    )
+    # NOTE: we should use at max 7 from each 8 cores.
+    #       i.e 28/32 , 21/24 , 14/16 and 7/8
+    new_cpu_limit = math.ceil(cpu_limit / 8) * 7
+    cpu_limit = min(cpu_limit, new_cpu_limit)
+    return cpu_limit // tenants_number or 1
+
+
+def calculate_scylla_memory_limit(memory_capacity: float, tenants_number: int) -> float:
+    """Calculate per-tenant Scylla memory limit occupying all the memory left by other containers of a K8S node."""
+    memory_limit = (
+        memory_capacity
+        - OPERATOR_CONTAINERS_RESOURCES['memory'] * tenants_number
+        - COMMON_CONTAINERS_RESOURCES['memory']
+        - SCYLLA_MANAGER_AGENT_RESOURCES['memory'] * tenants_number
+    )
+    return memory_limit / tenants_number
+
+
+def node_config_change_mount_point(obj):
+    if obj["kind"] != "NodeConfig":
+        return
+    # NOTE: this modifier must run only for 'static' local volume provisioner
+    obj["spec"]['localDiskSetup']['mounts'][0]['mountPoint'] = '/mnt/raid-disks/disk0'
+
+
+def node_setup_for_dynamic_local_volume_provisioner_modifier(obj):
+    if obj["kind"] != "DaemonSet":
+        return
+    for container_data in obj["spec"]["template"]["spec"]["containers"]:
+        if container_data["name"] in ("pv-setup", "node-setup"):
+            # NOTE: disable custom node- and pv- setups using dynamic volume provisioner
+            container_data["command"] = ["/bin/bash", "-c", "--"]
+            container_data["args"] = ["while true; do sleep 3600; done"]
+
+
+def encode_k8s_secret_data(data: dict) -> dict:
+    """Serialize values of the secret data to JSON and base64-encode them as K8S secrets expect."""
+    return {key: base64.b64encode(json.dumps(value).encode()).decode("ascii") for key, value in data.items()}
+
+
+def convert_k8s_resource_field_to_plain_data(value: Any) -> Any:
+    """Convert a value taken from a dynamic client's resource to basic python data types."""
+    if isinstance(value, k8s.dynamic.resource.ResourceField):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [convert_k8s_resource_field_to_plain_data(item) for item in value]
+    return value
@@ -143,9 +143,7 @@ def deploy_k8s_eks_cluster(k8s_cluster) -> None:
     k8s_cluster.wait_all_node_pools_to_be_ready()
     k8s_cluster.configure_ebs_csi_driver()
 
-    k8s_cluster.deploy_cert_manager(pool_name=k8s_cluster.AUXILIARY_POOL_NAME)
-    if params.get("k8s_enable_sni"):
-        k8s_cluster.deploy_ingress_controller(pool_name=k8s_cluster.AUXILIARY_POOL_NAME)
+    k8s_cluster.deploy_cert_manager_and_ingress_controller(pool_name=k8s_cluster.AUXILIARY_POOL_NAME)
     k8s_cluster.deploy_scylla_operator()
     if params.get("k8s_use_chaos_mesh"):
         k8s_cluster.chaos_mesh.initialize()
@@ -379,7 +377,7 @@ class EksCluster(KubernetesCluster, EksClusterCleanupMixin):
         if self.is_performance_tuning_enabled:
             # NOTE: add performance tuning related pods only if we expect it to be.
             #       When we have tuning disabled it must not exist.
-            allowed_labels_on_scylla_node.extend(self.perf_pods_labels)
+            allowed_labels_on_scylla_node.extend(self.PERF_PODS_LABELS)
         if self.params.get('k8s_use_chaos_mesh'):
             allowed_labels_on_scylla_node.append(('app.kubernetes.io/component', 'chaos-daemon'))
         if self.params.get("k8s_local_volume_provisioner_type") != 'static':
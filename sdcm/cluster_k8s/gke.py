@@ -25,7 +25,7 @@ from google.cloud import compute_v1
 from sdcm import sct_abs_path, cluster
 from sdcm.wait import exponential_retry
 from sdcm.utils.common import list_instances_gce, gce_meta_to_dict
-from sdcm.utils.k8s import ApiCallRateLimiter, TokenUpdateThread
+from sdcm.utils.k8s import ApiCallRateLimiter, TokenUpdateThread, YAML_SAFE_LOADER
 from sdcm.utils.gce_utils import (
     GcloudContainerMixin,
     GcloudContextManager,
@@ -91,9 +91,7 @@ def deploy_k8s_gke_cluster(k8s_cluster) -> None:
     # So, deploy apps specific to default-pool in between above mentioned deployment steps.
     k8s_cluster.set_nodeselector_for_deployments(
         pool_name=k8s_cluster.AUXILIARY_POOL_NAME, namespace="kube-system")
-    k8s_cluster.deploy_cert_manager(pool_name=k8s_cluster.AUXILIARY_POOL_NAME)
-    if params.get("k8s_enable_sni"):
-        k8s_cluster.deploy_ingress_controller(pool_name=k8s_cluster.AUXILIARY_POOL_NAME)
+    k8s_cluster.deploy_cert_manager_and_ingress_controller(pool_name=k8s_cluster.AUXILIARY_POOL_NAME)
     k8s_cluster.deploy_scylla_operator()
     if params.get("k8s_use_chaos_mesh"):
         k8s_cluster.chaos_mesh.initialize()
@@ -223,12 +221,13 @@ class GkeNodePool(CloudK8sNodePool):
     @property
     def instance_group_name(self) -> str:
         try:
-            group_link = yaml.safe_load(
+            group_link = yaml.load(
                 self.k8s_cluster.gcloud.run(
                     f'container node-pools describe {self.name} '
                     f'--region {self.gce_region} '
                     f'--project {self.gce_project} '
-                    f'--cluster {self.k8s_cluster.short_cluster_name}')
+                    f'--cluster {self.k8s_cluster.short_cluster_name}'),
+                Loader=YAML_SAFE_LOADER,
             ).get('instanceGroupUrls')[0]
             return group_link.split('/')[-1]
         except Exception as exc:  # noqa: BLE001
@@ -303,10 +302,11 @@ class GkeCluster(KubernetesCluster):
         self.gke_cluster_created = False
         self._authenticate_in_gcloud()
         self.api_call_rate_limiter = ApiCallRateLimiter(
-            rate_limit=GKE_API_CALL_RATE_LIMIT,
+            rate_limit=self.params.get("k8s_client_qps") or GKE_API_CALL_RATE_LIMIT,
             queue_size=GKE_API_CALL_QUEUE_SIZE,
             urllib_retry=GKE_URLLIB_RETRY,
             urllib_backoff_factor=GKE_URLLIB_BACKOFF_FACTOR,
+            burst=self.params.get("k8s_client_burst") or 1,
         )
         self.api_call_rate_limiter.start()
 
@@ -342,7 +342,7 @@ class GkeCluster(KubernetesCluster):
         if self.is_performance_tuning_enabled:
             # NOTE: add performance tuning related pods only if we expect it to be.
             #       When we have tuning disabled it must not exist.
-            allowed_labels_on_scylla_node.extend(self.perf_pods_labels)
+            allowed_labels_on_scylla_node.extend(self.PERF_PODS_LABELS)
         if self.params.get('k8s_use_chaos_mesh'):
             allowed_labels_on_scylla_node.append(('app.kubernetes.io/component', 'chaos-daemon'))
         if self.params.get("k8s_local_volume_provisioner_type") != 'static':
@@ -43,7 +43,7 @@ from sdcm.cluster_k8s import (
     SCYLLA_MANAGER_AGENT_RESOURCES,
     SCYLLA_MANAGER_AGENT_VERSION_IN_SCYLLA_MANAGER,
 )
-from sdcm.utils.k8s import TokenUpdateThread, HelmValues
+from sdcm.utils.k8s import TokenUpdateThread, HelmValues, YAML_SAFE_LOADER
 from sdcm.utils.k8s.chaos_mesh import ChaosMesh
 from sdcm.utils.decorators import retrying
 from sdcm.utils.docker_utils import docker_hub_login
@@ -330,7 +330,7 @@ class MinimalClusterBase(KubernetesCluster, metaclass=abc.ABCMeta):
     @cached_property
     def minio_images(self):
         with open(LOCAL_MINIO_DIR + '/values.yaml', mode='r', encoding='utf8') as minio_config_stream:
-            minio_config = yaml.safe_load(minio_config_stream)
+            minio_config = yaml.load(minio_config_stream, Loader=YAML_SAFE_LOADER)
             return [
                 f"{minio_config['image']['repository']}:{minio_config['image']['tag']}",
                 f"{minio_config['mcImage']['repository']}:{minio_config['mcImage']['tag']}",
@@ -339,7 +339,7 @@ class MinimalClusterBase(KubernetesCluster, metaclass=abc.ABCMeta):
     @cached_property
     def static_local_volume_provisioner_image(self):
         with open(LOCAL_PROVISIONER_FILE, mode='r', encoding='utf8') as provisioner_config_stream:
-            for doc in yaml.safe_load_all(provisioner_config_stream):
+            for doc in yaml.load_all(provisioner_config_stream, Loader=YAML_SAFE_LOADER):
                 if doc["kind"] != "DaemonSet":
                     continue
                 try:
@@ -370,7 +370,7 @@ class MinimalClusterBase(KubernetesCluster, metaclass=abc.ABCMeta):
                 if not subfile.endswith('yaml'):
                     continue
                 with open(os.path.join(root, subfile), mode='r', encoding='utf8') as file_stream:
-                    for doc in yaml.safe_load_all(file_stream):
+                    for doc in yaml.load_all(file_stream, Loader=YAML_SAFE_LOADER):
                         if doc["kind"] != "Deployment":
                             continue
                         for container in doc["spec"]["template"]["spec"]["containers"]:
@@ -406,6 +406,7 @@ class MinimalClusterBase(KubernetesCluster, metaclass=abc.ABCMeta):
             self.start_k8s_software()
         self.create_kubectl_config()
         self.start_scylla_pods_ip_change_tracker_thread()
+        self.start_nodes_reflector_thread()
         if self.test_config.REUSE_CLUSTER:
             return
         self.on_deploy_completed()
@@ -232,6 +232,13 @@ class PrometheusDBStats:
             LOGGER.error("Prometheus returned error: %s", result)
         return None
 
+    def ping(self) -> None:
+        """Check that the Prometheus server is healthy without fetching any data from it."""
+        kwargs = {'verify': False} if self.protocol == 'https' else {}
+        response = requests.get("{}://{}:{}/-/healthy".format(
+            self.protocol, normalize_ipv6_url(self.host), self.port), timeout=30, **kwargs)
+        response.raise_for_status()
+
     def get_configuration(self):
         result = self.request(url="{}://{}:{}/api/v1/status/config".format(
             self.protocol, normalize_ipv6_url(self.host), self.port))
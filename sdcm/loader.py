@@ -25,6 +25,8 @@ from sdcm.utils.hdrhistogram import (
 )
 
 LOGGER = logging.getLogger(__name__)
+KEYSPACE_REGEX = re.compile(r'Keyspace:\s(\S+)')
+SCYLLA_BENCH_METRICS_LINE_REGEX = re.compile(r'\s*(?:\d+(?:\.\d*)?|\.\d+)s(?:\s|$)')
 
 
 class MetricsPosition(NamedTuple):
@@ -62,7 +64,10 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
         self.loader_idx = loader_idx
         self.cpu_idx = cpu_idx
         self.metrics_positions = self.metrics_position_in_log()
+        # NOTE: map metric names to their columns once instead of getting the attributes for each log line
+        self.metrics_columns = self.metrics_positions._asdict() if self.metrics_positions else {}
         self.keyspace = keyspace
+        self._labeled_metrics = {}
         self.init()
 
     def init(self):
@@ -76,12 +81,20 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
     def create_metrix_gauge(self) -> str:
         ...
 
+    def get_labeled_metric(self, tag, name: str):
+        # NOTE: keep labeled children of the gauge, only type and keyspace of them change from sample to sample
+        key = (tag, name, str(self.keyspace))
+        if (labeled_metric := self._labeled_metrics.get(key)) is None:
+            labeled_metric = self._labeled_metrics[key] = self.stress_metric.labels(
+                tag, self.instance_name, self.loader_idx, self.cpu_idx, name, self.keyspace)
+        return labeled_metric
+
     def set_metric(self, name: str, value: float) -> None:
-        self.stress_metric.labels(0, self.instance_name, self.loader_idx, self.cpu_idx, name, self.keyspace).set(value)
+        self.get_labeled_metric(0, name).set(value)
 
     def clear_metrics(self) -> None:
         if self.stress_metric:
-            for metric_name in self.metrics_positions._fields:
+            for metric_name in self.metrics_columns:
                 self.set_metric(metric_name, 0.0)
 
     @staticmethod
@@ -95,17 +108,20 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
         ...
 
     def get_metric_value(self, columns: list, metric_name: str) -> str:
+        if (column := self.metrics_columns.get(metric_name)) is None:
+            return ''
         try:
-            value = columns[getattr(self.metrics_positions, metric_name)]
-        except AttributeError:
-            value = ''
-        except (ValueError, IndexError) as exc:
+            value = columns[column]
+        except IndexError as exc:
             value = ''
             LOGGER.warning("Failed to get %s metric value. Error: %s", metric_name, str(exc))
 
         return value
 
     def run(self):
+        # NOTE: don't try to get metrics absent in the log format for each line
+        metric_names = [metric for metric in self.METRIC_NAMES if metric in self.metrics_columns]
+        has_ops, has_errors = 'ops' in self.metrics_columns, 'errors' in self.metrics_columns
         while not self.stopped():
             exists = os.path.isfile(self.stress_log_filename)
             if not exists:
@@ -121,21 +137,18 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
 
                 cols = self.split_line(line=line)
 
-                for metric in self.METRIC_NAMES:
+                for metric in metric_names:
                     if metric_value := self.get_metric_value(columns=cols, metric_name=metric):
                         self.set_metric(metric, convert_metric_to_ms(str(metric_value)))
 
-                if ops := self.get_metric_value(columns=cols, metric_name='ops'):
+                if has_ops and (ops := self.get_metric_value(columns=cols, metric_name='ops')):
                     self.set_metric('ops', float(ops))
 
-                if errors := self.get_metric_value(columns=cols, metric_name='errors'):
+                if has_errors and (errors := self.get_metric_value(columns=cols, metric_name='errors')):
                     self.set_metric('errors', int(errors))
 
 
 class CassandraStressExporter(StressExporter):
-    def init(self):
-        self.keyspace_regex = re.compile(r'.*Keyspace:\s(.*?)$')
-
     def create_metrix_gauge(self):
         gauge_name = f'sct_cassandra_stress_{self.stress_operation}_gauge'
         if gauge_name not in self.METRICS_GAUGES:
@@ -150,12 +163,11 @@ class CassandraStressExporter(StressExporter):
                                lat_max=10, errors=13)
 
     def skip_line(self, line: str) -> bool:
-        if not self.keyspace:
-            if 'Keyspace:' in line:
-                self.keyspace = self.keyspace_regex.match(line).groups()[0]
-                return True
+        if not self.keyspace and 'Keyspace:' in line and (match := KEYSPACE_REGEX.search(line)):
+            self.keyspace = match.group(1)
+            return True
         # If line starts with 'total,' - skip this line
-        return not 'total,' in line
+        return 'total,' not in line
 
     @staticmethod
     def split_line(line: str) -> list:
@@ -188,9 +200,6 @@ class LatteKeyspaceHolder:
 
 
 class LatteExporter(StressExporter):
-    def init(self):
-        self.keyspace_regex = re.compile(r'.*Keyspace:\s(.*?)$')
-
     def create_metrix_gauge(self):
         gauge_name = f'sct_latte_{self.stress_operation}_gauge'
         if gauge_name not in self.METRICS_GAUGES:
@@ -219,8 +228,8 @@ class LatteExporter(StressExporter):
         )
 
     def skip_line(self, line: str) -> bool:
-        if not self.keyspace and self.keyspace_regex.match(line):
-            ks = self.keyspace_regex.match(line).groups()[0].strip()
+        if not self.keyspace and (match := KEYSPACE_REGEX.search(line)):
+            ks = match.group(1)
             LOGGER.debug("Found following keyspace in the latte command: '%s'", ks)
             self.keyspace.set_value(ks)
             return True
@@ -284,8 +293,7 @@ class CassandraStressHDRExporter(StressExporter):
         return True
 
     def set_metric(self, name: str, value: float) -> None:
-        self.stress_metric.labels(self.current_line_hdr_tag, self.instance_name, self.loader_idx,
-                                  self.cpu_idx, name, self.keyspace).set(value)
+        self.get_labeled_metric(self.current_line_hdr_tag, name).set(value)
 
     def split_line(self, line: str) -> list:
         summary_data = make_hdrhistogram_summary_from_log_line(
@@ -324,7 +332,6 @@ class CqlStressCassandraStressExporter(StressExporter):
     def __init__(self, instance_name: str, metrics: NemesisMetrics, stress_operation: str, stress_log_filename: str,
                  loader_idx: int, cpu_idx: int = 1):
 
-        self.keyspace_regex = re.compile(r'.*Keyspace:\s(.*?)$')
         self.do_skip = True
         super().__init__(instance_name, metrics, stress_operation, stress_log_filename, loader_idx,
                          cpu_idx)
@@ -349,9 +356,8 @@ class CqlStressCassandraStressExporter(StressExporter):
                                lat_max=7, errors=9)
 
     def skip_line(self, line: str) -> bool:
-        if not self.keyspace:
-            if 'Keyspace:' in line:
-                self.keyspace = self.keyspace_regex.match(line).groups()[0]
+        if not self.keyspace and 'Keyspace:' in line and (match := KEYSPACE_REGEX.search(line)):
+            self.keyspace = match.group(1)
 
         if "total ops ," in line:
             # Stats header has been printed - start collecting the metrics.
@@ -398,19 +404,11 @@ class ScyllaBenchStressExporter(StressExporter):
         #    Client compression:  true
         #    1.004777157s       2891    28910     0  67.829759ms   64.290815ms    58.327039ms    4.653055ms   3.244031µs   1.376255µs
 
-        line_splitted = (line or '').split()
-        if not line_splitted or not line_splitted[0].endswith('s'):
-            return True  # skip the line
-
-        try:
-            _ = float(line_splitted[0][:-1])
-            return False  # The line hold the metrics, don't skip the line
-        except ValueError:
-            return True  # skip the line
+        return not SCYLLA_BENCH_METRICS_LINE_REGEX.match(line or '')
 
     @staticmethod
     def split_line(line: str) -> list:
-        return [element.strip() for element in line.split()]
+        return line.split()
 
 
 class CassandraHarryStressExporter(StressExporter):
@@ -430,8 +428,9 @@ class CassandraHarryStressExporter(StressExporter):
                 [f'scylla_bench_stress_{self.stress_operation}', 'instance', 'loader_idx', 'cpu_idx', 'type', 'keyspace'])
         return gauge_name
 
-    def metrics_position_in_log(self) -> MetricsPosition:
-        pass
+    def metrics_position_in_log(self) -> None:
+        # NOTE: harry log has no per-interval metrics columns, only the reorder buffer lines are followed
+        return None
 
     def skip_line(self, line) -> bool:
         return not 'Reorder buffer size has grown up to' in line
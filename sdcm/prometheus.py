@@ -109,6 +109,14 @@ class NemesisMetrics:
             LOGGER.error('Cannot create metrics gauge: %s', ex)
         return None
 
+    @staticmethod
+    def create_histogram(name, desc, param_list):
+        try:
+            return prometheus_client.Histogram(name, desc, param_list)
+        except Exception as ex:  # noqa: BLE001
+            LOGGER.error('Cannot create metrics histogram: %s', ex)
+        return None
+
     def event_start(self, disrupt):
         try:
             self._disrupt_counter.labels(disrupt, START).inc()
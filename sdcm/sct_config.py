@@ -1051,6 +1051,14 @@ class SCTConfiguration(dict):
         dict(name="k8s_log_api_calls", env="SCT_K8S_LOG_API_CALLS", type=boolean,
              help="Defines whether the K8S API server logging must be enabled and "
                   "it's logs gathered. Be aware that it may be really huge set of data."),
+        dict(name="k8s_client_qps", env="SCT_K8S_QPS", type=float,
+             help="Rate limit (ops/s) of the SCT calls to the K8S API server. "
+                  "Applies only to the 'k8s-gke' backend, the only one which limits API calls rate. "
+                  "Backend-specific default is used when not set."),
+        dict(name="k8s_client_burst", env="SCT_K8S_BURST", type=int,
+             help="Number of the SCT calls to the K8S API server allowed to be done at once "
+                  "above the 'k8s_client_qps' rate, applies only to the 'k8s-gke' backend. "
+                  "Also defines minimal size of the API client connection pool on all the K8S backends."),
         dict(name="k8s_tenants_num", env="SCT_TENANTS_NUM", type=int,
              help="Number of Scylla clusters to create in the K8S cluster."),
 
@@ -64,7 +64,8 @@ class BaseEventsProcess(Generic[T_inbound_event, T_outbound_event], abc.ABC):
 
     def __init__(self, _registry: EventsProcessesRegistry):
         self._registry = _registry
-        self._events_counter = multiprocessing.Value(ctypes.c_uint32, 0)
+        # NOTE: the counter is updated by the events process itself only, so it doesn't need a lock
+        self._events_counter = multiprocessing.Value(ctypes.c_uint32, 0, lock=False)
 
         if isinstance(self, threading.Thread):
             self.stop_event = threading.Event()
@@ -117,11 +118,21 @@ class EventsProcessPipe(BaseEventsProcess[T_inbound_event, T_outbound_event], th
     def outbound_events(self, stop_event: StopEvent, events_counter: multiprocessing.Value) -> OutboundEventsGenerator:
         while not stop_event.is_set():
             try:
-                yield self.outbound_queue.get(timeout=self.outbound_queue_wait_timeout)
-                events_counter.value += 1
-                stop_event.wait(self.outbound_queue_events_rate)
+                event = self.outbound_queue.get(timeout=self.outbound_queue_wait_timeout)
             except queue.Empty:
-                pass
+                continue
+            # NOTE: drain already queued events without blocking waits, wait for new ones only when it's empty
+            while True:
+                yield event
+                events_counter.value += 1
+                if self.outbound_queue_events_rate:
+                    stop_event.wait(self.outbound_queue_events_rate)
+                if stop_event.is_set():
+                    break
+                try:
+                    event = self.outbound_queue.get_nowait()
+                except queue.Empty:
+                    break
 
 
 class EventsProcessProcess(BaseEventsProcess[T_inbound_event, T_outbound_event], multiprocessing.Process):
@@ -150,10 +161,10 @@ class EventsProcessesRegistry:
         LOGGER.debug("New process `%s' started at %s", name, self)
 
     def get_events_process(self, name: str) -> EventsProcess:
-        with self._registry_dict_lock:
-            # this happens too many times during SCT run, leaving it for when debugging is needed
-            # LOGGER.debug("Get process `%s' from %s", name, self)
-            return self._registry_dict.get(name)
+        # this happens too many times during SCT run, leaving it for when debugging is needed
+        # LOGGER.debug("Get process `%s' from %s", name, self)
+        # NOTE: a single dict lookup is atomic, so the lock is needed for the writers only
+        return self._registry_dict.get(name)
 
     def __str__(self):
         return f"{type(self).__name__}[log_dir={self.log_dir},id=0x{id(self):x},default={self.default}]"
@@ -1785,9 +1785,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
         else:
             k8s_cluster.install_dynamic_local_volume_provisioner(node_pools=scylla_pool)
 
-        k8s_cluster.deploy_cert_manager(pool_name=k8s_cluster.AUXILIARY_POOL_NAME)
-        if self.params.get("k8s_enable_sni"):
-            k8s_cluster.deploy_ingress_controller(pool_name=k8s_cluster.AUXILIARY_POOL_NAME)
+        k8s_cluster.deploy_cert_manager_and_ingress_controller(pool_name=k8s_cluster.AUXILIARY_POOL_NAME)
         k8s_cluster.deploy_scylla_operator(pool_name=k8s_cluster.AUXILIARY_POOL_NAME)
         if self.params.get('use_mgmt'):
             k8s_cluster.deploy_scylla_manager(pool_name=k8s_cluster.AUXILIARY_POOL_NAME)
@@ -3118,9 +3116,16 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
 
     @silence()
     def stop_resources_stop_tasks_threads(self, cluster):
-        # TODO: this should be run in parallel
-        for node in cluster.nodes:
-            node.stop_task_threads()
+        if cluster.nodes:
+            # NOTE: each node waits for its own threads to stop, so do it concurrently
+            #       to make wall time be bounded by the slowest node instead of the sum over all nodes
+            # NOTE: don't let a failed or timed out node skip waiting for the threads of all the nodes
+            results = ParallelObject(
+                objects=cluster.nodes, timeout=300, num_workers=min(len(cluster.nodes), 32), disable_logging=True,
+            ).run(lambda node: node.stop_task_threads(), ignore_exceptions=True)
+            for result in results:
+                if result.exc:
+                    self.log.error("Failed to stop task threads of %s: %r", result.obj, result.exc)
         for node in cluster.nodes:
             with silence(parent=self, name=f'stop_resources_stop_tasks_threads(cluster={str(cluster)})'):
                 node.wait_till_tasks_threads_are_stopped()
@@ -3303,6 +3308,9 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
             self.collect_logs()
         self.collect_ssl_conf()
         self.clean_resources()
+        for k8s_cluster in self.k8s_clusters:
+            with silence(parent=self, name=f'Stopping K8S objects reflectors of {k8s_cluster.region_name}'):
+                k8s_cluster.stop_reflector_threads()
         if self.create_stats:
             self.update_test_with_errors()
         time.sleep(1)  # Sleep is needed to let final event being saved into files
@@ -24,7 +24,6 @@ import time
 import datetime
 import errno
 import threading
-import select
 import shutil
 import copy
 import string
@@ -101,6 +100,7 @@ SCYLLA_AMI_OWNER_ID_LIST = ["797456418907", "158855661827"]
 SCYLLA_GCE_IMAGES_PROJECT = "scylla-images"
 CREATE_TABLE_REGEX = re.compile(
     r'CREATE\s+TABLE\s+(?P<keyspace>[^\s.]+)\.(?P<table>[^\s(]+)\s*\([^)]+\)(?P<options>[^;]*)')
+METRIC_WITH_UNITS_REGEX = re.compile(r"^((?P<hour>\d+)h)?((?P<min>\d+)m)?(?P<sec>\d+\.?(\d+)?)(?P<units>s|ms|µs)?")
 
 
 class KeyBasedLock():
@@ -117,6 +117,51 @@ class KeyBasedLock():
             return self.key_lock_mapping[hashable_key]
 
 
+class ReadWriteLock:
+    """Reader-preferring lock which allows either many concurrent readers or a single writer.
+
+    Writer part is reentrant and a writer is allowed to take the reader part too.
+    Upgrade of a reader to a writer is not supported and leads to a deadlock.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._writer_depth = 0
+
+    @contextmanager
+    def reader(self):
+        with self._condition:
+            if self._writer != threading.get_ident():
+                self._condition.wait_for(lambda: self._writer is None)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def writer(self):
+        current_thread_id = threading.get_ident()
+        with self._condition:
+            if self._writer != current_thread_id:
+                self._condition.wait_for(lambda: self._writer is None and not self._readers)
+                self._writer = current_thread_id
+            self._writer_depth += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_depth -= 1
+                if not self._writer_depth:
+                    self._writer = None
+                    self._condition.notify_all()
+
+
 def deprecation(message):
     warnings.warn(message, DeprecationWarning, stacklevel=3)
 
@@ -1126,19 +1171,13 @@ class FileFollowerIterator():
     def __iter__(self):
         with open(self.filename, encoding="utf-8") as input_file:
             line = ''
-            poller = select.poll()
-            registered = False
             while not self.thread_obj.stopped():
-                if not registered:
-                    poller.register(input_file, select.POLLIN)
-                    registered = True
-                if poller.poll(100):
-                    line += input_file.readline()
-                if not line or not line.endswith('\n'):
+                # NOTE: regular files are always reported as readable by poll(), so just read buffered data
+                #       line by line and sleep only when the end of the file is reached
+                line += input_file.readline()
+                if not line.endswith('\n'):
                     time.sleep(0.1)
                     continue
-                poller.unregister(input_file)
-                registered = False
                 yield line
                 line = ''
             yield line
@@ -2170,9 +2209,17 @@ def convert_metric_to_ms(metric: str) -> float:
         else:
             return float(value)
 
-    pattern = r"^((?P<hour>\d+)h)?((?P<min>\d+)m)?(?P<sec>\d+\.?(\d+)?)(?P<units>s|ms|µs)?"
+    # NOTE: most of the values are plain numbers or numbers with single unit, so don't run the regex for them
+    if metric.replace('.', '', 1).isdigit():
+        return float(metric)
+    for units in ('ms', 'µs', 's'):
+        if metric.endswith(units):
+            value = metric[:-len(units)]
+            if value.replace('.', '', 1).isdigit():
+                return _convert_to_ms(units, float(value))
+            break
     try:
-        found = re.match(pattern, metric)
+        found = METRIC_WITH_UNITS_REGEX.match(metric)
         if found:
             parsed_values = found.groupdict()
             metric_converted = 0
@@ -2265,6 +2312,37 @@ def download_from_github(repo: str, tag: str, dst_dir: str):
             os.rename(os.path.join(base_dir, file), os.path.join(dst_dir, file))
 
 
+DOWNLOADS_CACHE_DIR = os.path.join(tempfile.gettempdir(), "sct-downloads")
+DOWNLOADS_CACHE_LOCK = KeyBasedLock()
+
+
+def get_cached_download_dir(name: str, download_func: Callable[[str], Any]) -> str:
+    """
+    Returns path to the cache directory with the 'name' which gets filled by the 'download_func' only once
+
+    'download_func' gets a path to the empty directory to put files to.
+    Content of the cached directory must not be changed by its users.
+    """
+    cache_dir = os.path.join(DOWNLOADS_CACHE_DIR, name)
+    with DOWNLOADS_CACHE_LOCK.get_lock(name):
+        if os.path.isdir(cache_dir):
+            LOGGER.debug("Use cached '%s' directory", cache_dir)
+            return cache_dir
+        os.makedirs(DOWNLOADS_CACHE_DIR, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f".{name}-", dir=DOWNLOADS_CACHE_DIR)
+        try:
+            download_func(tmp_dir)
+            # NOTE: rename is atomic, so other processes never see partially filled cache directory
+            os.rename(tmp_dir, cache_dir)
+        except OSError:
+            if not os.path.isdir(cache_dir):
+                raise
+            LOGGER.debug("'%s' directory has been cached by another process", cache_dir)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return cache_dir
+
+
 def walk_thru_data(data, path: str, separator: str = '/') -> Any:
     """Allows to get a value of an element in some data structure.
 
@@ -21,10 +21,15 @@ import logging
 import re
 import threading
 import multiprocessing
+import shlex
+import tarfile
+import subprocess
 import contextlib
+from collections import defaultdict
 from tempfile import NamedTemporaryFile
-from typing import Iterator, Optional, Union, Callable, List
-from functools import cached_property, partialmethod
+from typing import Iterable, Iterator, Optional, Union, Callable, List
+from copy import deepcopy
+from functools import cached_property, partial, partialmethod, lru_cache
 from pathlib import Path
 
 import kubernetes as k8s
@@ -38,11 +43,13 @@ from urllib3.exceptions import (
 )
 
 from sdcm.log import SDCMAdapter
+from sdcm.prometheus import NemesisMetrics
 from sdcm import sct_abs_path
 from sdcm.remote import LOCALRUNNER
 from sdcm.utils.common import walk_thru_data
 from sdcm.utils.decorators import timeout as timeout_decor, retrying
 from sdcm.utils.docker_utils import ContainerManager, Container
+from sdcm.utils.parallel_object import ParallelObject
 from sdcm.wait import wait_for
 
 
@@ -54,6 +61,7 @@ KUBECTL_TIMEOUT = 300  # seconds
 K8S_CONFIGS_PATH_SCT = sct_abs_path("sdcm/k8s_configs")
 
 JSON_PATCH_TYPE = "application/json-patch+json"
+MERGE_PATCH_TYPE = "application/merge-patch+json"
 
 LOGGER = logging.getLogger(__name__)
 K8S_MEM_CPU_RE = re.compile('^([0-9]+)([a-zA-Z]*)$')
@@ -73,13 +81,41 @@ K8S_CPU_CONVERSION_MAP = {
 
 logging.getLogger("kubernetes.client.rest").setLevel(logging.INFO)
 
+# NOTE: libyaml based loader is much faster, use it when PyYAML is built with it
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_SAFE_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# NOTE: allow API server to serve a list from its watch cache instead of doing a quorum read from etcd,
+#       use it where a slightly stale result is fine
+K8S_WATCH_CACHE_LIST_KWARGS = {"resource_version": "0", "resource_version_match": "NotOlderThan"}
+
+# NOTE: kinds used in 'kubectl wait' commands which can be awaited using the watch API, other ones go to kubectl
+KUBECTL_WAIT_API_RESOURCES = {
+    kind_alias: api_resource
+    for kind_aliases, api_resource in (
+        (("crd", "crds", "customresourcedefinition", "customresourcedefinitions"),
+         ("apiextensions.k8s.io/v1", "CustomResourceDefinition")),
+        (("scyllacluster", "scyllaclusters"), ("scylla.scylladb.com/v1", "ScyllaCluster")),
+        (("scylladbmonitoring", "scylladbmonitorings"), ("scylla.scylladb.com/v1alpha1", "ScyllaDBMonitoring")),
+        (("nodeconfig", "nodeconfigs"), ("scylla.scylladb.com/v1alpha1", "NodeConfig")),
+    )
+    for kind_alias in kind_aliases
+}
+
+# NOTE: files of the Scylla container gathered with logs, paths in the container and in the log dir
+SCYLLA_CONTAINER_FILES_TO_GATHER = {
+    "var/lib/scylla/io_properties.yaml": "io_properties.yaml",
+    "etc/scylla.d": "etc-scylla-d",
+    "etc/scylla": "etc-scylla",
+}
+
 
 class ApiLimiterClient(k8s.client.ApiClient):
     _api_rate_limiter: 'ApiCallRateLimiter' = None
 
     def call_api(self, *args, **kwargs):
         if self._api_rate_limiter:
-            self._api_rate_limiter.wait()
+            self._api_rate_limiter.wait(verb=args[1] if len(args) > 1 else kwargs.get("method", "api"))
         return super().call_api(*args, **kwargs)
 
     def bind_api_limiter(self, instance: 'ApiCallRateLimiter'):
@@ -92,7 +128,7 @@ class ApiLimiterRetry(Retry):
     def sleep(self, *args, **kwargs):
         super().sleep(*args, **kwargs)
         if self._api_rate_limiter:
-            self._api_rate_limiter.wait()
+            self._api_rate_limiter.wait(verb="retry")
 
     def new(self, *args, **kwargs):
         result = super().new(*args, **kwargs)
@@ -105,22 +141,36 @@ class ApiLimiterRetry(Retry):
 
 
 class ApiCallRateLimiter(threading.Thread):
-    """Simple and not very accurate rate limiter.
+    """Token bucket based rate limiter.
 
-    Allow 1 call each `1 / rate_limit' seconds interval.
+    Tokens get refilled with the `rate_limit' ops/s speed up to the `burst' number.
     If some call not able to start after `queue_size / rate_limit' seconds then raise `queue.Full' for caller.
     """
+    DURATION_METRIC = None
+    _duration_metric_lock = threading.Lock()
 
-    def __init__(self, rate_limit: float, queue_size: int, urllib_retry: int, urllib_backoff_factor: float):
+    def __init__(self, rate_limit: float, queue_size: int, urllib_retry: int, urllib_backoff_factor: float,
+                 burst: int = 1):
         super().__init__(name=type(self).__name__, daemon=True)
-        self._lock = multiprocessing.Semaphore(value=1)
+        self._condition = threading.Condition()
         self._requests_pause_event = multiprocessing.Event()
         self.release_requests_pause()
         self.rate_limit = rate_limit  # ops/s
         self.queue_size = queue_size
+        self.burst = burst
         self.urllib_retry = urllib_retry
         self.urllib_backoff_factor = urllib_backoff_factor
         self.running = threading.Event()
+        self._tokens = float(burst)
+        self._last_refill_ns = time.monotonic_ns()
+        # NOTE: the metric is shared by all the limiters, so register it once on the first limiter creation,
+        #       limiters of the different K8S clusters may be created concurrently
+        with ApiCallRateLimiter._duration_metric_lock:
+            if ApiCallRateLimiter.DURATION_METRIC is None:
+                ApiCallRateLimiter.DURATION_METRIC = NemesisMetrics.create_histogram(
+                    "sct_k8s_client_rate_limiter_duration_seconds",
+                    "Time spent waiting for the k8s API call rate limiter",
+                    ["verb"])
 
     def put_requests_on_pause(self):
         self._requests_pause_event.clear()
@@ -135,11 +185,34 @@ class ApiCallRateLimiter(threading.Thread):
         yield None
         self.release_requests_pause()
 
-    def wait(self):
+    def _refill(self) -> None:
+        now = time.monotonic_ns()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill_ns) * self.rate_limit / 1e9)
+        self._last_refill_ns = now
+
+    def _acquire_token(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    if self._tokens >= 1:
+                        self._condition.notify()
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(min(remaining, (1 - self._tokens) / self.rate_limit))
+
+    def wait(self, verb: str = "api"):
+        started_at = time.perf_counter()
         self._requests_pause_event.wait(15 * 60)
-        if not self._lock.acquire(timeout=self.queue_size / self.rate_limit):  # deepcode ignore E1123: deepcode error
+        if not self._acquire_token(timeout=self.queue_size / self.rate_limit):
             LOGGER.error("k8s API call rate limiter queue size limit has been reached")
             raise queue.Full
+        if self.DURATION_METRIC:
+            self.DURATION_METRIC.labels(verb).observe(time.perf_counter() - started_at)
 
     def _api_test(self, kluster):
         logging.getLogger('urllib3.connectionpool').disabled = True
@@ -188,12 +261,13 @@ class ApiCallRateLimiter(threading.Thread):
         self.join()
 
     def run(self) -> None:
-        LOGGER.info("k8s API call rate limiter started: rate_limit=%s, queue_size=%s",
-                    self.rate_limit, self.queue_size)
+        LOGGER.info("k8s API call rate limiter started: rate_limit=%s, queue_size=%s, burst=%s",
+                    self.rate_limit, self.queue_size, self.burst)
         self.running.set()
+        # NOTE: tokens get refilled by the callers, just wake up waiters periodically
         while self.running.is_set():
-            if self._lock.get_value() == 0:
-                self._lock.release()
+            with self._condition:
+                self._condition.notify()
             time.sleep(1 / self.rate_limit)
 
     def get_k8s_configuration(self, kluster) -> k8s.client.Configuration:
@@ -260,6 +334,7 @@ class KubernetesOps:
     @classmethod
     @timeout_decor(timeout=600)
     def list_statefulsets(cls, kluster, namespace=None, **kwargs):
+        kwargs = with_watch_cache_list_kwargs(kwargs)
         if namespace is None:
             return kluster.k8s_apps_v1_api.list_stateful_set_for_all_namespaces(watch=False, **kwargs).items
         return kluster.k8s_apps_v1_api.list_namespaced_stateful_set(namespace=namespace, watch=False, **kwargs).items
@@ -267,6 +342,7 @@ class KubernetesOps:
     @classmethod
     @timeout_decor(timeout=600)
     def list_pods(cls, kluster, namespace=None, **kwargs):
+        kwargs = with_watch_cache_list_kwargs(kwargs)
         if namespace is None:
             return kluster.k8s_core_v1_api.list_pod_for_all_namespaces(watch=False, **kwargs).items
         return kluster.k8s_core_v1_api.list_namespaced_pod(namespace=namespace, watch=False, **kwargs).items
@@ -279,6 +355,7 @@ class KubernetesOps:
     @classmethod
     @timeout_decor(timeout=600)
     def list_services(cls, kluster, namespace=None, **kwargs):
+        kwargs = with_watch_cache_list_kwargs(kwargs)
         if namespace is None:
             return kluster.k8s_core_v1_api.list_service_for_all_namespaces(watch=False, **kwargs).items
         return kluster.k8s_core_v1_api.list_namespaced_service(namespace=namespace, watch=False, **kwargs).items
@@ -301,12 +378,33 @@ class KubernetesOps:
     @classmethod
     def kubectl(cls, kluster, *command, namespace: Optional[str] = None, timeout: int = KUBECTL_TIMEOUT,
                 remoter: Optional['KubernetesCmdRunner'] = None,  # noqa: F821
-                ignore_status: bool = False, verbose: bool = True):
+                ignore_status: bool = False, verbose: bool = True, stdout_file: Optional[str] = None):
         cmd = cls.kubectl_cmd(kluster, *command, namespace=namespace, ignore_k8s_server_url=bool(remoter))
+        if stdout_file and remoter is None:
+            return cls._run_local_cmd_to_file(cmd, stdout_file, timeout=timeout, ignore_status=ignore_status)
         if remoter is None:
             remoter = LOCALRUNNER
+        elif stdout_file:
+            cmd = f"{cmd} > {shlex.quote(str(stdout_file))}"
         return remoter.run(cmd, timeout=timeout, ignore_status=ignore_status, verbose=verbose)
 
+    @staticmethod
+    def _run_local_cmd_to_file(cmd: str, stdout_file: str, timeout: int, ignore_status: bool):
+        # NOTE: write the output right to the file without a shell and without keeping it in memory
+        with open(stdout_file, "wb") as stdout:
+            try:
+                proc = subprocess.run(shlex.split(cmd), stdout=stdout, stderr=subprocess.PIPE,
+                                      timeout=timeout, check=False)
+            except subprocess.TimeoutExpired as exc:
+                stderr = (exc.stderr or b"").decode(errors="replace")
+                raise invoke.exceptions.CommandTimedOut(
+                    invoke.runners.Result(command=cmd, stderr=stderr, exited=-1), timeout=timeout) from None
+        result = invoke.runners.Result(
+            command=cmd, stderr=proc.stderr.decode(errors="replace"), exited=proc.returncode)
+        if proc.returncode and not ignore_status:
+            raise invoke.exceptions.UnexpectedExit(result)
+        return result
+
     @classmethod
     def kubectl_multi_cmd(cls, kluster, *command, namespace: Optional[str] = None, timeout: int = KUBECTL_TIMEOUT,
                           remoter: Optional['KubernetesCmdRunner'] = None, ignore_status: bool = False,  # noqa: F821
@@ -328,10 +426,6 @@ class KubernetesOps:
     def apply_file(cls, kluster, config_path, namespace=None,
                    timeout=KUBECTL_TIMEOUT, environ=None, envsubst=True,
                    modifiers: List[Callable] = None, server_side=False):
-        if environ:
-            environ_str = (' '.join([f'{name}="{value}"' for name, value in environ.items()])) + ' '
-        else:
-            environ_str = ''
         server_side_arg = "--server-side" if server_side else ""
 
         config_paths = []
@@ -350,19 +444,20 @@ class KubernetesOps:
             with NamedTemporaryFile(mode='tw') as temp_file:
                 resulted_content = []
                 if envsubst:
-                    data = LOCALRUNNER.run(
-                        f'{environ_str}envsubst<{current_config_path}', verbose=False).stdout
-                else:
                     with open(current_config_path, encoding="utf-8") as config_file_stream:
-                        data = config_file_stream.read()
-                file_content = yaml.safe_load_all(data)
+                        data = substitute_env_vars(config_file_stream.read(), environ)
+                    file_content = yaml.load_all(data, Loader=YAML_SAFE_LOADER)
+                else:
+                    file_content = load_yaml_file_docs(current_config_path)
+                    if modifiers:
+                        file_content = deepcopy(file_content)
 
                 for doc in file_content:
                     if modifiers:
                         for modifier in modifiers:
                             modifier(doc)
                     resulted_content.append(doc)
-                temp_file.write(yaml.safe_dump_all(resulted_content))
+                temp_file.write(yaml.dump_all(resulted_content, Dumper=YAML_SAFE_DUMPER))
                 temp_file.flush()
 
                 @retrying(n=0, sleep_time=5, timeout=timeout, allowed_exceptions=RuntimeError)
@@ -377,6 +472,35 @@ class KubernetesOps:
 
                 run_kubectl(temp_file.name)
 
+    @staticmethod
+    def server_side_apply_file(kluster, config_path: str, namespace: str = None, field_manager: str = "sct",
+                               modifiers: List[Callable] = None) -> None:
+        """Apply objects from a YAML file using server-side apply API calls instead of 'kubectl apply'.
+
+        Unlike 'apply_file' it doesn't run 'envsubst', so the file must not have env vars to be substituted.
+        """
+        docs = load_yaml_file_docs(config_path)
+        if modifiers:
+            docs = deepcopy(docs)
+        KubernetesOps.server_side_apply_docs(
+            kluster, docs, source=config_path, namespace=namespace, field_manager=field_manager, modifiers=modifiers)
+
+    @staticmethod
+    def server_side_apply_docs(kluster, docs: Iterable[dict], source: str, namespace: str = None,
+                               field_manager: str = "sct", modifiers: List[Callable] = None) -> None:
+        """Apply already loaded objects using server-side apply API calls, 'modifiers' change the objects in place."""
+        dynamic_client = kluster.dynamic_client
+        for doc in docs:
+            if not doc:
+                continue
+            for modifier in modifiers or []:
+                modifier(doc)
+            resource = dynamic_client.resources.get(api_version=doc["apiVersion"], kind=doc["kind"])
+            LOGGER.debug("Apply '%s/%s' from '%s'", doc["kind"], doc["metadata"]["name"], source,
+                         extra={'prefix': kluster.region_name})
+            dynamic_client.server_side_apply(
+                resource, body=doc, namespace=namespace, field_manager=field_manager, force_conflicts=True)
+
     @classmethod
     def copy_file(cls, kluster, src, dst, container=None, timeout=KUBECTL_TIMEOUT, sudo=False):
         command = ["cp", src, dst]
@@ -421,63 +545,57 @@ class KubernetesOps:
             raise ValueError(f'Unknown auth-type {auth_type}')
 
     @staticmethod
-    def wait_for_pods_with_condition(kluster, condition: str, total_pods: Union[int, Callable],
-                                     timeout: float, namespace: str,
-                                     selector: str = '',
-                                     sleep_between_retries: int = 10):
+    def watch_pods_till_ready(kluster, is_ready: Callable, total_pods: Union[int, Callable], timeout: float,
+                              namespace: str, selector: str = '') -> int:
+        """Wait for the pods in the namespace using single watch stream instead of 'kubectl wait' polling.
+
+        'timeout' is in minutes. All the matched pods must satisfy 'is_ready' and their number must match
+        'total_pods' the same way it was required from the 'kubectl wait --all' output.
+        """
         assert isinstance(total_pods, (int, float)) or callable(total_pods), (
             "total_pods should be number or callable")
-        waiter_message = (
-            f"{kluster.region_name}: Wait for the '{total_pods}' pod(s) "
-            f"from the '{namespace}' namespace with '{condition}' condition to be true...")
-
-        @timeout_decor(message=waiter_message, timeout=timeout * 60, sleep_time=sleep_between_retries)
-        def wait_for_condition(kluster, condition, total_pods, timeout, namespace, selector):
-            # To make it more informative in worst case scenario made it repeat 5 times, by readiness_timeout // 5
-            if selector:
-                selector = selector if selector.startswith("--selector=") else f'--selector={selector}'
-            result = kluster.kubectl(
-                f"wait {selector} --timeout={timeout // 5}m --all --for={condition} pod",
-                namespace=namespace,
-                timeout=timeout * 60 // 5 + 10)
-            count = result.stdout.count('condition met')
-            if isinstance(total_pods, (int, float)):
-                if total_pods != count:
-                    raise RuntimeError('Not all pods reported')
-            elif callable(total_pods):
-                if not total_pods(count):
-                    raise RuntimeError('Not all pods reported')
-            else:
-                raise ValueError(f"total_pods should be number or callable and not {type(total_pods)}")
-
-        wait_for_condition(kluster, condition, total_pods, timeout, namespace, selector)
+        LOGGER.debug("Wait for the '%s' pod(s) from the '%s' namespace to be ready...", total_pods, namespace,
+                     extra={'prefix': kluster.region_name})
+        list_kwargs = {"label_selector": selector.removeprefix("--selector=")} if selector else {}
+        return KubernetesOps.watch_till_objects_ready(
+            kluster.k8s_core_v1_api.list_namespaced_pod,
+            is_ready=is_ready,
+            timeout=timeout * 60,
+            total=total_pods,
+            require_all_ready=True,
+            namespace=namespace,
+            **list_kwargs)
 
     @staticmethod
     def wait_for_pods_readiness(kluster, total_pods: Union[int, Callable], readiness_timeout: float,
-                                namespace: str, selector: str = '',
-                                sleep_between_retries: int = 10):
-        KubernetesOps.wait_for_pods_with_condition(kluster, condition='condition=Ready',
-                                                   total_pods=total_pods,
-                                                   timeout=readiness_timeout,
-                                                   namespace=namespace,
-                                                   selector=selector,
-                                                   sleep_between_retries=sleep_between_retries)
+                                namespace: str, selector: str = ''):
+        KubernetesOps.watch_pods_till_ready(kluster,
+                                            is_ready=lambda pod: is_k8s_object_condition_true(pod, "Ready"),
+                                            total_pods=total_pods,
+                                            timeout=readiness_timeout,
+                                            namespace=namespace,
+                                            selector=selector)
 
     @staticmethod
     def wait_for_pods_running(kluster, total_pods: Union[int, Callable], timeout: float,
-                              namespace: str, selector: str = '',
-                              sleep_between_retries: int = 10):
-        KubernetesOps.wait_for_pods_with_condition(kluster, condition="jsonpath='{.status.phase}'=Running",
-                                                   total_pods=total_pods,
-                                                   timeout=timeout,
-                                                   namespace=namespace,
-                                                   selector=selector,
-                                                   sleep_between_retries=sleep_between_retries)
+                              namespace: str, selector: str = ''):
+        KubernetesOps.watch_pods_till_ready(kluster,
+                                            is_ready=lambda pod: pod.status.phase == "Running",
+                                            total_pods=total_pods,
+                                            timeout=timeout,
+                                            namespace=namespace,
+                                            selector=selector)
 
     @staticmethod
     def wait_for_pod_readiness(kluster, pod_name: str, namespace: str,
                                pod_readiness_timeout_minutes: int):
         timeout = pod_readiness_timeout_minutes or 5
+        if get_objects_reflector_thread := getattr(kluster, "get_objects_reflector_thread", None):
+            # NOTE: pods of a namespace share single watch stream instead of a 'kubectl wait' process per pod
+            LOGGER.debug("Wait for %s pod to be ready...", pod_name)
+            get_objects_reflector_thread("list_namespaced_pod", namespace=namespace).wait_for_object(
+                pod_name, is_ready=lambda pod: is_k8s_object_condition_true(pod, "Ready"), timeout=timeout * 60)
+            return
 
         def _wait_for_pod_readiness():
             result = kluster.kubectl(
@@ -493,6 +611,127 @@ class KubernetesOps:
                  timeout=timeout * 60,
                  throw_exc=True)
 
+    @staticmethod
+    def watch_till_objects_ready(list_func: Callable, is_ready: Callable, timeout: float,
+                                 total: Union[int, Callable, None] = None, settle_time: int = 10,
+                                 require_all_ready: bool = False, **list_kwargs) -> int:
+        """Watch objects returned by the 'list_func' till expected number of them satisfy 'is_ready'.
+
+        Objects get listed once and then single watch stream gets all the state changes from the API server,
+        so we don't spawn 'kubectl wait' processes and don't re-list objects on each check.
+
+        'total' may be a number, a callable which gets number of ready objects
+        or None which means 'all the matched objects, but at least one of them'.
+        In the latter case the result must not change during the 'settle_time' seconds
+        to catch objects which get provisioned gradually.
+        With 'require_all_ready' the 'total' is checked only when all the watched objects are ready.
+        Returns number of ready objects.
+        """
+        states, watcher = {}, k8s.watch.Watch()
+        deadline = time.monotonic() + timeout
+
+        def get_name(obj) -> str:
+            return get_k8s_object_field(get_k8s_object_field(obj, "metadata"), "name")
+
+        def list_objects() -> None:
+            # NOTE: start watching from the consistent list of objects, otherwise readiness may be
+            #       judged by the partially delivered set of the initial 'ADDED' events
+            result = list_func(**{key: value for key, value in list_kwargs.items() if key != "serialize"})
+            states.clear()
+            states.update({get_name(item): bool(is_ready(item)) for item in result.items or []})
+            metadata = get_k8s_object_field(result, "metadata")
+            watcher.resource_version = (get_k8s_object_field(metadata, "resource_version")
+                                        or get_k8s_object_field(metadata, "resourceVersion"))
+
+        def is_satisfied() -> bool:
+            ready = sum(states.values())
+            if total is None:
+                return bool(states) and ready == len(states)
+            if require_all_ready and ready != len(states):
+                return False
+            if callable(total):
+                return total(ready)
+            return ready == total
+
+        list_required = True
+        while (remaining := deadline - time.monotonic()) > 0:
+            changed = list_required
+            if list_required:
+                list_objects()
+                list_required = False
+                if total is not None and is_satisfied():
+                    return sum(states.values())
+            try:
+                for event in watcher.stream(list_func, timeout_seconds=max(int(min(settle_time, remaining)), 1),
+                                            resource_version=watcher.resource_version,
+                                            allow_watch_bookmarks=True, **list_kwargs):
+                    # NOTE: client doesn't track resource version of bookmarks and of untyped objects,
+                    #       so do it here to resume the watch from the right place
+                    raw_metadata = (event.get("raw_object") or {}).get("metadata") or {}
+                    if raw_metadata.get("resourceVersion"):
+                        watcher.resource_version = raw_metadata["resourceVersion"]
+                    if event["type"] == "BOOKMARK":
+                        continue
+                    name = get_name(event["object"])
+                    if event["type"] == "DELETED":
+                        changed |= states.pop(name, None) is not None
+                    elif event["type"] in ("ADDED", "MODIFIED"):
+                        state = bool(is_ready(event["object"]))
+                        changed |= states.get(name) != state
+                        states[name] = state
+                    if total is not None and is_satisfied():
+                        watcher.stop()
+                        return sum(states.values())
+            except k8s.client.exceptions.ApiException as exc:
+                if exc.status != 410:
+                    raise
+                # NOTE: stored resource version is too old, so start from the actual state
+                LOGGER.debug("Watch resource version has expired, listing objects again")
+                list_required = True
+                continue
+            except (ProtocolError, ReadTimeoutError) as exc:
+                LOGGER.debug("Watch stream has been interrupted: %s", exc)
+                continue
+            if total is None and not changed and is_satisfied():
+                return len(states)
+        raise TimeoutError(
+            f"Only {sum(states.values())} of {len(states)} watched object(s) got ready in {timeout} seconds")
+
+    @staticmethod
+    def wait_for_deployment_rollout(kluster, name: str, namespace: str, timeout: float = KUBECTL_TIMEOUT) -> None:
+        """In-process analog of the 'kubectl rollout status deployment <name>' command."""
+        LOGGER.debug("Wait for the '%s' deployment from the '%s' namespace to be rolled out...", name, namespace,
+                     extra={'prefix': kluster.region_name})
+        KubernetesOps.watch_till_objects_ready(
+            kluster.k8s_apps_v1_api.list_namespaced_deployment,
+            is_ready=is_k8s_deployment_rolled_out,
+            timeout=timeout,
+            total=1,
+            namespace=namespace,
+            field_selector=f"metadata.name={name}")
+
+    @staticmethod
+    def wait_for_statefulsets_rollout(kluster, names: Iterable[str], namespace: str,
+                                      timeout: float = KUBECTL_TIMEOUT,
+                                      previous_generations: Optional[dict] = None) -> None:
+        """In-process analog of the 'kubectl rollout status statefulset <name>' commands using single watch.
+
+        With 'previous_generations' a statefulset is considered rolled out only when its generation
+        has changed compared to the provided one, i.e. its pending spec change got applied.
+        """
+        names, previous_generations = set(names), previous_generations or {}
+        LOGGER.debug("Wait for the '%s' statefulsets from the '%s' namespace to be rolled out...",
+                     "', '".join(sorted(names)), namespace, extra={'prefix': kluster.region_name})
+        KubernetesOps.watch_till_objects_ready(
+            kluster.k8s_apps_v1_api.list_namespaced_stateful_set,
+            is_ready=lambda statefulset: (
+                statefulset.metadata.name in names
+                and (statefulset.metadata.generation or 0) > previous_generations.get(statefulset.metadata.name, -1)
+                and is_k8s_statefulset_rolled_out(statefulset)),
+            timeout=timeout,
+            total=len(names),
+            namespace=namespace)
+
     @staticmethod
     def patch_kube_config(kluster, static_token_path, kube_config_path: str = None) -> None:
         # It assumes that config is already created by gcloud
@@ -506,7 +745,7 @@ class KubernetesOps:
             extra={'prefix': kluster.region_name})
 
         with open(kube_config_path, encoding="utf-8") as kube_config:
-            data = yaml.safe_load(kube_config)
+            data = yaml.load(kube_config, Loader=YAML_SAFE_LOADER)
         auth_type, user_config = KubernetesOps.get_kubectl_auth_config(kluster, data)
 
         if user_config is None:
@@ -514,7 +753,7 @@ class KubernetesOps:
         KubernetesOps.patch_kubectl_auth_config(user_config, auth_type, "cat", [static_token_path])
 
         with open(kube_config_path, "w", encoding="utf-8") as kube_config:
-            yaml.safe_dump(data, kube_config)
+            yaml.dump(data, kube_config, Dumper=YAML_SAFE_DUMPER)
 
         LOGGER.debug('Patched kubectl config at %s with static kubectl token from %s',
                      kube_config_path, static_token_path, extra={'prefix': kluster.region_name})
@@ -574,31 +813,51 @@ class KubernetesOps:
         LOGGER.info("K8S-LOGS: starting logs gathering")
         logdir = Path(logdir_path)
         kubectl = kubectl or (lambda *args, **kwargs: KubernetesOps.kubectl(None, *args, **kwargs))
-        kubectl(f"version > {logdir / 'kubectl.version'} 2>&1", ignore_status=True)
+
+        def save_output(logfile: Path, command: str, with_stderr: bool = False, **kwargs) -> str:
+            # NOTE: write small outputs from here, so they can be reused without reading the files back
+            result = kubectl(command, ignore_status=True, verbose=False, **kwargs)
+            output = result.stdout + result.stderr if with_stderr else result.stdout
+            logfile.write_text(output, encoding="utf-8")
+            return output
+
+        def run_pod_command(command_and_kwargs: tuple[str, dict], namespace: str):
+            command, kwargs = command_and_kwargs
+            kwargs = dict(kwargs)
+            extract_to = kwargs.pop("extract_to", None)
+            result = kubectl(command, namespace=namespace, ignore_status=True, **kwargs)
+            if extract_to:
+                extract_scylla_container_files(kwargs["stdout_file"], extract_to)
+            return result
+
+        save_output(logdir / 'kubectl.version', "version", with_stderr=True)
 
         # Gather cluster-scoped resources info
         LOGGER.info("K8S-LOGS: gathering cluster scoped resources")
         cluster_scope_dir = "cluster-scoped-resources"
         os.makedirs(logdir / cluster_scope_dir, exist_ok=True)
+        # NOTE: discover cluster-wide and namespaced resource types using single call
+        api_resources = parse_kubectl_api_resources(kubectl("api-resources --verbs=list -o wide").stdout)
         if namespaces:
             # NOTE: gather only small set of the cluster-wide objects which are needed for specific namespaces
             cluster_wide_resource_types = ("namespaces", "nodes", "persistentvolumes")
         else:
-            cluster_wide_resource_types = kubectl(
-                "api-resources --namespaced=false --verbs=list -o name").stdout.split()
+            cluster_wide_resource_types = [
+                name for name, namespaced, _ in api_resources if not namespaced]
+        namespaces_yaml = ""
         for resource_type in cluster_wide_resource_types:
             for output_format in ("yaml", "wide"):
-                logfile = logdir / cluster_scope_dir / f"{resource_type}.{output_format}"
-                kubectl(f"get {resource_type} -o {output_format} > {logfile}", ignore_status=True)
-        kubectl(f"describe nodes > {logdir / cluster_scope_dir / 'nodes.desc'}",
-                timeout=600, ignore_status=True)
+                output = save_output(logdir / cluster_scope_dir / f"{resource_type}.{output_format}",
+                                     f"get {resource_type} -o {output_format}")
+                if resource_type == "namespaces" and output_format == "yaml":
+                    namespaces_yaml = output
+        save_output(logdir / cluster_scope_dir / 'nodes.desc', "describe nodes", timeout=600)
 
         if not namespaces:
-            # Read all the namespaces from already saved file
-            with open(logdir / cluster_scope_dir / "namespaces.wide",
-                      mode="r", encoding="utf-8") as namespaces_file:
-                # Reverse order of namespaces because preferred ones are there
-                namespaces = [n.split()[0] for n in namespaces_file.readlines()[1:]][::-1]
+            # NOTE: take names from the structured listing instead of the columns of the 'wide' one.
+            #       Reverse order of namespaces because preferred ones are there
+            namespaces_list = yaml.load(namespaces_yaml, Loader=YAML_SAFE_LOADER) or {}
+            namespaces = [item["metadata"]["name"] for item in namespaces_list.get("items") or []][::-1]
         elif isinstance(namespaces, str):
             namespaces = [namespaces]
 
@@ -607,62 +866,78 @@ class KubernetesOps:
                     ', '.join(namespaces))
         namespace_scope_dir = "namespace-scoped-resources"
         os.makedirs(logdir / namespace_scope_dir, exist_ok=True)
-        for resource_type in kubectl(
-                "api-resources --namespaced=true --verbs=get,list -o name").stdout.split():
+        for resource_type in [name for name, namespaced, verbs in api_resources if namespaced and "get" in verbs]:
             LOGGER.info("K8S-LOGS: gathering '%s' resources", resource_type)
-            logfile = logdir / namespace_scope_dir / f"{resource_type}.{output_format}"
-            resources_wide = kubectl(
-                f"get {resource_type} -A -o wide 2>&1 | tee {logfile}", ignore_status=True).stdout
+            resources_wide = save_output(logdir / namespace_scope_dir / f"{resource_type}.wide",
+                                         f"get {resource_type} -A -o wide", with_stderr=True)
             if resource_type.startswith("events"):
                 # NOTE: skip both kinds on 'events' available in k8s
                 continue
+            # NOTE: parse the listing once, first column is a namespace, first line is a header
+            present_namespaces = {
+                line.split(None, 1)[0] for line in resources_wide.splitlines()[1:] if line.strip()}
+            if present_namespaces.isdisjoint(namespaces):
+                # NOTE: move to the next resource type because such resources are absent in all the namespaces
+                continue
+            # NOTE: get all the objects of the resource type in all the namespaces using single call
+            #       instead of one call per namespace or per object
+            try:
+                items = json.loads(kubectl(
+                    f"get {resource_type} -A -o json", ignore_status=True, verbose=False).stdout)["items"]
+            except (ValueError, KeyError, TypeError) as exc:
+                LOGGER.warning("K8S-LOGS: failed to get '%s' resources: %s", resource_type, exc)
+                continue
+            namespaced_items = defaultdict(list)
+            for item in items:
+                namespaced_items[item["metadata"].get("namespace")].append(item)
             for namespace in namespaces:
-                if not re.search(f"\n{namespace} ", resources_wide):
-                    # NOTE: move to the next namespace because such resources are absent here
+                if not (items := namespaced_items.get(namespace)):
                     continue
                 LOGGER.info(
                     "K8S-LOGS: gathering '%s' resources in the '%s' namespace",
                     resource_type, namespace)
                 resource_dir = logdir / namespace_scope_dir / namespace / resource_type
                 os.makedirs(resource_dir, exist_ok=True)
-                for _res in resources_wide.split("\n"):
-                    if not re.match(f"{namespace} ", _res):
-                        continue
-                    res = _res.split()[1]
-                    logfile = resource_dir / f"{res}.yaml"
-                    res_stdout = kubectl(
-                        f"get {resource_type}/{res} -o yaml 2>&1 | tee {logfile}",
-                        namespace=namespace).stdout
-                    if resource_type != "pods":
-                        continue
-                    try:
-                        container_names = [
-                            c["name"] for c in yaml.safe_load(res_stdout)["spec"]["containers"]]
-                    except KeyError:
-                        # NOTE: pod could be in 'deleting' state during 'list' command
-                        # and be absent during 'get' command. So, just skip it.
-                        continue
-                    os.makedirs(resource_dir / res, exist_ok=True)
-                    for container_name in container_names:
-                        logfile = resource_dir / res / f"{container_name}"
-                        # NOTE: ignore status because it may fail when pod is not ready/running
-                        kubectl(f"logs pod/{res} -c={container_name} > {logfile}.log",
-                                namespace=namespace, ignore_status=True)
-                        kubectl(f"logs pod/{res} -c={container_name} --previous=true > "
-                                f"{logfile}-previous.log",
-                                namespace=namespace, ignore_status=True)
-
-                        # NOTE: pick up Scylla container-specific files
-                        if container_name != 'scylla':
-                            continue
-                        scylla_container_files_to_copy = (
-                            ('/var/lib/scylla/io_properties.yaml', logfile / 'io_properties.yaml'),
-                            ('/etc/scylla.d/', logfile / 'etc-scylla-d'),
-                            ('/etc/scylla/', logfile / 'etc-scylla'),
-                        )
-                        for src_path, dst_path in scylla_container_files_to_copy:
-                            kubectl(f"cp {res}:{src_path} {dst_path} -c {container_name}",
-                                    namespace=namespace, ignore_status=True)
+                for item in items:
+                    with open(resource_dir / f"{item['metadata']['name']}.yaml",
+                              mode="w", encoding="utf-8") as res_file:
+                        yaml.dump(item, res_file, Dumper=YAML_SAFE_DUMPER)
+                if resource_type == "pods":
+                    # NOTE: logs of the containers are independent and network bound, so gather them concurrently.
+                    #       API rate limiter of the cluster's 'kubectl' still applies to each command.
+                    commands = [cmd for pod in items for cmd in cls._get_pod_logs_commands(resource_dir, pod)]
+                    ParallelObject(
+                        objects=commands,
+                        timeout=1800,
+                        num_workers=min(len(commands), 32, (os.cpu_count() or 1) * 4),
+                        disable_logging=True,
+                    ).run(partial(run_pod_command, namespace=namespace), ignore_exceptions=True)
+
+    @staticmethod
+    def _get_pod_logs_commands(resource_dir: Path, pod: dict) -> List[tuple[str, dict]]:
+        """Get 'kubectl' commands with their extra kwargs for gathering logs and files of pod containers."""
+        res = pod["metadata"]["name"]
+        # NOTE: only strings get passed to 'kubectl' calls, so build the paths as strings
+        pod_logdir = os.path.join(resource_dir, res)
+        os.makedirs(pod_logdir, exist_ok=True)
+        commands = []
+        for container in pod.get("spec", {}).get("containers", []):
+            container_name = container["name"]
+            logfile = os.path.join(pod_logdir, container_name)
+            # NOTE: status gets ignored because it may fail when pod is not ready/running
+            commands.append((f"logs pod/{res} -c={container_name}", {"stdout_file": f"{logfile}.log"}))
+            commands.append((f"logs pod/{res} -c={container_name} --previous=true",
+                             {"stdout_file": f"{logfile}-previous.log"}))
+
+            # NOTE: pick up Scylla container-specific files
+            if container_name != 'scylla':
+                continue
+            # NOTE: get all the files using single tar stream instead of one 'kubectl cp' call per path
+            commands.append((
+                f"exec pod/{res} -c {container_name} -- tar -C / -cf - "
+                f"{' '.join(SCYLLA_CONTAINER_FILES_TO_GATHER)}",
+                {"stdout_file": f"{logfile}-files.tar", "extract_to": logfile}))
+        return commands
 
 
 class HelmException(Exception):
@@ -710,7 +985,7 @@ class HelmContainerMixin:
 
         if values:
             helm_values_file = NamedTemporaryFile(mode='tw')
-            helm_values_file.write(yaml.safe_dump(values.as_dict()))
+            helm_values_file.write(yaml.dump(values.as_dict(), Dumper=HelmValuesDumper))
             helm_values_file.flush()
             cmd.extend(("-f", helm_values_file.name))
             values_file = helm_values_file
@@ -774,6 +1049,7 @@ class TokenUpdateThread(threading.Thread, metaclass=abc.ABCMeta):
     def __init__(self, kubectl_token_path: str):
         self._kubectl_token_path = kubectl_token_path
         self._termination_event = threading.Event()
+        self._token_update_callbacks = []
         super().__init__(daemon=True, name=self.__class__.name)
 
     def run(self):
@@ -789,9 +1065,20 @@ class TokenUpdateThread(threading.Thread, metaclass=abc.ABCMeta):
                 wait_time = 5
             else:
                 wait_time = self.update_period
+                self._run_token_update_callbacks()
             finally:
                 self._clean_up_token_in_temporary_location()
 
+    def register_token_update_callback(self, callback: Callable[[], None]) -> None:
+        self._token_update_callbacks.append(callback)
+
+    def _run_token_update_callbacks(self):
+        for callback in self._token_update_callbacks:
+            try:
+                callback()
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.debug('Failed to run cloud token update callback %s: %s', callback, exc)
+
     @cached_property
     def _temporary_token_path(self):
         return self._kubectl_token_path + ".tmp"
@@ -944,7 +1231,12 @@ class ScyllaPodsIPChangeTrackerThread(threading.Thread):
         data = {}
         try:
             self.log.debug("Processing following line: %s", line)
-            data = yaml.safe_load(line) or {}
+            # NOTE: watch events are JSON documents, so parse them with much faster JSON parser first
+            try:
+                data = json.loads(line)
+            except ValueError:
+                data = yaml.load(line, Loader=YAML_SAFE_LOADER)
+            data = data or {}
             metadata = data.get('object', {}).get('metadata', {})
             namespace = metadata.get('namespace')
             if not namespace:
@@ -1081,6 +1373,194 @@ class ScyllaPodsIPChangeTrackerThread(threading.Thread):
                     "Unexpected type (%s) of the callback: %s. Skipping", type(callback), callback)
 
 
+class K8sObjectsReflectorThread(threading.Thread):
+    """It keeps local copy of the K8S objects of one kind updated using single 'list + watch' API calls sequence.
+
+    Objects get re-listed ('resynced') only when the watch stream cannot be resumed.
+    Each resync increments the 'generation' number which allows consumers to invalidate
+    their caches built on top of the objects data.
+    """
+
+    WATCH_TIMEOUT = 300
+    SYNC_TIMEOUT = 120
+
+    def __init__(self, k8s_kluster, list_method: str, namespace: str = None):
+        self._termination_event = threading.Event()
+        self._synced_event = threading.Event()
+        name = f"{self.__class__.__name__}-{list_method}" + (f"-{namespace}" if namespace else "")
+        super().__init__(daemon=True, name=name)
+        self.k8s_kluster = k8s_kluster
+        self.list_method = list_method
+        self.namespace = namespace
+        self.generation = 0
+        self._objects = {}
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        self.log = SDCMAdapter(LOGGER, extra={'prefix': k8s_kluster.region_name})
+
+    @property
+    def is_synced(self) -> bool:
+        return self._synced_event.is_set()
+
+    @property
+    def _k8s_core_v1_api(self):
+        # NOTE: take the cluster's API client on each list/watch call to pick up the rotated auth tokens
+        return KubernetesOps.core_v1_api(self.k8s_kluster.api_client)
+
+    def _wait_for_sync(self) -> None:
+        if not self._synced_event.wait(self.SYNC_TIMEOUT):
+            raise TimeoutError(f"K8S objects have not been listed yet using '{self.list_method}'")
+
+    def _list_objects(self, **kwargs) -> list:
+        return getattr(self._k8s_core_v1_api, self.list_method)(**self._list_kwargs(), **kwargs).items
+
+    def get_objects(self, labels: dict = None) -> list:
+        """Return objects which have all the provided labels set.
+
+        Objects get listed using API while the local copy is not synced to not return stale data.
+        """
+        labels = labels or {}
+        if not self.is_synced:
+            return self._list_objects(label_selector=",".join(f"{key}={value}" for key, value in labels.items()))
+        labels = labels.items()
+        with self._lock:
+            return [obj for obj in self._objects.values() if labels <= (obj.metadata.labels or {}).items()]
+
+    def get_object(self, name: str):
+        """Return object with the provided name or None if it doesn't exist."""
+        if not self.is_synced:
+            return next(iter(self._list_objects(field_selector=f"metadata.name={name}")), None)
+        with self._lock:
+            return self._objects.get(name)
+
+    def _wait_for(self, get_result: Callable[[], tuple], timeout: float, description: str):
+        """Call 'get_result' on each change of the objects till it returns (True, result), return the result."""
+        deadline = time.monotonic() + timeout
+        self._wait_for_sync()
+        with self._changed:
+            while not (result := get_result())[0]:
+                if (remaining := deadline - time.monotonic()) <= 0:
+                    raise TimeoutError(f"{description} in {timeout} seconds")
+                self._changed.wait(remaining)
+            return result[1]
+
+    def wait_for_object(self, name: str, is_ready: Callable, timeout: float):
+        """Wait till object with the provided name exists and satisfies 'is_ready', return the object."""
+        def get_object() -> tuple:
+            obj = self._objects.get(name)
+            return obj is not None and is_ready(obj), obj
+        return self._wait_for(get_object, timeout, description=f"'{name}' K8S object has not become ready")
+
+    def wait_for_object_deletion(self, name: str, timeout: float) -> None:
+        """Wait till object with the provided name doesn't exist."""
+        self._wait_for(lambda: (name not in self._objects, None), timeout,
+                       description=f"'{name}' K8S object has not been deleted")
+
+    def wait_for_objects(self, is_ready: Callable[[list], bool], timeout: float, labels: dict = None) -> list:
+        """Wait till objects which have all the provided labels satisfy 'is_ready' altogether, return them."""
+        def get_objects() -> tuple:
+            objects = self.get_objects(labels)
+            return is_ready(objects), objects
+        return self._wait_for(get_objects, timeout, description="K8S objects have not become ready")
+
+    def _list_kwargs(self) -> dict:
+        return {"namespace": self.namespace} if self.namespace else {}
+
+    def _resync(self) -> str:
+        # NOTE: resource_version='0' allows API server to respond from it's watch cache
+        object_list = getattr(self._k8s_core_v1_api, self.list_method)(
+            **self._list_kwargs(), **K8S_WATCH_CACHE_LIST_KWARGS)
+        with self._lock:
+            self._objects = {obj.metadata.name: obj for obj in object_list.items}
+            self.generation += 1
+            self._changed.notify_all()
+        self._synced_event.set()
+        return object_list.metadata.resource_version
+
+    def _watch(self, resource_version: str) -> str:
+        watcher = k8s.watch.Watch()
+        for event in watcher.stream(getattr(self._k8s_core_v1_api, self.list_method), **self._list_kwargs(),
+                                    resource_version=resource_version, timeout_seconds=self.WATCH_TIMEOUT):
+            obj = event["object"]
+            with self._lock:
+                if event["type"] == "DELETED":
+                    self._objects.pop(obj.metadata.name, None)
+                elif event["type"] in ("ADDED", "MODIFIED"):
+                    self._objects[obj.metadata.name] = obj
+                self._changed.notify_all()
+            if self._termination_event.is_set():
+                watcher.stop()
+        return watcher.resource_version
+
+    def run(self) -> None:
+        resource_version = None
+        while not self._termination_event.is_set():
+            try:
+                if not resource_version:
+                    resource_version = self._resync()
+                resource_version = self._watch(resource_version)
+            except k8s.client.exceptions.ApiException as exc:
+                if exc.status != 410:
+                    # NOTE: objects could be changed while the list/watch failed, so don't serve them till resync
+                    self._synced_event.clear()
+                    self.log.warning("Failed to list/watch K8S objects using '%s': %s", self.list_method, exc)
+                    self._termination_event.wait(5)
+                resource_version = None
+            except Exception as exc:  # noqa: BLE001
+                self._synced_event.clear()
+                self.log.debug("K8S objects watch stream of '%s' has been interrupted: %s", self.list_method, exc)
+                self._termination_event.wait(1)
+                resource_version = None
+        # NOTE: the local copy doesn't get updated anymore
+        self._synced_event.clear()
+
+    def stop(self, timeout=None) -> None:
+        self._termination_event.set()
+        self._synced_event.clear()
+        self.join(timeout)
+
+
+class K8sNodesReflectorThread(K8sObjectsReflectorThread):
+    """It keeps local copy of the K8S nodes updated."""
+
+    def __init__(self, k8s_kluster):
+        super().__init__(k8s_kluster, list_method="list_node")
+
+    def get_nodes(self, labels: dict = None) -> list:
+        """Return nodes which have all the provided labels set."""
+        return self.get_objects(labels)
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_file_docs(path: str, mtime_ns: int, size: int) -> tuple:
+    with open(path, encoding="utf-8") as file_obj:
+        return tuple(yaml.load_all(file_obj, Loader=YAML_SAFE_LOADER))
+
+
+def load_yaml_file_docs(path: str) -> tuple:
+    """Parse all the YAML documents of a file caching results while the file is not changed.
+
+    Returned objects are shared between callers, so copy them before modifying.
+    """
+    stat = os.stat(path)
+    return _load_yaml_file_docs(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_file(path: str, mtime_ns: int, size: int):
+    with open(path, encoding="utf-8") as file_obj:
+        return yaml.load(file_obj, Loader=YAML_SAFE_LOADER)
+
+
+def load_yaml_file(path: str):
+    """Parse YAML file caching results while the file is not changed.
+
+    Returned object is shared between callers, so copy it before modifying.
+    """
+    stat = os.stat(path)
+    return _load_yaml_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 def convert_cpu_units_to_k8s_value(cpu: Union[float, int]) -> str:
     if isinstance(cpu, float):
         if not cpu.is_integer():
@@ -1123,6 +1603,169 @@ def convert_cpu_value_from_k8s_to_units(cpu: str) -> float:
     return float(convertor(value))
 
 
+def with_watch_cache_list_kwargs(list_kwargs: dict) -> dict:
+    """Make list call served from the API server watch cache unless caller sets the resource version itself."""
+    if "resource_version" in list_kwargs:
+        return list_kwargs
+    return {**K8S_WATCH_CACHE_LIST_KWARGS, **list_kwargs}
+
+
+def get_k8s_object_field(obj, field: str):
+    """Get field of the typed API object or of the raw one got from the dynamic client."""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(field)
+    return getattr(obj, field, None)
+
+
+ENV_VAR_REFERENCE_RE = re.compile(r"\$(?:([A-Za-z_][A-Za-z0-9_]*)|\{([A-Za-z_][A-Za-z0-9_]*)\})")
+
+
+def substitute_env_vars(data: str, environ: dict = None) -> str:
+    """Substitute env vars the same way as the 'envsubst' utility does it, but without running it.
+
+    Both '$VAR' and '${VAR}' references get replaced, the undefined ones become empty strings.
+    'environ' values take precedence over the env vars of the current process.
+    """
+    variables = {**os.environ, **{name: str(value) for name, value in (environ or {}).items()}}
+    return ENV_VAR_REFERENCE_RE.sub(lambda match: variables.get(match.group(1) or match.group(2), ""), data)
+
+
+def parse_kubectl_api_resources(output: str) -> list[tuple[str, bool, set[str]]]:
+    """Parse 'kubectl api-resources -o wide' output into (name, namespaced, verbs) tuples.
+
+    Names have the same 'resource.group' format as the 'kubectl api-resources -o name' command returns.
+    """
+    lines = output.splitlines()
+    if not lines:
+        return []
+    # NOTE: columns are aligned with the header, and some of them (SHORTNAMES, CATEGORIES) may be empty
+    columns = [(match.group(), match.start()) for match in re.finditer(r"\S+", lines[0])]
+    api_resources = []
+    for line in lines[1:]:
+        if not line.strip():
+            continue
+        row = {name: line[start:columns[idx + 1][1] if idx + 1 < len(columns) else None].strip()
+               for idx, (name, start) in enumerate(columns)}
+        group = row.get("APIVERSION", "").rpartition("/")[0]
+        api_resources.append((
+            f"{row['NAME']}.{group}" if group else row["NAME"],
+            row.get("NAMESPACED", "").lower() == "true",
+            set(row.get("VERBS", "").strip("[]").split()),
+        ))
+    return api_resources
+
+
+def extract_scylla_container_files(tar_path: str, dst_dir: str) -> None:
+    """Extract the Scylla container files from a tar archive into the dir using the log dir names of them.
+
+    The archive gets removed afterwards.
+    """
+    if not os.path.exists(tar_path):
+        return
+    try:
+        with tarfile.open(tar_path, mode="r|") as tar:
+            for member in tar:
+                for src_path, dst_path in SCYLLA_CONTAINER_FILES_TO_GATHER.items():
+                    if member.name == src_path or member.name.startswith(f"{src_path}/"):
+                        member.name = dst_path + member.name[len(src_path):]
+                        tar.extract(member, path=dst_dir, filter="data")
+                        break
+    except (tarfile.TarError, OSError) as exc:
+        LOGGER.warning("K8S-LOGS: failed to extract Scylla container files from '%s': %s", tar_path, exc)
+    else:
+        os.remove(tar_path)
+
+
+def is_k8s_object_condition_true(obj, condition_type: str, expected_status: str = "True") -> bool:
+    # NOTE: compare case-insensitively the same way as 'kubectl wait' does it
+    conditions = get_k8s_object_field(get_k8s_object_field(obj, "status"), "conditions")
+    return any(str(get_k8s_object_field(condition, "type")).lower() == condition_type.lower()
+               and str(get_k8s_object_field(condition, "status")).lower() == expected_status.lower()
+               for condition in conditions or [])
+
+
+def is_k8s_deployment_rolled_out(deployment) -> bool:
+    """Check the deployment roll-out status the same way as 'kubectl rollout status' does it."""
+    status = deployment.status
+    if not status or (deployment.metadata.generation or 0) > (status.observed_generation or 0):
+        return False
+    for condition in status.conditions or []:
+        if condition.type == "Progressing" and condition.reason == "ProgressDeadlineExceeded":
+            raise RuntimeError(f"Deployment '{deployment.metadata.name}' exceeded its progress deadline")
+    updated_replicas = status.updated_replicas or 0
+    if deployment.spec.replicas is not None and updated_replicas < deployment.spec.replicas:
+        return False
+    if (status.replicas or 0) > updated_replicas:
+        return False
+    return (status.available_replicas or 0) >= updated_replicas
+
+
+def is_k8s_statefulset_rolled_out(statefulset) -> bool:
+    """Check the statefulset roll-out status the same way as 'kubectl rollout status' does it."""
+    update_strategy = statefulset.spec.update_strategy
+    if update_strategy and update_strategy.type != "RollingUpdate":
+        raise RuntimeError(
+            f"Roll-out status of the '{statefulset.metadata.name}' statefulset is available"
+            f" only for the 'RollingUpdate' strategy type, got '{update_strategy.type}'")
+    status = statefulset.status
+    if not status or not status.observed_generation or (
+            (statefulset.metadata.generation or 0) > status.observed_generation):
+        return False
+    replicas = statefulset.spec.replicas
+    if replicas is not None and (status.ready_replicas or 0) < replicas:
+        return False
+    partition = update_strategy and update_strategy.rolling_update and update_strategy.rolling_update.partition
+    if partition:
+        return replicas is None or (status.updated_replicas or 0) >= replicas - partition
+    return status.update_revision == status.current_revision
+
+
+def parse_kubectl_wait_args(*command: str) -> Optional[dict]:
+    """Parse 'kubectl wait' arguments into the parts needed to watch objects using API.
+
+    Example: '--all --for=condition=Ready pod' -> {'kind': 'pod', 'name': None, 'label_selector': None,
+                                                   'condition_type': 'Ready', 'condition_status': 'True'}
+
+    Returns None when arguments contain something what is not supported.
+    """
+    positional, label_selector, for_value = [], None, ""
+    args = iter(shlex.split(" ".join(command)))
+    for arg in args:
+        if arg == "--all":
+            continue
+        if arg in ("-l", "--selector"):
+            label_selector = next(args, None)
+        elif arg.startswith(("-l=", "--selector=")):
+            label_selector = arg.split("=", 1)[1]
+        elif arg == "--for":
+            for_value = next(args, "")
+        elif arg.startswith("--for="):
+            for_value = arg.split("=", 1)[1]
+        elif arg.startswith("-"):
+            return None
+        else:
+            positional.append(arg)
+    if not for_value.startswith("condition="):
+        return None
+    condition_type, _, condition_status = for_value.removeprefix("condition=").partition("=")
+
+    if len(positional) == 1:
+        kind, _, name = positional[0].partition("/")
+    elif len(positional) == 2 and "/" not in positional[0]:
+        kind, name = positional
+    else:
+        return None
+    return {
+        "kind": kind,
+        "name": name or None,
+        "label_selector": label_selector,
+        "condition_type": condition_type,
+        "condition_status": condition_status or "True",
+    }
+
+
 def add_pool_node_affinity(value, pool_label_name, pool_name):
     value['nodeAffinity'] = node_affinity = value.get('nodeAffinity', {})
     node_affinity['requiredDuringSchedulingIgnoredDuringExecution'] = required_during = (
@@ -1214,6 +1857,13 @@ def get_pool_affinity_modifiers(pool_label_name, pool_name):
     ]
 
 
+class HelmValuesDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+    """Don't create YAML anchors and aliases for the subtrees shared between several keys."""
+
+    def ignore_aliases(self, data):
+        return True
+
+
 class HelmValues:
     def __init__(self, *args, **kwargs):
         if len(args) == 1 and isinstance(args[0], dict):
@@ -1233,9 +1883,11 @@ class HelmValues:
         return {keys[0]: value}
 
     def _merge_dicts(self, destination_dict, patch_dict):
+        # NOTE: subtrees may be shared with other objects, so copy only the dicts which get changed
+        #       and reference new values as is instead of copying them.
         for key, value in patch_dict.items():
-            if isinstance(value, dict):
-                destination_dict[key] = self._merge_dicts(destination_dict.get(key, {}), value)
+            if isinstance(value, dict) and isinstance(destination_dict.get(key), dict):
+                destination_dict[key] = self._merge_dicts(dict(destination_dict[key]), value)
             else:
                 destination_dict[key] = value
         return destination_dict
@@ -1244,18 +1896,27 @@ class HelmValues:
         patch_d = self._path_to_dict(path, value)
         self._merge_dicts(self._data, patch_d)
 
+    def merge(self, patch_dict: dict):
+        """Deep-merge nested 'patch_dict' at once instead of calling 'set' for each of its paths."""
+        self._merge_dicts(self._data, patch_dict)
+
+    @staticmethod
+    def _path_key(key):
+        return int(key[1:-1]) if key[0] == '[' and key[-1] == ']' else key
+
     def delete(self, path):
         path = path.split('.')
-        last = path.pop()
-        parent = '.'.join(path)
-        if not parent:
-            parent = self._data
-        else:
-            parent = self.get(parent)
-        if parent is None:
-            return
-        if last[0] == '[' and last[-1] == ']':
-            last = int(last[1:-1])
+        last = self._path_key(path.pop())
+        # NOTE: copy containers on the path to not change subtrees shared with other objects
+        parent = self._data
+        for key in map(self._path_key, path):
+            try:
+                child = parent[key]
+            except (KeyError, IndexError, TypeError):
+                return
+            if not isinstance(child, (dict, list)):
+                return
+            parent[key] = parent = child.copy()
         try:
             del parent[last]
         except Exception:  # noqa: BLE001
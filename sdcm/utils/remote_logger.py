@@ -676,11 +676,12 @@ class KubernetesWrongSchedulingLogger(CommandClusterLoggerBase):
         if not self._cluster.allowed_labels_on_scylla_node:
             return ''
 
-        wrong_scheduled_pods_on_scylla_node, node_names = [], []
+        wrong_scheduled_pods_on_scylla_node, node_names = [], set()
+        allowed_labels = frozenset(self._cluster.allowed_labels_on_scylla_node)
         if self._cluster.SCYLLA_POOL_NAME in self._cluster.pools:
-            node_names = [
+            node_names = {
                 node.metadata.name
-                for node in self._cluster.pools[self._cluster.SCYLLA_POOL_NAME].nodes.items]
+                for node in self._cluster.pools[self._cluster.SCYLLA_POOL_NAME].nodes.items}
         else:
             self._log.warning(
                 "'%s' pool is not registered. Can not get node names to check pods scheduling",
@@ -690,10 +691,7 @@ class KubernetesWrongSchedulingLogger(CommandClusterLoggerBase):
             for pod in KubernetesOps.list_pods(self._cluster):
                 if pod.spec.node_name not in node_names:
                     continue
-                for key, value in self._cluster.allowed_labels_on_scylla_node:
-                    if (key, value) in pod.metadata.labels.items():
-                        break
-                else:
+                if allowed_labels.isdisjoint((pod.metadata.labels or {}).items()):
                     wrong_scheduled_pods_on_scylla_node.append(
                         f"{pod.metadata.name} ({pod.spec.node_name} node)")
         except Exception as details:  # noqa: BLE001
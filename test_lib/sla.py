@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, fields
 from typing import Optional
 
 from sdcm.utils.decorators import retrying
@@ -33,21 +33,13 @@ class ServiceLevelAttributes:
     shares: int = None
     timeout: str = None
     workload_type: str = None
-    query_string: str = field(init=False, repr=False)
 
-    def __setattr__(self, key, value):
-        super().__setattr__(key, value)
-        if key != "query_string":
-            self._generate_query_string()
-
-    def __post_init__(self):
-        self._generate_query_string()
-
-    def _generate_query_string(self):
+    @property
+    def query_string(self) -> str:
         attr_strings = []
 
         for item in fields(self):
-            value = getattr(self, item.name) if item.repr else None
+            value = getattr(self, item.name)
             if value is not None:
                 if item.type == "str":
                     attr_strings.append(f" AND {item.name} = '{value}'")
@@ -56,7 +48,7 @@ class ServiceLevelAttributes:
         if attr_strings:
             attr_strings[0] = attr_strings[0].replace(" AND", " WITH")
 
-        self.query_string = "".join(attr_strings)
+        return "".join(attr_strings)
 
 
 class ServiceLevel:
@@ -190,12 +182,7 @@ class ServiceLevel:
         query = 'LIST ALL SERVICE_LEVELS'
         if self.verbose:
             LOGGER.debug('List all service levels query: %s', query)
-        res_list = self.session.execute(query).all()
-        output = []
-
-        for res in res_list:
-            output.append(ServiceLevel.from_row(self.session, res))
-        return output
+        return [ServiceLevel.from_row(self.session, res) for res in self.session.execute(query)]
 
 
 class UserRoleBase:
@@ -342,14 +329,13 @@ class Role(UserRoleBase):
     def create(self, if_not_exists=True) -> Role:
         # Example: CREATE ROLE bob WITH PASSWORD = 'password_b'AND LOGIN = true AND SUPERUSER = true;
         # Example: CREATE ROLE carlos WITH OPTIONS = {'custom_option1': 'option1_value', 'custom_option2': 99};
-        role_options = {}
-        for opt in ['password', 'login', 'superuser', 'options_dict']:
-            if hasattr(self, opt):
-                value = getattr(self, opt)
-                if value:
-                    role_options[opt.replace('_dict', '')] = '\'{}\''.format(value) \
-                        if opt == 'password' else value
-        role_options_str = ' AND '.join(['{} = {}'.format(opt, val) for opt, val in role_options.items()])
+        role_options = {
+            'password': self.password and f"'{self.password}'",
+            'login': self.login,
+            'superuser': self.superuser,
+            'options': self.options_dict,
+        }
+        role_options_str = ' AND '.join(f'{opt} = {val}' for opt, val in role_options.items() if val)
         if role_options_str:
             role_options_str = ' WITH {}'.format(role_options_str)
 
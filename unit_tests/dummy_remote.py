@@ -15,12 +15,16 @@
 import os
 import shutil
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 from sdcm.remote import LocalCmdRunner
 from sdcm.cluster import BaseNode, BaseCluster, BaseScyllaCluster
 from sdcm.utils.common import get_data_dir_path
 
+LOGGER = logging.getLogger(__name__)
+LOCAL_LOGDIR = os.path.dirname(__file__)
+
 
 class DummyOutput:
     def __init__(self, stdout):
@@ -31,7 +35,7 @@ class DummyOutput:
 class DummyRemote:
     @staticmethod
     def run(*args, **kwargs):
-        logging.info(args, kwargs)
+        LOGGER.debug("Running command with args=%r kwargs=%r", args, kwargs)
         return DummyOutput(args[0])
 
     @staticmethod
@@ -44,25 +48,25 @@ class DummyRemote:
         return True
 
 
+@lru_cache(maxsize=1)
+def get_local_cmd_runner() -> LocalCmdRunner:
+    # NOTE: all local nodes share the same hostname and user, no need to build a runner for each of them
+    return LocalCmdRunner()
+
+
 class LocalNode(BaseNode):
+    ip_address = "127.0.0.1"
+    vm_region = "eu-north-1"
 
     def __init__(self, name, parent_cluster, ssh_login_info=None, base_logdir=None, node_prefix=None, dc_idx=0, node_index=1):
         super().__init__(name, parent_cluster)
         self.node_index = node_index
-        self.remoter = LocalCmdRunner()
-        self.logdir = os.path.dirname(__file__)
-
-    @property
-    def ip_address(self):
-        return "127.0.0.1"
+        self.remoter = get_local_cmd_runner()
+        self.logdir = LOCAL_LOGDIR
 
     def wait_for_cloud_init(self):
         pass
 
-    @property
-    def vm_region(self):
-        return "eu-north-1"
-
     @property
     def network_interfaces(self):
         pass
@@ -97,7 +101,7 @@ class LocalLoaderSetDummy(BaseCluster):
         self.params = params or {}
         self.added_password_suffix = False
         self.nodes = nodes if nodes is not None else [LocalNode("loader_node", parent_cluster=self)]
-        self.logdir = os.path.dirname(__file__)
+        self.logdir = LOCAL_LOGDIR
 
     def add_nodes(self, *args, **kwargs):
         raise NotImplementedError
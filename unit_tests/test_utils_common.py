@@ -14,6 +14,8 @@
 import os
 import hashlib
 import shutil
+import tempfile
+import threading
 import logging
 import unittest
 import unittest.mock
@@ -24,7 +26,7 @@ import pytest
 from sdcm import sct_config
 from sdcm.cluster import BaseNode, BaseCluster, BaseScyllaCluster
 from sdcm.utils.distro import Distro
-from sdcm.utils.common import convert_metric_to_ms, download_dir_from_cloud
+from sdcm.utils.common import convert_metric_to_ms, download_dir_from_cloud, get_cached_download_dir, ReadWriteLock
 from sdcm.utils.sstable import load_inventory
 from sdcm.utils.sstable.load_utils import SstableLoadUtils
 
@@ -40,6 +42,45 @@ class TestUtils(unittest.TestCase):
             actual = convert_metric_to_ms(metric)
             assert actual == converted, f"Expected {converted}, got {actual}"
 
+    def test_scylla_bench_metrics_conversion_not_plain_numbers(self):
+        metrics = {"1e5": 1.0, "2e3ms": 2.0, "1.5e3s": 1.5, " 30ms": " 30ms"}
+        for metric, converted in metrics.items():
+            actual = convert_metric_to_ms(metric)
+            assert actual == converted, f"Expected {converted}, got {actual}"
+
+    def test_read_write_lock(self):
+        lock, events = ReadWriteLock(), []
+
+        def write():
+            with lock.writer():
+                events.append("written")
+
+        with lock.reader(), lock.reader():
+            writer = threading.Thread(target=write)
+            writer.start()
+            writer.join(0.2)
+            assert not events, "Writer must wait for readers"
+        writer.join(5)
+        assert events == ["written"]
+
+    def test_read_write_lock_writer_is_reentrant(self):
+        lock = ReadWriteLock()
+        with lock.writer(), lock.writer(), lock.reader():
+            pass
+        with lock.reader():
+            pass
+
+    def test_get_cached_download_dir(self):
+        download_func = unittest.mock.Mock(side_effect=lambda dst_dir: Path(dst_dir, "chart.yaml").touch())
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                unittest.mock.patch("sdcm.utils.common.DOWNLOADS_CACHE_DIR", cache_dir):
+            first = get_cached_download_dir("scylla-operator-v1.0.0", download_func)
+            second = get_cached_download_dir("scylla-operator-v1.0.0", download_func)
+            assert first == second == os.path.join(cache_dir, "scylla-operator-v1.0.0")
+            assert os.listdir(cache_dir) == ["scylla-operator-v1.0.0"]
+            assert os.listdir(first) == ["chart.yaml"]
+        download_func.assert_called_once()
+
 
 class TestDownloadDir(unittest.TestCase):
     @staticmethod
@@ -1,10 +1,34 @@
+import json
+import os
+import queue
+import tarfile
+import threading
 from copy import deepcopy
+from functools import partial
+from pathlib import Path
 from unittest import mock
 
+import invoke
+import kubernetes
+import pytest
+
 from sdcm.utils.k8s import (
+    ApiCallRateLimiter,
     HelmValues,
+    K8sNodesReflectorThread,
+    K8sObjectsReflectorThread,
     KubernetesOps,
     ScyllaPodsIPChangeTrackerThread,
+    TokenUpdateThread,
+    extract_scylla_container_files,
+    is_k8s_deployment_rolled_out,
+    is_k8s_statefulset_rolled_out,
+    is_k8s_object_condition_true,
+    load_yaml_file,
+    load_yaml_file_docs,
+    parse_kubectl_api_resources,
+    parse_kubectl_wait_args,
+    substitute_env_vars,
 )
 
 
@@ -18,6 +42,293 @@ BASE_HELM_VALUES = {
 }
 
 
+def get_k8s_pod(name, ready):
+    return mock.Mock(**{
+        "metadata.name": name,
+        "metadata.labels": {},
+        "status.conditions": [mock.Mock(type="Ready", status="True" if ready else "False")],
+    })
+
+
+def test_parse_kubectl_wait_args():
+    assert parse_kubectl_wait_args("--all --for=condition=Ready pod") == {
+        "kind": "pod", "name": None, "label_selector": None,
+        "condition_type": "Ready", "condition_status": "True"}
+    assert parse_kubectl_wait_args("-l app=minio", "--for condition=Ready=False pods") == {
+        "kind": "pods", "name": None, "label_selector": "app=minio",
+        "condition_type": "Ready", "condition_status": "False"}
+    assert parse_kubectl_wait_args("--for condition=established crd/nodeconfigs.scylla.scylladb.com") == {
+        "kind": "crd", "name": "nodeconfigs.scylla.scylladb.com", "label_selector": None,
+        "condition_type": "established", "condition_status": "True"}
+    assert parse_kubectl_wait_args("--for=delete pod/foo") is None
+    assert parse_kubectl_wait_args("--all-namespaces --for=condition=Ready pod") is None
+
+
+def test_is_k8s_object_condition_true():
+    assert is_k8s_object_condition_true(get_k8s_pod("pod-1", ready=True), "ready")
+    assert not is_k8s_object_condition_true(get_k8s_pod("pod-1", ready=False), "Ready")
+    assert is_k8s_object_condition_true(get_k8s_pod("pod-1", ready=False), "Ready", "False")
+    assert not is_k8s_object_condition_true(mock.Mock(status=None), "Ready")
+
+
+def test_is_k8s_deployment_rolled_out():
+    def get_deployment(generation=2, observed_generation=2, replicas=2, updated=2, available=2, reason=None):
+        return mock.Mock(**{
+            "metadata.name": "scylla-operator",
+            "metadata.generation": generation,
+            "spec.replicas": replicas,
+            "status.observed_generation": observed_generation,
+            "status.replicas": replicas,
+            "status.updated_replicas": updated,
+            "status.available_replicas": available,
+            "status.conditions": [mock.Mock(type="Progressing", reason=reason or "NewReplicaSetAvailable")],
+        })
+
+    assert is_k8s_deployment_rolled_out(get_deployment())
+    assert not is_k8s_deployment_rolled_out(get_deployment(observed_generation=1))
+    assert not is_k8s_deployment_rolled_out(get_deployment(updated=1))
+    assert not is_k8s_deployment_rolled_out(get_deployment(available=1))
+    with pytest.raises(RuntimeError, match="progress deadline"):
+        is_k8s_deployment_rolled_out(get_deployment(reason="ProgressDeadlineExceeded"))
+
+
+def test_is_k8s_statefulset_rolled_out():
+    def get_statefulset(strategy="RollingUpdate", partition=None, generation=2, observed_generation=2,
+                        replicas=3, ready=3, updated=3, current_revision="rev-2", update_revision="rev-2"):
+        return mock.Mock(**{
+            "metadata.name": "sct-cluster-us-east1-b-us-east1",
+            "metadata.generation": generation,
+            "spec.replicas": replicas,
+            "spec.update_strategy.type": strategy,
+            "spec.update_strategy.rolling_update.partition": partition,
+            "status.observed_generation": observed_generation,
+            "status.ready_replicas": ready,
+            "status.updated_replicas": updated,
+            "status.current_revision": current_revision,
+            "status.update_revision": update_revision,
+        })
+
+    assert is_k8s_statefulset_rolled_out(get_statefulset())
+    assert not is_k8s_statefulset_rolled_out(get_statefulset(observed_generation=1))
+    assert not is_k8s_statefulset_rolled_out(get_statefulset(ready=2))
+    assert not is_k8s_statefulset_rolled_out(get_statefulset(current_revision="rev-1"))
+    assert is_k8s_statefulset_rolled_out(get_statefulset(partition=1, updated=2, current_revision="rev-1"))
+    assert not is_k8s_statefulset_rolled_out(get_statefulset(partition=1, updated=1, current_revision="rev-1"))
+    with pytest.raises(RuntimeError, match="RollingUpdate"):
+        is_k8s_statefulset_rolled_out(get_statefulset(strategy="OnDelete"))
+
+
+def get_list_func(*items, metadata=None):
+    return mock.Mock(return_value=mock.Mock(items=list(items), metadata=metadata or {"resourceVersion": "1"}))
+
+
+def test_watch_till_objects_ready():
+    list_func = get_list_func(get_k8s_pod("pod-1", ready=True), get_k8s_pod("pod-2", ready=False))
+    windows = [
+        [{"type": "MODIFIED", "object": get_k8s_pod("pod-2", ready=True)}],
+        [],
+    ]
+    with mock.patch("kubernetes.watch.Watch") as watch:
+        watch.return_value.resource_version = None
+        watch.return_value.stream.side_effect = windows
+        ready = KubernetesOps.watch_till_objects_ready(
+            list_func, is_ready=lambda pod: is_k8s_object_condition_true(pod, "Ready"), timeout=60)
+    assert ready == 2
+    assert watch.return_value.stream.call_count == 2
+    assert watch.return_value.stream.call_args.kwargs["resource_version"] == "1"
+
+
+def test_watch_till_objects_ready_total():
+    list_func = get_list_func(get_k8s_pod("node-1", ready=True))
+    with mock.patch("kubernetes.watch.Watch") as watch:
+        watch.return_value.resource_version = None
+        watch.return_value.stream.return_value = [
+            {"type": "ADDED", "object": get_k8s_pod("node-2", ready=True)},
+        ]
+        ready = KubernetesOps.watch_till_objects_ready(
+            list_func, is_ready=lambda node: is_k8s_object_condition_true(node, "Ready"), timeout=60, total=2)
+    assert ready == 2
+    watch.return_value.stop.assert_called_once()
+
+
+def test_wait_for_pods_readiness_requires_all_pods_ready():
+    kluster = mock.Mock(region_name="fake-region")
+    kluster.k8s_core_v1_api.list_namespaced_pod = get_list_func(
+        get_k8s_pod("pod-1", ready=True), get_k8s_pod("pod-2", ready=False))
+    with mock.patch("kubernetes.watch.Watch") as watch:
+        watch.return_value.resource_version = None
+        watch.return_value.stream.return_value = [
+            {"type": "DELETED", "object": get_k8s_pod("pod-2", ready=False)},
+        ]
+        KubernetesOps.wait_for_pods_readiness(
+            kluster, total_pods=lambda pods: pods > 0, readiness_timeout=1, namespace="minio",
+            selector="--selector=app=minio")
+    kluster.k8s_core_v1_api.list_namespaced_pod.assert_called_once_with(namespace="minio", label_selector="app=minio")
+    watch.return_value.stop.assert_called_once()
+
+
+def test_watch_till_objects_ready_raw_objects():
+    crd = {"metadata": {"name": "nodeconfigs.scylla.scylladb.com", "resourceVersion": "5"},
+           "status": {"conditions": [{"type": "Established", "status": "True"}]}}
+    list_func = get_list_func()
+    with mock.patch("kubernetes.watch.Watch") as watch:
+        watch.return_value.resource_version = None
+        watch.return_value.stream.return_value = [
+            {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "4"}},
+             "raw_object": {"metadata": {"resourceVersion": "4"}}},
+            {"type": "ADDED", "object": crd, "raw_object": crd},
+        ]
+        ready = KubernetesOps.watch_till_objects_ready(
+            list_func, is_ready=lambda obj: is_k8s_object_condition_true(obj, "established"),
+            timeout=60, total=1, serialize=False)
+    assert ready == 1
+    assert watch.return_value.resource_version == "5"
+    list_func.assert_called_once_with()
+
+
+def test_k8s_nodes_reflector_thread():
+    def get_k8s_node(name, pool):
+        return mock.Mock(**{"metadata.name": name, "metadata.labels": {"pool": pool}})
+
+    kluster = mock.Mock(region_name="fake-region")
+    with mock.patch.object(KubernetesOps, "core_v1_api") as core_v1_api, \
+            mock.patch("kubernetes.watch.Watch") as watch:
+        core_v1_api.return_value.list_node.return_value = mock.Mock(
+            items=[get_k8s_node("node-1", "scylla"), get_k8s_node("node-2", "loader")],
+            **{"metadata.resource_version": "1"})
+        reflector = K8sNodesReflectorThread(kluster)
+        reflector._termination_event.set()
+        watch.return_value.stream.return_value = [
+            {"type": "ADDED", "object": get_k8s_node("node-3", "scylla")},
+            {"type": "DELETED", "object": get_k8s_node("node-1", "scylla")},
+        ]
+        reflector._watch(reflector._resync())
+
+    assert reflector.generation == 1
+    assert [node.metadata.name for node in reflector.get_nodes({"pool": "scylla"})] == ["node-3"]
+    assert len(reflector.get_nodes()) == 2
+
+
+def test_k8s_namespaced_objects_reflector_thread():
+    kluster = mock.Mock(region_name="fake-region")
+    with mock.patch.object(KubernetesOps, "core_v1_api") as core_v1_api, \
+            mock.patch("kubernetes.watch.Watch") as watch:
+        list_func = core_v1_api.return_value.list_namespaced_pod
+        list_func.return_value = mock.Mock(
+            items=[get_k8s_pod("pod-1", ready=False)], **{"metadata.resource_version": "1"})
+        reflector = K8sObjectsReflectorThread(kluster, list_method="list_namespaced_pod", namespace="scylla")
+        reflector._termination_event.set()
+        watch.return_value.stream.return_value = [
+            {"type": "MODIFIED", "object": get_k8s_pod("pod-1", ready=True)},
+        ]
+        reflector._watch(reflector._resync())
+
+    list_func.assert_called_once_with(namespace="scylla", resource_version="0", resource_version_match="NotOlderThan")
+    assert watch.return_value.stream.call_args.kwargs["namespace"] == "scylla"
+    assert is_k8s_object_condition_true(reflector.get_object("pod-1"), "Ready")
+    assert reflector.get_object("pod-2") is None
+
+
+def test_k8s_objects_reflector_thread_waits_for_object_readiness():
+    kluster = mock.Mock(region_name="fake-region")
+    with mock.patch.object(KubernetesOps, "core_v1_api") as core_v1_api, \
+            mock.patch("kubernetes.watch.Watch") as watch:
+        core_v1_api.return_value.list_namespaced_pod.return_value = mock.Mock(
+            items=[get_k8s_pod("pod-1", ready=False)], **{"metadata.resource_version": "1"})
+        reflector = K8sObjectsReflectorThread(kluster, list_method="list_namespaced_pod", namespace="scylla")
+        reflector._termination_event.set()
+        watch.return_value.stream.return_value = [
+            {"type": "MODIFIED", "object": get_k8s_pod("pod-1", ready=True)},
+        ]
+        resource_version = reflector._resync()
+        is_ready = partial(is_k8s_object_condition_true, condition_type="Ready")
+
+        with pytest.raises(TimeoutError):
+            reflector.wait_for_object("pod-1", is_ready=is_ready, timeout=0.1)
+        threading.Timer(0.1, reflector._watch, args=(resource_version,)).start()
+        assert reflector.wait_for_object("pod-1", is_ready=is_ready, timeout=10).metadata.name == "pod-1"
+        assert reflector.wait_for_objects(lambda pods: all(map(is_ready, pods)), timeout=10) == [
+            reflector.get_object("pod-1")]
+        with pytest.raises(TimeoutError):
+            reflector.wait_for_objects(lambda pods: len(pods) > 1, timeout=0.1)
+
+        with pytest.raises(TimeoutError):
+            reflector.wait_for_object_deletion("pod-1", timeout=0.1)
+        watch.return_value.stream.return_value = [{"type": "DELETED", "object": get_k8s_pod("pod-1", ready=True)}]
+        threading.Timer(0.1, reflector._watch, args=(resource_version,)).start()
+        reflector.wait_for_object_deletion("pod-1", timeout=10)
+        assert reflector.get_object("pod-1") is None
+
+
+def test_k8s_objects_reflector_thread_uses_api_while_not_synced():
+    kluster = mock.Mock(region_name="fake-region")
+    with mock.patch.object(KubernetesOps, "core_v1_api") as core_v1_api:
+        list_func = core_v1_api.return_value.list_namespaced_pod
+        list_func.return_value = mock.Mock(
+            items=[get_k8s_pod("pod-1", ready=True)], **{"metadata.resource_version": "1"})
+        reflector = K8sObjectsReflectorThread(kluster, list_method="list_namespaced_pod", namespace="scylla")
+        assert reflector.get_object("pod-1").metadata.name == "pod-1"
+        list_func.assert_called_once_with(namespace="scylla", field_selector="metadata.name=pod-1")
+        reflector._resync()
+        assert reflector.is_synced
+
+        is_synced_after_failure = []
+
+        def list_pods(**_):
+            if not is_synced_after_failure:
+                is_synced_after_failure.append(None)
+                raise kubernetes.client.exceptions.ApiException(status=401)
+            is_synced_after_failure[0] = reflector.is_synced
+            reflector._termination_event.set()
+            raise kubernetes.client.exceptions.ApiException(status=410)
+
+        list_func.side_effect = list_pods
+        with mock.patch.object(reflector._termination_event, "wait"):
+            reflector.run()
+        assert is_synced_after_failure == [False]
+        assert not reflector.is_synced
+        core_v1_api.assert_called_with(kluster.api_client)
+
+
+def test_list_pods_uses_watch_cache_by_default():
+    kluster = mock.Mock()
+    KubernetesOps.list_pods(kluster, namespace="scylla", label_selector="app=minio")
+    kluster.k8s_core_v1_api.list_namespaced_pod.assert_called_once_with(
+        namespace="scylla", watch=False, label_selector="app=minio",
+        resource_version="0", resource_version_match="NotOlderThan")
+
+    KubernetesOps.list_pods(kluster, resource_version=None)
+    kluster.k8s_core_v1_api.list_pod_for_all_namespaces.assert_called_once_with(watch=False, resource_version=None)
+
+
+def test_api_call_rate_limiter_token_bucket():
+    limiter = ApiCallRateLimiter(rate_limit=1, queue_size=1, urllib_retry=0, urllib_backoff_factor=0, burst=3)
+    for _ in range(3):
+        limiter.wait()
+    limiter.rate_limit = 0.01  # make sure no token gets refilled during the queue timeout
+    limiter.queue_size = 0.001
+    with pytest.raises(queue.Full):
+        limiter.wait()
+
+
+def test_load_yaml_file_is_reloaded_on_change(tmp_path):
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("key: value\n")
+    assert load_yaml_file(yaml_file) == {"key": "value"}
+    assert load_yaml_file(yaml_file) is load_yaml_file(yaml_file)
+    yaml_file.write_text("key: new-value\n")
+    assert load_yaml_file(yaml_file) == {"key": "new-value"}
+
+
+def test_load_yaml_file_docs_is_reloaded_on_change(tmp_path):
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("key: value\n---\nkey: other-value\n")
+    assert load_yaml_file_docs(yaml_file) == ({"key": "value"}, {"key": "other-value"})
+    assert load_yaml_file_docs(yaml_file) is load_yaml_file_docs(yaml_file)
+    yaml_file.write_text("key: new-value\n")
+    assert load_yaml_file_docs(yaml_file) == ({"key": "new-value"}, )
+
+
 def test_helm_values_init_with_dict_arg():
     helm_values = HelmValues(BASE_HELM_VALUES)
     assert helm_values.as_dict() == BASE_HELM_VALUES
@@ -74,6 +385,16 @@ def test_helm_values_set_nested_override():
     assert data["nested_dict"]["first_nested_dict_key"] == "new_value"
 
 
+def test_helm_values_merge():
+    helm_values = HelmValues(deepcopy(BASE_HELM_VALUES))
+    helm_values.merge({"nested_dict": {"first_nested_dict_key": "new_value"}, "image": {"tag": "1.0"}})
+    data = helm_values.as_dict()
+    assert data["nested_dict"]["first_nested_dict_key"] == "new_value"
+    assert data["nested_dict"]["second_nested_dict_key"] == "second_nested_dict_value"
+    assert data["image"] == {"tag": "1.0"}
+    assert data["nested_list"] == [1, 2, 3]
+
+
 def test_helm_values_get_list():
     helm_values = HelmValues(BASE_HELM_VALUES)
     assert helm_values.get("nested_list") == [1, 2, 3]
@@ -100,6 +421,16 @@ def test_helm_delete_from_dict():
     assert helm_values == match
 
 
+def test_helm_values_set_and_delete_do_not_change_shared_subtrees():
+    shared = {"nodeAffinity": {"key": "value"}}
+    helm_values = HelmValues(affinity=shared, controllerAffinity=shared)
+    helm_values.set("affinity.nodeAffinity.key", "new_value")
+    helm_values.delete("controllerAffinity.nodeAffinity.key")
+    assert shared == {"nodeAffinity": {"key": "value"}}
+    assert helm_values.get("affinity.nodeAffinity.key") == "new_value"
+    assert helm_values.get("controllerAffinity.nodeAffinity") == {}
+
+
 def test_helm_values_try_set_by_list_index():
     helm_values = HelmValues(BASE_HELM_VALUES)
     try:
@@ -303,3 +634,123 @@ def test_scylla_pods_ip_change_tracker_02_negative():
     ip_tracker._process_line(no_ns_str)
 
     assert not ip_mapper, ip_mapper
+
+
+def test_gather_k8s_logs_gets_objects_of_resource_type_at_once(tmp_path):
+    pods = {"items": [
+        {"metadata": {"name": "pod-1", "namespace": "scylla"}, "spec": {"containers": [{"name": "scylla"}]}},
+        {"metadata": {"name": "pod-2", "namespace": "scylla"}, "spec": {"containers": [{"name": "agent"}]}},
+        {"metadata": {"name": "pod-3", "namespace": "other"}, "spec": {"containers": [{"name": "agent"}]}},
+    ]}
+    outputs = {
+        "api-resources": "NAME  SHORTNAMES  APIVERSION  NAMESPACED  KIND  VERBS\n"
+                         "pods  po          v1          true        Pod   [get list]\n",
+        "get pods -A -o wide": "NAMESPACE NAME READY\nscylla pod-1 1/1\nscylla pod-2 1/1\nother pod-3 1/1\n",
+        "get pods -A -o json": json.dumps(pods),
+    }
+
+    def kubectl(*command, **_):
+        cmd = " ".join(command)
+        return mock.Mock(stdout=next((out for prefix, out in outputs.items() if cmd.startswith(prefix)), ""), stderr="")
+
+    kubectl = mock.Mock(side_effect=kubectl)
+    (tmp_path / "cluster-scoped-resources").mkdir()
+    KubernetesOps.gather_k8s_logs(tmp_path, kubectl=kubectl, namespaces="scylla")
+
+    pods_dir = tmp_path / "namespace-scoped-resources" / "scylla" / "pods"
+    assert sorted(path.name for path in pods_dir.glob("*.yaml")) == ["pod-1.yaml", "pod-2.yaml"]
+    commands = [call.args[0] for call in kubectl.call_args_list]
+    assert commands.count("get pods -A -o json") == 1
+    assert not any(cmd.startswith("get pods/") for cmd in commands)
+    assert sum(cmd.startswith("logs pod/") for cmd in commands) == 4
+    assert not any(">" in cmd for cmd in commands)
+    assert sorted(Path(call.kwargs["stdout_file"]).name for call in kubectl.call_args_list
+                  if call.kwargs.get("stdout_file")) == ["agent-previous.log", "agent.log",
+                                                          "scylla-files.tar", "scylla-previous.log", "scylla.log"]
+    assert [cmd for cmd in commands if cmd.startswith(("exec ", "cp "))] == [
+        "exec pod/pod-1 -c scylla -- tar -C / -cf - var/lib/scylla/io_properties.yaml etc/scylla.d etc/scylla"]
+
+
+def test_extract_scylla_container_files(tmp_path):
+    src_dir = tmp_path / "src"
+    for path in ("var/lib/scylla/io_properties.yaml", "etc/scylla.d/cpuset.conf", "etc/scylla/scylla.yaml"):
+        (src_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (src_dir / path).write_text(path)
+    tar_path = tmp_path / "scylla-files.tar"
+    with tarfile.open(tar_path, mode="w") as tar:
+        for path in ("var/lib/scylla/io_properties.yaml", "etc/scylla.d", "etc/scylla"):
+            tar.add(src_dir / path, arcname=path)
+
+    extract_scylla_container_files(str(tar_path), str(tmp_path / "scylla"))
+
+    assert not tar_path.exists()
+    assert sorted(str(path.relative_to(tmp_path / "scylla")) for path in (tmp_path / "scylla").rglob("*")
+                  if path.is_file()) == ["etc-scylla-d/cpuset.conf", "etc-scylla/scylla.yaml", "io_properties.yaml"]
+
+
+def test_gather_k8s_logs_takes_namespaces_from_structured_listing(tmp_path):
+    outputs = {
+        "api-resources": "NAME        SHORTNAMES  APIVERSION  NAMESPACED  KIND       VERBS\n"
+                         "namespaces  ns          v1          false       Namespace  [get list]\n",
+        "get namespaces -o yaml": "items:\n- metadata:\n    name: default\n- metadata:\n    name: scylla\n",
+        "get namespaces -o wide": "NAME STATUS AGE\nbroken\n",
+    }
+
+    def kubectl(*command, **_):
+        cmd = " ".join(command)
+        return mock.Mock(stdout=next((out for prefix, out in outputs.items() if cmd.startswith(prefix)), ""), stderr="")
+
+    with mock.patch("sdcm.utils.k8s.LOGGER") as logger:
+        KubernetesOps.gather_k8s_logs(tmp_path, kubectl=kubectl)
+
+    assert mock.call("K8S-LOGS: gathering namespace scoped resources. list of namespaces: %s",
+                     "scylla, default") in logger.info.call_args_list
+
+
+def test_parse_kubectl_api_resources():
+    output = (
+        "NAME                 SHORTNAMES   APIVERSION                NAMESPACED   KIND             VERBS\n"
+        "nodes                no           v1                        false        Node             [get list watch]\n"
+        "deployments          deploy       apps/v1                   true         Deployment       [get list watch]\n"
+        "scyllaclusters                    scylla.scylladb.com/v1    true         ScyllaCluster    [list watch]\n"
+    )
+    assert parse_kubectl_api_resources(output) == [
+        ("nodes", False, {"get", "list", "watch"}),
+        ("deployments.apps", True, {"get", "list", "watch"}),
+        ("scyllaclusters.scylla.scylladb.com", True, {"list", "watch"}),
+    ]
+
+
+def test_substitute_env_vars():
+    data = "name: $K8S_NAME-${K8S_INDEX}\nimage: ${SCT_TEST_UNDEFINED_VAR}\nprice: $5\n"
+    with mock.patch.dict(os.environ, {"K8S_NAME": "from-env", "K8S_INDEX": "1"}):
+        assert substitute_env_vars(data, environ={"K8S_NAME": "loader", "N_LOADERS": 3}) == (
+            "name: loader-1\nimage: \nprice: $5\n")
+
+
+def test_kubectl_writes_stdout_to_file(tmp_path):
+    stdout_file = tmp_path / "out.log"
+    with mock.patch("sdcm.utils.k8s.KUBECTL_BIN", "echo"):
+        result = KubernetesOps.kubectl(None, "logs", "pod/'a b'", stdout_file=str(stdout_file))
+    assert result.exited == 0
+    assert stdout_file.read_text() == "logs pod/a b\n"
+
+    with mock.patch("sdcm.utils.k8s.KUBECTL_BIN", "false"), pytest.raises(invoke.exceptions.UnexpectedExit):
+        KubernetesOps.kubectl(None, "logs", stdout_file=str(stdout_file))
+
+
+def test_token_update_thread_runs_callbacks_after_token_update(tmp_path):
+    class FakeTokenUpdateThread(TokenUpdateThread):
+        def get_token(self) -> str:
+            return '{"token": "fake"}'
+
+    token_updated = threading.Event()
+    token_path = tmp_path / "token.json"
+    token_update_thread = FakeTokenUpdateThread(kubectl_token_path=str(token_path))
+    token_update_thread.register_token_update_callback(token_updated.set)
+    token_update_thread.start()
+    try:
+        assert token_updated.wait(timeout=10)
+        assert json.loads(token_path.read_text()) == {"token": "fake"}
+    finally:
+        token_update_thread.stop(timeout=10)